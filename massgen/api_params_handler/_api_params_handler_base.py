@@ -7,7 +7,7 @@ Provides common functionality for building API parameters across different backe
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 
 class APIParamsHandlerBase(ABC):
@@ -21,6 +21,9 @@ class APIParamsHandlerBase(ABC):
         """
         self.backend = backend_instance
         self.formatter = backend_instance.formatter
+        # (key, tools, formatted) from the last get_formatted_tools call; tools is
+        # kept referenced so its id cannot be reused while the entry is alive
+        self._formatted_tools_cache: Optional[Tuple[Tuple[Any, ...], Any, List[Dict[str, Any]]]] = None
 
     @abstractmethod
     async def build_api_params(
@@ -63,6 +66,8 @@ class APIParamsHandlerBase(ABC):
             "session_id",
             # MCP configuration (handled by base class for MCP backends)
             "mcp_servers",
+            "mcp_cacheable_tools",
+            "mcp_max_concurrency",
         }
 
     def build_base_api_params(
@@ -87,3 +92,26 @@ class APIParamsHandlerBase(ABC):
             if hasattr(self.backend, "get_mcp_tools_formatted"):
                 return self.backend.get_mcp_tools_formatted()
         return []
+
+    def get_formatted_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Get framework and MCP tools converted to the API format.
+
+        MCP recursions rebuild API params with the same tools list and MCP
+        functions, so the converted list is reused until either changes.
+        Callers receive a fresh list and may extend it freely.
+        """
+        mcp_functions = getattr(self.backend, "_mcp_functions", None) or {}
+        key = (id(tools), len(tools) if tools else 0, id(mcp_functions), tuple(mcp_functions))
+        cached = self._formatted_tools_cache
+        if cached is not None and cached[0] == key:
+            return list(cached[2])
+
+        formatted_tools: List[Dict[str, Any]] = []
+        if tools:
+            formatted_tools.extend(self.formatter.format_tools(tools))
+        mcp_tools = self.get_mcp_tools()
+        if mcp_tools:
+            formatted_tools.extend(mcp_tools)
+
+        self._formatted_tools_cache = (key, tools, formatted_tools)
+        return list(formatted_tools)
@@ -114,15 +114,8 @@ class ChatCompletionsAPIParamsHandler(APIParamsHandlerBase):
         if provider_tools:
             combined_tools.extend(provider_tools)
 
-        # User-defined tools
-        if tools:
-            converted_tools = self.formatter.format_tools(tools)
-            combined_tools.extend(converted_tools)
-
-        # MCP tools
-        mcp_tools = self.get_mcp_tools()
-        if mcp_tools:
-            combined_tools.extend(mcp_tools)
+        # User-defined tools, then MCP tools
+        combined_tools.extend(self.get_formatted_tools(tools))
 
         if combined_tools:
             api_params["tools"] = combined_tools
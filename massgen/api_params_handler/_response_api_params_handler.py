@@ -59,6 +59,10 @@ class ResponseAPIParamsHandler(APIParamsHandlerBase):
 
         return converted_tools
 
+    def get_mcp_tools(self) -> List[Dict[str, Any]]:
+        """Get MCP tools in OpenAI function format for Response API."""
+        return self._convert_mcp_tools_to_openai_format()
+
     async def build_api_params(
         self,
         messages: List[Dict[str, Any]],
@@ -93,15 +97,8 @@ class ResponseAPIParamsHandler(APIParamsHandlerBase):
         if provider_tools:
             combined_tools.extend(provider_tools)
 
-        # Add framework tools
-        if tools:
-            converted_tools = self.formatter.format_tools(tools)
-            combined_tools.extend(converted_tools)
-
-        # Add MCP tools (use OpenAI format)
-        mcp_tools = self._convert_mcp_tools_to_openai_format()
-        if mcp_tools:
-            combined_tools.extend(mcp_tools)
+        # Add framework tools, then MCP tools (use OpenAI format)
+        combined_tools.extend(self.get_formatted_tools(tools))
 
         if combined_tools:
             api_params["tools"] = combined_tools
@@ -94,7 +94,8 @@ class AzureOpenAIBackend(LLMBackend):
                 raise ValueError("Azure OpenAI requires a deployment name. Pass it as the 'model' parameter.")
 
             # Check if workflow tools are present
-            workflow_tools = [t for t in tools if t.get("function", {}).get("name") in ["new_answer", "vote"]] if tools else []
+            coordination_tools = self._COORDINATION_TOOLS
+            workflow_tools = [t for t in tools if t.get("function", {}).get("name") in coordination_tools] if tools else []
             has_workflow_tools = len(workflow_tools) > 0
 
             # Modify messages to include workflow tool instructions if needed
@@ -248,22 +249,18 @@ class AzureOpenAIBackend(LLMBackend):
         if workflow_tools:
             system_parts.append("\n--- Available Tools ---")
             for tool in workflow_tools:
-                name = tool.get("function", {}).get("name", "unknown")
-                description = tool.get("function", {}).get("description", "No description")
+                function_def = tool.get("function", {})
+                name = function_def.get("name", "unknown")
+                description = function_def.get("description", "No description")
                 system_parts.append(f"- {name}: {description}")
 
                 # Add usage examples for workflow tools
                 if name == "new_answer":
                     system_parts.append('    Usage: {"tool_name": "new_answer", ' '"arguments": {"content": "your answer"}}')
                 elif name == "vote":
-                    # Extract valid agent IDs from enum if available
-                    agent_id_enum = None
-                    for t in workflow_tools:
-                        if t.get("function", {}).get("name") == "vote":
-                            agent_id_param = t.get("function", {}).get("parameters", {}).get("properties", {}).get("agent_id", {})
-                            if "enum" in agent_id_param:
-                                agent_id_enum = agent_id_param["enum"]
-                            break
+                    # Extract valid agent IDs from the vote tool's enum if available
+                    agent_id_param = function_def.get("parameters", {}).get("properties", {}).get("agent_id", {})
+                    agent_id_enum = agent_id_param.get("enum")
 
                     if agent_id_enum:
                         agent_list = ", ".join(agent_id_enum)
@@ -8,7 +8,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, ClassVar, Dict, FrozenSet, List, Optional, Union
 
 from ..filesystem_manager import FilesystemManager, PathPermissionManagerHook
 from ..mcp_tools.hooks import FunctionHookManager, HookType
@@ -23,7 +23,7 @@ class FilesystemSupport(Enum):
     MCP = "mcp"  # Filesystem support through MCP servers
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """Standardized chunk format for streaming responses."""
 
@@ -51,6 +51,9 @@ class StreamChunk:
 class LLMBackend(ABC):
     """Abstract base class for LLM providers."""
 
+    # Names of the MassGen workflow tools agents use to coordinate
+    _COORDINATION_TOOLS: ClassVar[FrozenSet[str]] = frozenset({"vote", "new_answer"})
+
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         self.api_key = api_key
         self.config = kwargs
@@ -139,6 +142,8 @@ class LLMBackend(ABC):
             "session_id",
             # MCP configuration (handled by base class for MCP backends)
             "mcp_servers",
+            "mcp_cacheable_tools",
+            "mcp_max_concurrency",
         }
 
     @abstractmethod
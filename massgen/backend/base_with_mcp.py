@@ -8,15 +8,25 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
 import json
 import mimetypes
+import time
 from abc import abstractmethod
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+from typing import Any, AsyncGenerator, Dict, FrozenSet, List, Optional, Tuple
 
 from ..logger_config import log_backend_activity, logger
 from .base import LLMBackend, StreamChunk
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class UploadFileError(Exception):
     """Raised when an upload specified in configuration fails to process."""
@@ -88,10 +98,50 @@ FILE_SEARCH_SUPPORTED_EXTENSIONS = {
 
 FILE_SEARCH_MAX_FILE_SIZE = 512 * 1024 * 1024  # 512 MB
 
+# Fixed chunks shared by the MCP streaming loops. Consumers only read chunks and
+# never mutate them, so the same instances are yielded on every turn.
+DONE_CHUNK = StreamChunk(type="done")
+MCP_SESSION_COMPLETE_CHUNK = StreamChunk(
+    type="mcp_status",
+    status="mcp_session_complete",
+    content="✅ [MCP] Session completed",
+    source="mcp_session",
+)
+MCP_BLOCKED_CHUNK = StreamChunk(
+    type="mcp_status",
+    status="mcp_blocked",
+    content="⚠️ [MCP] All servers blocked by circuit breaker",
+    source="circuit_breaker",
+)
+
+
+# Argument strings longer than this are parsed directly instead of memoized
+MCP_ARGUMENTS_CACHE_MAX_CHARS = 4096
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_mcp_arguments(arguments_json: str) -> Tuple[bool, Any]:
+    """Parse tool-call arguments JSON, returning (True, value) or (False, error message).
+
+    Memoized because models often repeat identical tool calls; callers must
+    copy the returned value before mutating it.
+    """
+    try:
+        return True, orjson.loads(arguments_json) if ORJSON_AVAILABLE else json.loads(arguments_json)
+    except (json.JSONDecodeError, ValueError) as e:
+        return False, str(e)
+
 
 class MCPBackend(LLMBackend):
     """Base backend class with MCP (Model Context Protocol) support."""
 
+    # Bounds for memoized results of tools listed in mcp_cacheable_tools
+    MCP_RESULT_CACHE_MAX_SIZE = 256
+    MCP_RESULT_CACHE_TTL_SECONDS = 300.0
+
+    # Default cap on MCP calls from a single model turn that run at the same time
+    MCP_DEFAULT_MAX_CONCURRENCY = 8
+
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         """Initialize backend with MCP support."""
         super().__init__(api_key, **kwargs)
@@ -107,6 +157,9 @@ class MCPBackend(LLMBackend):
         self._mcp_tool_calls_count = 0
         self._mcp_tool_failures = 0
         self._mcp_function_names: set[str] = set()
+        # Union of _mcp_function_names and the _mcp_functions keys; rebuilt lazily,
+        # reset to None whenever either changes
+        self._mcp_tool_names: Optional[FrozenSet[str]] = None
 
         # Circuit breaker for MCP tools (stdio + streamable-http)
         self._mcp_tools_circuit_breaker = None
@@ -133,12 +186,29 @@ class MCPBackend(LLMBackend):
         # Function registry for mcp_tools-based servers (stdio + streamable-http)
         self._mcp_functions: Dict[str, Function] = {}
 
+        # stdio/streamable-http servers derived from mcp_servers, with the (id, len)
+        # signature of the mcp_servers value they were derived from
+        self._mcp_tools_servers: List[Dict[str, Any]] = []
+        self._mcp_tools_servers_signature: Optional[Tuple[int, int]] = None
+
+        # Last circuit breaker filtering result that kept every server, keyed by
+        # (breaker state_version, id(servers), len(servers))
+        self._mcp_filter_cache: Optional[Tuple[Tuple[int, int, int], List[Dict[str, Any]]]] = None
+
         # Thread safety for counters
         self._stats_lock = asyncio.Lock()
 
         # Limit for message history growth within MCP execution loop
         self._max_mcp_message_history = kwargs.pop("max_mcp_message_history", 200)
 
+        # Opt-in memoization for side-effect-free tools, keyed by (function name, canonical
+        # arguments JSON); entries hold (stored_at, result_str, result_obj) in LRU order
+        self._mcp_cacheable_tools = frozenset(self.config.get("mcp_cacheable_tools") or ())
+        self._mcp_result_cache: OrderedDict[Tuple[str, str], Tuple[float, str, Any]] = OrderedDict()
+
+        # Upper bound on concurrently executing MCP calls within one model turn
+        self._mcp_max_concurrency = self.config.get("mcp_max_concurrency") or self.MCP_DEFAULT_MAX_CONCURRENCY
+
         # Initialize backend name and agent ID for MCP operations
         self.backend_name = self.get_provider_name()
         self.agent_id = kwargs.get("agent_id", None)
@@ -157,26 +227,12 @@ class MCPBackend(LLMBackend):
             return
 
         try:
-            # Normalize and separate MCP servers by transport type using mcp_tools utilities
-            normalized_servers = (
-                MCPSetupManager.normalize_mcp_servers(
-                    self.mcp_servers,
-                    backend_name=self.backend_name,
-                    agent_id=self.agent_id,
-                )
-                if MCPSetupManager
-                else []
-            )
-
             if not MCPSetupManager:
                 logger.warning("MCPSetupManager not available")
                 return
 
-            mcp_tools_servers = MCPSetupManager.separate_stdio_streamable_servers(
-                normalized_servers,
-                backend_name=self.backend_name,
-                agent_id=self.agent_id,
-            )
+            # Normalize and separate MCP servers by transport type using mcp_tools utilities
+            mcp_tools_servers = self._get_mcp_tools_servers()
 
             if not mcp_tools_servers:
                 logger.info("No stdio/streamable-http servers configured")
@@ -184,12 +240,7 @@ class MCPBackend(LLMBackend):
 
             # Apply circuit breaker filtering before connection attempts
             if self._circuit_breakers_enabled and self._mcp_tools_circuit_breaker and MCPCircuitBreakerManager:
-                filtered_servers = MCPCircuitBreakerManager.apply_circuit_breaker_filtering(
-                    mcp_tools_servers,
-                    self._mcp_tools_circuit_breaker,
-                    backend_name=self.backend_name,
-                    agent_id=self.agent_id,
-                )
+                filtered_servers = self._filter_mcp_tools_servers(mcp_tools_servers)
                 if not filtered_servers:
                     logger.warning("All MCP servers blocked by circuit breaker during setup")
                     return
@@ -229,6 +280,7 @@ class MCPBackend(LLMBackend):
                     hook_manager=getattr(self, "function_hook_manager", None),
                 ),
             )
+            self._mcp_tool_names = None
             self._mcp_initialized = True
             logger.info(f"Successfully initialized MCP sessions with {len(self._mcp_functions)} tools converted to functions")
 
@@ -237,11 +289,9 @@ class MCPBackend(LLMBackend):
 
         except Exception as e:
             # Record failure for circuit breaker
-            self._record_mcp_circuit_breaker_failure(e, self.agent_id)
+            await self._record_mcp_circuit_breaker_failure(e, self.agent_id)
             logger.warning(f"Failed to setup MCP sessions: {e}")
-            self._mcp_client = None
-            self._mcp_initialized = False
-            self._mcp_functions = {}
+            self._reset_mcp_state()
 
     async def _execute_mcp_function_with_retry(
         self,
@@ -251,47 +301,28 @@ class MCPBackend(LLMBackend):
     ) -> Tuple[str, Any]:
         """Execute MCP function with exponential backoff retry logic."""
         # Convert JSON string to dict for shared utility
-        try:
-            args = json.loads(arguments_json) if isinstance(arguments_json, str) else arguments_json
-        except (json.JSONDecodeError, ValueError) as e:
-            error_str = f"Error: Invalid JSON arguments: {e}"
-            return error_str, {"error": error_str}
-
-        # Stats callback for tracking
-        async def stats_callback(action: str) -> int:
-            async with self._stats_lock:
-                if action == "increment_calls":
-                    self._mcp_tool_calls_count += 1
-                    return self._mcp_tool_calls_count
-                elif action == "increment_failures":
-                    self._mcp_tool_failures += 1
-                    return self._mcp_tool_failures
-            return 0
-
-        # Circuit breaker callback
-        async def circuit_breaker_callback(event: str, error_msg: str = "") -> None:
-            if not (self._circuit_breakers_enabled and MCPCircuitBreakerManager and self._mcp_tools_circuit_breaker):
-                return
-
-            # For individual function calls, we don't have server configurations readily available
-            # The circuit breaker manager should handle this gracefully with empty server list
-            if event == "failure":
-                await MCPCircuitBreakerManager.record_event(
-                    [],
-                    self._mcp_tools_circuit_breaker,
-                    "failure",
-                    error_msg,
-                    backend_name=self.backend_name,
-                    agent_id=self.agent_id,
-                )
+        if isinstance(arguments_json, str):
+            if len(arguments_json) <= MCP_ARGUMENTS_CACHE_MAX_CHARS:
+                parsed_ok, args = _parse_mcp_arguments(arguments_json)
             else:
-                await MCPCircuitBreakerManager.record_event(
-                    [],
-                    self._mcp_tools_circuit_breaker,
-                    "success",
-                    backend_name=self.backend_name,
-                    agent_id=self.agent_id,
-                )
+                parsed_ok, args = _parse_mcp_arguments.__wrapped__(arguments_json)
+            if not parsed_ok:
+                error_str = f"Error: Invalid JSON arguments: {args}"
+                return error_str, {"error": error_str}
+            # The parsed value may be shared with later identical calls
+            if isinstance(args, dict):
+                args = dict(args)
+        else:
+            args = arguments_json
+
+        # Tools the config marks as cacheable skip the round-trip for repeated arguments
+        cache_key = None
+        if function_name in self._mcp_cacheable_tools:
+            cache_key = (function_name, json.dumps(args, sort_keys=True, separators=(",", ":"), default=str))
+            cached = self._get_cached_mcp_result(cache_key)
+            if cached is not None:
+                logger.debug("Using cached result for MCP function {}", function_name)
+                return cached
 
         if not MCPExecutionManager:
             return "Error: MCPExecutionManager unavailable", {"error": "MCPExecutionManager unavailable"}
@@ -301,15 +332,103 @@ class MCPBackend(LLMBackend):
             args=args,
             functions=self._mcp_functions,
             max_retries=max_retries,
-            stats_callback=stats_callback,
-            circuit_breaker_callback=circuit_breaker_callback,
+            stats_callback=self._mcp_stats_callback,
+            circuit_breaker_callback=self._mcp_circuit_breaker_callback,
             logger_instance=logger,
         )
 
         # Convert result to string for compatibility and return tuple
-        if isinstance(result, dict) and "error" in result:
-            return f"Error: {result['error']}", result
-        return str(result), result
+        if isinstance(result, str):
+            result_str = result
+        elif isinstance(result, dict):
+            if "error" in result:
+                return f"Error: {result['error']}", result
+            # JSON rather than the dict repr so the text stays parseable downstream
+            result_str = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode() if ORJSON_AVAILABLE else json.dumps(result, default=str)
+        else:
+            result_str = str(result)
+        if cache_key is not None:
+            self._store_mcp_result(cache_key, result_str, result)
+        return result_str, result
+
+    async def _mcp_stats_callback(self, action: str) -> int:
+        """Update MCP call/failure counters for execute_function_with_retry."""
+        # Each branch is a single increment with no await, so it cannot interleave
+        # with other coroutines on the event loop and needs no lock
+        if action == "increment_calls":
+            self._mcp_tool_calls_count += 1
+            return self._mcp_tool_calls_count
+        elif action == "increment_failures":
+            self._mcp_tool_failures += 1
+            return self._mcp_tool_failures
+        return 0
+
+    async def _mcp_circuit_breaker_callback(self, event: str, error_msg: str = "") -> None:
+        """Forward per-call success/failure events to the MCP tools circuit breaker."""
+        if not (self._circuit_breakers_enabled and MCPCircuitBreakerManager and self._mcp_tools_circuit_breaker):
+            return
+
+        # For individual function calls, we don't have server configurations readily available
+        # The circuit breaker manager should handle this gracefully with empty server list
+        if event == "failure":
+            await MCPCircuitBreakerManager.record_event(
+                [],
+                self._mcp_tools_circuit_breaker,
+                "failure",
+                error_msg,
+                backend_name=self.backend_name,
+                agent_id=self.agent_id,
+            )
+        else:
+            await MCPCircuitBreakerManager.record_event(
+                [],
+                self._mcp_tools_circuit_breaker,
+                "success",
+                backend_name=self.backend_name,
+                agent_id=self.agent_id,
+            )
+
+    async def _execute_mcp_functions_concurrently(self, calls: List[Tuple[str, Any]]) -> List[Any]:
+        """Execute independent MCP calls concurrently, bounded by mcp_max_concurrency.
+
+        Args:
+            calls: (function_name, arguments) pairs from a single model turn
+
+        Returns:
+            One entry per call, in call order: the value returned by
+            ``_execute_mcp_function_with_retry`` or the exception it raised
+        """
+        semaphore = asyncio.Semaphore(self._mcp_max_concurrency)
+
+        async def run(function_name: str, arguments: Any) -> Any:
+            async with semaphore:
+                return await self._execute_mcp_function_with_retry(function_name, arguments)
+
+        results = await asyncio.gather(*(run(function_name, arguments) for function_name, arguments in calls), return_exceptions=True)
+        # Cancellation and interpreter exits still propagate; only ordinary errors are returned
+        for outcome in results:
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+        return results
+
+    def _get_cached_mcp_result(self, cache_key: Tuple[str, str]) -> Optional[Tuple[str, Any]]:
+        """Return a memoized (result_str, result_obj) pair if it is still fresh."""
+        entry = self._mcp_result_cache.get(cache_key)
+        if entry is None:
+            return None
+        stored_at, result_str, result_obj = entry
+        if time.monotonic() - stored_at > self.MCP_RESULT_CACHE_TTL_SECONDS:
+            del self._mcp_result_cache[cache_key]
+            return None
+        self._mcp_result_cache.move_to_end(cache_key)
+        return result_str, result_obj
+
+    def _store_mcp_result(self, cache_key: Tuple[str, str], result_str: str, result_obj: Any) -> None:
+        """Memoize a successful tool result, evicting the least recently used entry when full."""
+        self._mcp_result_cache[cache_key] = (time.monotonic(), result_str, result_obj)
+        self._mcp_result_cache.move_to_end(cache_key)
+        if len(self._mcp_result_cache) > self.MCP_RESULT_CACHE_MAX_SIZE:
+            self._mcp_result_cache.popitem(last=False)
 
     async def _process_upload_files(
         self,
@@ -333,7 +452,7 @@ class MCPBackend(LLMBackend):
         if not self.supports_upload_files():
             logger.debug(
                 "upload_files provided but backend %s does not support file uploads; ignoring",
-                self.get_provider_name(),
+                self.backend_name,
             )
             all_params.pop("upload_files", None)
             return messages
@@ -491,7 +610,7 @@ class MCPBackend(LLMBackend):
         agent_id = kwargs.get("agent_id", None)
 
         log_backend_activity(
-            self.get_provider_name(),
+            self.backend_name,
             "Starting stream_with_tools",
             {"num_messages": len(messages), "num_tools": len(tools) if tools else 0},
             agent_id=agent_id,
@@ -515,7 +634,10 @@ class MCPBackend(LLMBackend):
                         # MCP MODE: Recursive function call detection and execution
                         logger.info("Using recursive MCP execution mode")
 
-                        current_messages = self._trim_message_history(messages.copy())
+                        # Copy the caller's list once; the recursive MCP loop appends to it in place
+                        current_messages = self._trim_message_history(messages)
+                        if current_messages is messages:
+                            current_messages = messages.copy()
 
                         # Start recursive MCP streaming
                         async for chunk in self._stream_with_mcp_tools(current_messages, tools, client, **kwargs):
@@ -588,21 +710,11 @@ class MCPBackend(LLMBackend):
 
         # Remove any MCP tools from the tools list
         if "tools" in api_params:
-            non_mcp_tools = []
-            for tool in api_params.get("tools", []):
-                # Check different formats for MCP tools
-                if tool.get("type") == "function":
-                    name = tool.get("function", {}).get("name") if "function" in tool else tool.get("name")
-                    if name and name in self._mcp_function_names:
-                        continue
-                elif tool.get("type") == "mcp":
-                    continue
-                non_mcp_tools.append(tool)
-            api_params["tools"] = non_mcp_tools
-
-        if "openai" in self.get_provider_name().lower():
+            api_params["tools"] = self._strip_mcp_tools(api_params["tools"])
+
+        if "openai" in self.backend_name.lower():
             stream = await client.responses.create(**api_params)
-        elif "claude" in self.get_provider_name().lower():
+        elif "claude" in self.backend_name.lower():
             if "betas" in api_params:
                 stream = await client.beta.messages.create(**api_params)
             else:
@@ -657,8 +769,9 @@ class MCPBackend(LLMBackend):
         for tool in tools:
             if tool.get("type") == "function":
                 name = tool.get("function", {}).get("name") if "function" in tool else tool.get("name")
-                if name:
+                if name and name not in self._mcp_function_names:
                     self._mcp_function_names.add(name)
+                    self._mcp_tool_names = None
 
     async def _check_circuit_breaker_before_execution(self) -> bool:
         """Check circuit breaker status before executing MCP functions."""
@@ -666,13 +779,9 @@ class MCPBackend(LLMBackend):
             return True
 
         # Get current mcp_tools servers using utility functions
-        normalized_servers = MCPSetupManager.normalize_mcp_servers(self.mcp_servers)
-        mcp_tools_servers = MCPSetupManager.separate_stdio_streamable_servers(normalized_servers)
+        mcp_tools_servers = self._get_mcp_tools_servers()
 
-        filtered_servers = MCPCircuitBreakerManager.apply_circuit_breaker_filtering(
-            mcp_tools_servers,
-            self._mcp_tools_circuit_breaker,
-        )
+        filtered_servers = self._filter_mcp_tools_servers(mcp_tools_servers)
 
         if not filtered_servers:
             logger.warning("All MCP servers blocked by circuit breaker")
@@ -680,6 +789,30 @@ class MCPBackend(LLMBackend):
 
         return True
 
+    def _filter_mcp_tools_servers(self, servers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply circuit breaker filtering, reusing the last result while breaker state is unchanged.
+
+        Only results that kept every server are reused. Whether a blocked server is
+        skipped depends on elapsed backoff time, so those results are recomputed.
+        """
+        breaker = self._mcp_tools_circuit_breaker
+        cached = self._mcp_filter_cache
+        if cached is not None and cached[0] == (breaker.state_version, id(servers), len(servers)):
+            return cached[1]
+
+        filtered_servers = MCPCircuitBreakerManager.apply_circuit_breaker_filtering(
+            servers,
+            breaker,
+            backend_name=self.backend_name,
+            agent_id=self.agent_id,
+        )
+        # Read state_version after filtering: expired backoffs are reset during the call
+        if len(filtered_servers) == len(servers):
+            self._mcp_filter_cache = ((breaker.state_version, id(servers), len(servers)), filtered_servers)
+        else:
+            self._mcp_filter_cache = None
+        return filtered_servers
+
     async def _record_mcp_circuit_breaker_failure(
         self,
         error: Exception,
@@ -689,8 +822,7 @@ class MCPBackend(LLMBackend):
         if self._circuit_breakers_enabled and self._mcp_tools_circuit_breaker:
             try:
                 # Get current mcp_tools servers for circuit breaker failure recording
-                normalized_servers = MCPSetupManager.normalize_mcp_servers(self.mcp_servers)
-                mcp_tools_servers = MCPSetupManager.separate_stdio_streamable_servers(normalized_servers)
+                mcp_tools_servers = self._get_mcp_tools_servers()
 
                 await MCPCircuitBreakerManager.record_failure(
                     mcp_tools_servers,
@@ -706,7 +838,9 @@ class MCPBackend(LLMBackend):
         """Record MCP success for circuit breaker if enabled."""
         if self._circuit_breakers_enabled and self._mcp_tools_circuit_breaker and self._mcp_client and MCPCircuitBreakerManager:
             try:
-                connected_server_names = self._mcp_client.get_server_names() if hasattr(self._mcp_client, "get_server_names") else []
+                # Set of connected names so filtering servers_to_use is a hash lookup per server
+                get_server_names = getattr(self._mcp_client, "get_server_names", None)
+                connected_server_names = set(get_server_names()) if get_server_names else set()
                 if connected_server_names:
                     connected_server_configs = [server for server in servers_to_use if server.get("name") in connected_server_names]
                     if connected_server_configs:
@@ -733,10 +867,17 @@ class MCPBackend(LLMBackend):
                 backend_name=self.backend_name,
                 agent_id=self.agent_id,
             )
-            self._mcp_client = None
-            self._mcp_initialized = False
-            self._mcp_functions.clear()
-            self._mcp_function_names.clear()
+            self._reset_mcp_state()
+            _parse_mcp_arguments.cache_clear()
+
+    def _reset_mcp_state(self) -> None:
+        """Drop the MCP client and the registries and caches derived from it."""
+        self._mcp_client = None
+        self._mcp_initialized = False
+        self._mcp_functions.clear()
+        self._mcp_function_names.clear()
+        self._mcp_tool_names = None
+        self._mcp_result_cache.clear()
 
     async def __aenter__(self) -> "MCPBackend":
         """Async context manager entry."""
@@ -771,9 +912,30 @@ class MCPBackend(LLMBackend):
         if not (self.mcp_servers and MCPSetupManager):
             return 0
 
-        normalized_servers = MCPSetupManager.normalize_mcp_servers(self.mcp_servers)
-        mcp_tools_servers = MCPSetupManager.separate_stdio_streamable_servers(normalized_servers)
-        return len(mcp_tools_servers)
+        return len(self._get_mcp_tools_servers())
+
+    def _get_mcp_tools_servers(self) -> List[Dict[str, Any]]:
+        """Get the normalized stdio/streamable-http servers from mcp_servers.
+
+        Setup, circuit breaker checks and status chunks all need this list, and
+        the check runs before every batch of tool calls. The result is reused
+        until mcp_servers is replaced or changes length.
+        """
+        servers = self.mcp_servers
+        signature = (id(servers), len(servers) if servers else 0)
+        if signature != self._mcp_tools_servers_signature:
+            normalized_servers = MCPSetupManager.normalize_mcp_servers(
+                servers,
+                backend_name=self.backend_name,
+                agent_id=self.agent_id,
+            )
+            self._mcp_tools_servers = MCPSetupManager.separate_stdio_streamable_servers(
+                normalized_servers,
+                backend_name=self.backend_name,
+                agent_id=self.agent_id,
+            )
+            self._mcp_tools_servers_signature = signature
+        return self._mcp_tools_servers
 
     def yield_mcp_status_chunks(self, use_mcp: bool) -> AsyncGenerator[StreamChunk, None]:
         """Yield MCP status chunks for connection and availability."""
@@ -813,6 +975,48 @@ class MCPBackend(LLMBackend):
         """Check if a tool call is an MCP function."""
         return tool_name in self._mcp_functions
 
+    def _partition_mcp_calls(self, calls: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split captured function calls into (MCP calls, non-MCP calls) in a single pass."""
+        mcp_calls: List[Dict[str, Any]] = []
+        non_mcp_calls: List[Dict[str, Any]] = []
+        for call in calls:
+            (mcp_calls if call["name"] in self._mcp_functions else non_mcp_calls).append(call)
+        return mcp_calls, non_mcp_calls
+
+    def _strip_mcp_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return ``tools`` without MCP entries, checking tracked names and the function registry in one pass."""
+        mcp_names = self._mcp_tool_names
+        if mcp_names is None:
+            mcp_names = self._mcp_tool_names = frozenset(self._mcp_function_names.union(self._mcp_functions))
+        if not mcp_names:
+            # No MCP functions registered, so only hosted MCP tool entries can be present
+            return [tool for tool in tools if tool.get("type") != "mcp"]
+
+        non_mcp_tools = []
+        for tool in tools:
+            tool_type = tool.get("type")
+            if tool_type == "mcp":
+                continue
+            if tool_type == "function" and "function" in tool:
+                name = tool["function"].get("name")
+            else:
+                name = tool.get("name")
+            if name and name in mcp_names:
+                continue
+            non_mcp_tools.append(tool)
+        return non_mcp_tools
+
+    @staticmethod
+    def _mcp_result_text(result_obj: Any, default: str) -> str:
+        """Return the text of the first content part of an MCP result, or ``default`` if it has none."""
+        content = getattr(result_obj, "content", None)
+        if not content or not isinstance(content, (list, tuple)):
+            return default
+        text = getattr(content[0], "text", None)
+        if not text:
+            return default
+        return text if isinstance(text, str) else str(text)
+
     def get_mcp_tools_formatted(self) -> List[Dict[str, Any]]:
         """Get MCP tools formatted for specific API format."""
         if not self._mcp_functions:
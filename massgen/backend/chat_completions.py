@@ -30,7 +30,12 @@ from ..logger_config import log_backend_agent_message, log_stream_chunk, logger
 
 # Local imports
 from .base import FilesystemSupport, StreamChunk
-from .base_with_mcp import MCPBackend
+from .base_with_mcp import (
+    DONE_CHUNK,
+    MCP_BLOCKED_CHUNK,
+    MCP_SESSION_COMPLETE_CHUNK,
+    MCPBackend,
+)
 
 
 class ChatCompletionsBackend(MCPBackend):
@@ -94,22 +99,24 @@ class ChatCompletionsBackend(MCPBackend):
 
         async for chunk in stream:
             try:
-                if hasattr(chunk, "choices") and chunk.choices:
-                    choice = chunk.choices[0]
+                # Each attribute is read once per chunk
+                choices = getattr(chunk, "choices", None)
+                if choices:
+                    choice = choices[0]
 
                     # Handle content delta
-                    if hasattr(choice, "delta") and choice.delta:
-                        delta = choice.delta
-
+                    delta = getattr(choice, "delta", None)
+                    if delta:
                         # Plain text content
-                        if getattr(delta, "content", None):
-                            content_chunk = delta.content
+                        content_chunk = getattr(delta, "content", None)
+                        if content_chunk:
                             content += content_chunk
                             yield StreamChunk(type="content", content=content_chunk)
 
                         # Tool calls streaming (OpenAI-style)
-                        if getattr(delta, "tool_calls", None):
-                            for tool_call_delta in delta.tool_calls:
+                        tool_call_deltas = getattr(delta, "tool_calls", None)
+                        if tool_call_deltas:
+                            for tool_call_delta in tool_call_deltas:
                                 index = getattr(tool_call_delta, "index", 0)
 
                                 if index not in current_tool_calls:
@@ -135,8 +142,9 @@ class ChatCompletionsBackend(MCPBackend):
                                         current_tool_calls[index]["function"]["arguments"] += tool_call_delta.function.arguments
 
                     # Handle finish reason
-                    if getattr(choice, "finish_reason", None):
-                        if choice.finish_reason == "tool_calls" and current_tool_calls:
+                    finish_reason = getattr(choice, "finish_reason", None)
+                    if finish_reason:
+                        if finish_reason == "tool_calls" and current_tool_calls:
                             final_tool_calls = []
 
                             for index in sorted(current_tool_calls.keys()):
@@ -176,10 +184,10 @@ class ChatCompletionsBackend(MCPBackend):
                             response_completed = True
                             break  # Exit chunk loop to execute functions
 
-                        elif choice.finish_reason in ["stop", "length"]:
+                        elif finish_reason in ["stop", "length"]:
                             response_completed = True
                             # No function calls, we're done (base case)
-                            yield StreamChunk(type="done")
+                            yield DONE_CHUNK
                             return
 
             except Exception as chunk_error:
@@ -188,26 +196,22 @@ class ChatCompletionsBackend(MCPBackend):
 
         # Execute any captured function calls
         if captured_function_calls and response_completed:
-            # Check if any of the function calls are NOT MCP functions
-            non_mcp_functions = [call for call in captured_function_calls if call["name"] not in self._mcp_functions]
+            # Split MCP from non-MCP function calls once; both halves are reused below
+            mcp_calls, non_mcp_functions = self._partition_mcp_calls(captured_function_calls)
 
             if non_mcp_functions:
-                logger.info(f"Non-MCP function calls detected (will be ignored in MCP execution): {[call['name'] for call in non_mcp_functions]}")
+                logger.opt(lazy=True).info("Non-MCP function calls detected (will be ignored in MCP execution): {}", lambda: [call["name"] for call in non_mcp_functions])
 
             # Check circuit breaker status before executing MCP functions
             if not await self._check_circuit_breaker_before_execution():
-                yield StreamChunk(
-                    type="mcp_status",
-                    status="mcp_blocked",
-                    content="⚠️ [MCP] All servers blocked by circuit breaker",
-                    source="circuit_breaker",
-                )
-                yield StreamChunk(type="done")
+                yield MCP_BLOCKED_CHUNK
+                yield DONE_CHUNK
                 return
 
             # Execute only MCP function calls
             mcp_functions_executed = False
-            updated_messages = current_messages.copy()
+            # The MCP loop owns current_messages (copied once in stream_with_tools), so extend it in place
+            updated_messages = current_messages
 
             # Create single assistant message with all tool calls
             if captured_function_calls:
@@ -234,38 +238,43 @@ class ChatCompletionsBackend(MCPBackend):
                     }
                     updated_messages.append(assistant_message)
 
-            # Execute functions and collect results
+            # Announce every MCP call, then execute them concurrently
+            tools_info = f" ({len(self._mcp_functions)} tools available)" if self._mcp_functions else ""
+            for position, call in enumerate(mcp_calls):
+                function_name = call["name"]
+                yield StreamChunk(
+                    type="mcp_status",
+                    status="mcp_tool_called",
+                    content=f"🔧 [MCP Tool] Calling {function_name}...",
+                    source=f"mcp_{function_name}",
+                )
+
+                # Yield detailed MCP status as StreamChunk (similar to gemini.py)
+                yield StreamChunk(
+                    type="mcp_status",
+                    status="mcp_tools_initiated",
+                    content=f"MCP tool call initiated (call #{self._mcp_tool_calls_count + position}){tools_info}: {function_name}",
+                    source=f"mcp_{function_name}",
+                )
+
+            # Execute MCP functions with retry and exponential backoff; outcomes come back in call order
+            mcp_outcomes = iter(await self._execute_mcp_functions_concurrently([(call["name"], call["arguments"]) for call in mcp_calls]))
+
+            # Collect results
             tool_results = []
             for call in captured_function_calls:
                 function_name = call["name"]
                 if self.is_mcp_tool_call(function_name):
-                    yield StreamChunk(
-                        type="mcp_status",
-                        status="mcp_tool_called",
-                        content=f"🔧 [MCP Tool] Calling {function_name}...",
-                        source=f"mcp_{function_name}",
-                    )
-
-                    # Yield detailed MCP status as StreamChunk (similar to gemini.py)
-                    tools_info = f" ({len(self._mcp_functions)} tools available)" if self._mcp_functions else ""
-                    yield StreamChunk(
-                        type="mcp_status",
-                        status="mcp_tools_initiated",
-                        content=f"MCP tool call initiated (call #{self._mcp_tool_calls_count}){tools_info}: {function_name}",
-                        source=f"mcp_{function_name}",
-                    )
-
+                    outcome = next(mcp_outcomes)
                     try:
-                        # Execute MCP function with retry and exponential backoff
-                        (
-                            result_str,
-                            result_obj,
-                        ) = await self._execute_mcp_function_with_retry(function_name, call["arguments"])
+                        if isinstance(outcome, Exception):
+                            raise outcome
+                        result_str, result_obj = outcome
 
                         # Check if function failed after all retries
                         if isinstance(result_str, str) and result_str.startswith("Error:"):
                             # Log failure but still create tool response
-                            logger.warning(f"MCP function {function_name} failed after retries: {result_str}")
+                            logger.warning("MCP function {} failed after retries: {}", function_name, result_str)
                             tool_results.append(
                                 {
                                     "tool_call_id": call["call_id"],
@@ -293,7 +302,7 @@ class ChatCompletionsBackend(MCPBackend):
 
                     except Exception as e:
                         # Only catch unexpected non-MCP system errors
-                        logger.error(f"Unexpected error in MCP function execution: {e}")
+                        logger.error("Unexpected error in MCP function execution: {}", e)
                         error_msg = f"Error executing {function_name}: {str(e)}"
                         tool_results.append(
                             {
@@ -312,11 +321,11 @@ class ChatCompletionsBackend(MCPBackend):
                         source=f"mcp_{function_name}",
                     )
 
-                    logger.info(f"Executed MCP function {function_name} (stdio/streamable-http)")
+                    logger.info("Executed MCP function {} (stdio/streamable-http)", function_name)
                     mcp_functions_executed = True
                 else:
                     # For non-MCP functions, add a dummy tool result to maintain message consistency
-                    logger.info(f"Non-MCP function {function_name} detected, creating placeholder response")
+                    logger.info("Non-MCP function {} detected, creating placeholder response", function_name)
                     tool_results.append(
                         {
                             "tool_call_id": call["call_id"],
@@ -328,13 +337,7 @@ class ChatCompletionsBackend(MCPBackend):
             # Add all tool response messages after the assistant message
             for result in tool_results:
                 # Yield function_call_output status with preview
-                result_text = str(result["content"])
-                if result.get("success") and hasattr(result.get("result_obj"), "content") and result["result_obj"].content:
-                    obj = result["result_obj"]
-                    if isinstance(obj.content, list) and len(obj.content) > 0:
-                        first_item = obj.content[0]
-                        if hasattr(first_item, "text"):
-                            result_text = first_item.text
+                result_text = self._mcp_result_text(result.get("result_obj"), str(result["content"]))
 
                 yield StreamChunk(
                     type="mcp_status",
@@ -366,17 +369,12 @@ class ChatCompletionsBackend(MCPBackend):
                     yield chunk
             else:
                 # No MCP functions were executed, we're done
-                yield StreamChunk(type="done")
+                yield DONE_CHUNK
                 return
 
         elif response_completed:
             # Response completed with no function calls - we're done (base case)
-            yield StreamChunk(
-                type="mcp_status",
-                status="mcp_session_complete",
-                content="✅ [MCP] Session completed",
-                source="mcp_session",
-            )
+            yield MCP_SESSION_COMPLETE_CHUNK
             return
 
     async def _process_stream(self, stream, all_params, agent_id) -> AsyncGenerator[StreamChunk, None]:
@@ -385,7 +383,7 @@ class ChatCompletionsBackend(MCPBackend):
         content = ""
         current_tool_calls = {}
         search_sources_used = 0
-        provider_name = self.get_provider_name()
+        provider_name = self.backend_name
         enable_web_search = all_params.get("enable_web_search", False)
         log_prefix = f"backend.{provider_name.lower().replace(' ', '_')}"
 
@@ -503,7 +501,7 @@ class ChatCompletionsBackend(MCPBackend):
                                 complete_message=complete_message,
                             )
                             log_stream_chunk(log_prefix, "done", None, agent_id)
-                            yield StreamChunk(type="done")
+                            yield DONE_CHUNK
                             return
 
                         elif choice.finish_reason in ["stop", "length"]:
@@ -534,7 +532,7 @@ class ChatCompletionsBackend(MCPBackend):
                                 complete_message=complete_message,
                             )
                             log_stream_chunk(log_prefix, "done", None, agent_id)
-                            yield StreamChunk(type="done")
+                            yield DONE_CHUNK
                             return
 
                 # Optionally handle usage metadata
@@ -557,7 +555,7 @@ class ChatCompletionsBackend(MCPBackend):
 
         # Fallback in case stream ends without finish_reason
         log_stream_chunk(log_prefix, "done", None, agent_id)
-        yield StreamChunk(type="done")
+        yield DONE_CHUNK
 
     def create_tool_result_message(self, tool_call: Dict[str, Any], result_content: str) -> Dict[str, Any]:
         """Create tool result message for Chat Completions format."""
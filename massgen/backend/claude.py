@@ -32,7 +32,22 @@ from ..formatter import ClaudeFormatter
 from ..logger_config import log_backend_agent_message, log_stream_chunk, logger
 from ..mcp_tools.backend_utils import MCPErrorHandler
 from .base import FilesystemSupport, StreamChunk
-from .base_with_mcp import MCPBackend
+from .base_with_mcp import (
+    DONE_CHUNK,
+    MCP_BLOCKED_CHUNK,
+    MCP_SESSION_COMPLETE_CHUNK,
+    MCPBackend,
+)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Parser for accumulated tool input JSON; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_loads_tool_input = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 
 class ClaudeBackend(MCPBackend):
@@ -146,7 +161,7 @@ class ClaudeBackend(MCPBackend):
                                 tool_name = tool_data.get("name", "")
                                 tool_input = tool_data.get("input", "")
                                 try:
-                                    parsed_input = json.loads(tool_input) if tool_input else {}
+                                    parsed_input = _loads_tool_input(tool_input) if tool_input else {}
                                 except json.JSONDecodeError:
                                     parsed_input = {"raw_input": tool_input}
                                 if tool_name == "code_execution":
@@ -184,7 +199,7 @@ class ClaudeBackend(MCPBackend):
                             # Parse accumulated JSON input for tool
                             tool_input = tool_use.get("input", "")
                             try:
-                                parsed_input = json.loads(tool_input) if tool_input else {}
+                                parsed_input = _loads_tool_input(tool_input) if tool_input else {}
                             except json.JSONDecodeError:
                                 parsed_input = {"raw_input": tool_input}
 
@@ -226,16 +241,12 @@ class ClaudeBackend(MCPBackend):
         if response_completed and mcp_tool_calls:
             # Circuit breaker pre-execution check using base class method
             if not await self._check_circuit_breaker_before_execution():
-                yield StreamChunk(
-                    type="mcp_status",
-                    status="mcp_blocked",
-                    content="⚠️ [MCP] All servers blocked by circuit breaker",
-                    source="circuit_breaker",
-                )
-                yield StreamChunk(type="done")
+                yield MCP_BLOCKED_CHUNK
+                yield DONE_CHUNK
                 return
 
-            updated_messages = current_messages.copy()
+            # The MCP loop owns current_messages (copied once in stream_with_tools), so extend it in place
+            updated_messages = current_messages
 
             # Build assistant message with tool_use blocks for all MCP tool calls
             assistant_content = []
@@ -259,7 +270,8 @@ class ClaudeBackend(MCPBackend):
             # Append the assistant message with tool uses
             updated_messages.append({"role": "assistant", "content": assistant_content})
 
-            # Now execute the MCP tool calls and append results
+            # Announce every MCP tool call, then execute them concurrently
+            mcp_calls = []
             for tool_call in mcp_tool_calls:
                 function_name = tool_call["function"]["name"]
 
@@ -271,17 +283,26 @@ class ClaudeBackend(MCPBackend):
                     source=f"mcp_{function_name}",
                 )
 
+                # Parsed tool_use input goes straight to the executor instead of a JSON round-trip
+                mcp_calls.append((function_name, tool_call["function"].get("arguments", "{}")))
+
+            mcp_outcomes = await self._execute_mcp_functions_concurrently(mcp_calls)
+
+            # Append results in tool call order
+            for tool_call, outcome in zip(mcp_tool_calls, mcp_outcomes):
+                function_name = tool_call["function"]["name"]
+
                 try:
-                    # Execute MCP function
-                    args_json = json.dumps(tool_call["function"]["arguments"]) if isinstance(tool_call["function"].get("arguments"), (dict, list)) else tool_call["function"].get("arguments", "{}")
-                    result_list = await self._execute_mcp_function_with_retry(function_name, args_json)
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    result_list = outcome
                     if not result_list or (isinstance(result_list[0], str) and result_list[0].startswith("Error:")):
-                        logger.warning(f"MCP function {function_name} failed after retries: {result_list[0] if result_list else 'unknown error'}")
+                        logger.warning("MCP function {} failed after retries: {}", function_name, result_list[0] if result_list else "unknown error")
                         continue
                     result_str = result_list[0]
                     result_obj = result_list[1] if len(result_list) > 1 else None
                 except Exception as e:
-                    logger.error(f"Unexpected error in MCP function execution: {e}")
+                    logger.error("Unexpected error in MCP function execution: {}", e)
                     continue
 
                 # Build tool result message: { "role":"user", "content":[{ "type":"tool_result", "tool_use_id": tool_call["id"], "content": result_str }] }
@@ -306,31 +327,15 @@ class ClaudeBackend(MCPBackend):
                     source=f"mcp_{function_name}",
                 )
 
-                # If result_obj might be structured, try to display summary
-                result_display = None
-                try:
-                    if hasattr(result_obj, "content") and result_obj.content:
-                        part = result_obj.content[0]
-                        if hasattr(part, "text"):
-                            result_display = str(part.text)
-                except Exception:
-                    result_display = None
-                if result_display:
-                    yield StreamChunk(
-                        type="mcp_status",
-                        status="function_call_output",
-                        content=f"Results for Calling {function_name}: {result_display}",
-                        source=f"mcp_{function_name}",
-                    )
-                else:
-                    yield StreamChunk(
-                        type="mcp_status",
-                        status="function_call_output",
-                        content=f"Results for Calling {function_name}: {result_str}",
-                        source=f"mcp_{function_name}",
-                    )
+                # If result_obj is structured, display its text summary
+                yield StreamChunk(
+                    type="mcp_status",
+                    status="function_call_output",
+                    content=f"Results for Calling {function_name}: {self._mcp_result_text(result_obj, result_str)}",
+                    source=f"mcp_{function_name}",
+                )
 
-                logger.info(f"Executed MCP function {function_name} (stdio/streamable-http)")
+                logger.info("Executed MCP function {} (stdio/streamable-http)", function_name)
                 yield StreamChunk(
                     type="mcp_status",
                     status="mcp_tool_response",
@@ -354,13 +359,8 @@ class ClaudeBackend(MCPBackend):
             }
             log_stream_chunk("backend.claude", "complete_message", complete_message, agent_id)
             yield StreamChunk(type="complete_message", complete_message=complete_message)
-            yield StreamChunk(
-                type="mcp_status",
-                status="mcp_session_complete",
-                content="✅ [MCP] Session completed",
-                source="mcp_session",
-            )
-            yield StreamChunk(type="done")
+            yield MCP_SESSION_COMPLETE_CHUNK
+            yield DONE_CHUNK
             return
 
     async def _process_stream(
@@ -465,7 +465,7 @@ class ClaudeBackend(MCPBackend):
                                 tool_name = tool_data.get("name", "")
                                 tool_input = tool_data.get("input", "")
                                 try:
-                                    parsed_input = json.loads(tool_input) if tool_input else {}
+                                    parsed_input = _loads_tool_input(tool_input) if tool_input else {}
                                 except json.JSONDecodeError:
                                     parsed_input = {"raw_input": tool_input}
                                 if tool_name == "code_execution":
@@ -503,7 +503,7 @@ class ClaudeBackend(MCPBackend):
                         if not is_server_side and tool_name not in ["web_search", "code_execution"]:
                             tool_input = tool_use.get("input", "")
                             try:
-                                parsed_input = json.loads(tool_input) if tool_input else {}
+                                parsed_input = _loads_tool_input(tool_input) if tool_input else {}
                             except json.JSONDecodeError:
                                 parsed_input = {"raw_input": tool_input}
                             user_tool_calls.append(
@@ -553,7 +553,7 @@ class ClaudeBackend(MCPBackend):
                         self.code_session_hours += 0.083
 
                     log_stream_chunk("backend.claude", "done", None, agent_id)
-                    yield StreamChunk(type="done")
+                    yield DONE_CHUNK
                     return
             except Exception as event_error:
                 error_msg = f"Event processing error: {event_error}"
@@ -590,21 +590,18 @@ class ClaudeBackend(MCPBackend):
         fallback_params = dict(api_params)
 
         # Remove any MCP tools from the tools list
-        if "tools" in fallback_params and self._mcp_functions:
-            mcp_names = set(self._mcp_functions.keys())
-            non_mcp_tools = []
-            for tool in fallback_params["tools"]:
-                name = tool.get("name")
-                if name in mcp_names:
-                    continue
-                non_mcp_tools.append(tool)
-            fallback_params["tools"] = non_mcp_tools
+        if "tools" in fallback_params:
+            fallback_params["tools"] = self._strip_mcp_tools(fallback_params["tools"])
 
-        # Add back provider tools if they were present
+        # Add back provider tools if they were present, skipping ones already listed
         if provider_tools:
-            if "tools" not in fallback_params:
-                fallback_params["tools"] = []
-            fallback_params["tools"].extend(provider_tools)
+            merged_tools = fallback_params.setdefault("tools", [])
+            seen = {(tool.get("type"), tool.get("name")) for tool in merged_tools}
+            for tool in provider_tools:
+                key = (tool.get("type"), tool.get("name"))
+                if key not in seen:
+                    seen.add(key)
+                    merged_tools.append(tool)
 
         async for chunk in stream_func(fallback_params):
             yield chunk
@@ -424,12 +424,14 @@ class ClaudeCodeBackend(LLMBackend):
 
         # Add workflow tools information if present
         if tools:
-            workflow_tools = [t for t in tools if t.get("function", {}).get("name") in ["new_answer", "vote"]]
+            coordination_tools = self._COORDINATION_TOOLS
+            workflow_tools = [t for t in tools if t.get("function", {}).get("name") in coordination_tools]
             if workflow_tools:
                 system_parts.append("\n--- Coordination Actions ---")
                 for tool in workflow_tools:
-                    name = tool.get("function", {}).get("name", "unknown")
-                    description = tool.get("function", {}).get("description", "No description")
+                    function_def = tool.get("function", {})
+                    name = function_def.get("name", "unknown")
+                    description = function_def.get("description", "No description")
                     system_parts.append(f"- {name}: {description}")
 
                     # Add usage examples for workflow tools
@@ -438,14 +440,9 @@ class ClaudeCodeBackend(LLMBackend):
                             '    Usage: {"tool_name": "new_answer", ' '"arguments": {"content": "your improved answer. If any builtin tools were used, mention how they are used here."}}',
                         )
                     elif name == "vote":
-                        # Extract valid agent IDs from enum if available
-                        agent_id_enum = None
-                        for t in tools:
-                            if t.get("function", {}).get("name") == "vote":
-                                agent_id_param = t.get("function", {}).get("parameters", {}).get("properties", {}).get("agent_id", {})
-                                if "enum" in agent_id_param:
-                                    agent_id_enum = agent_id_param["enum"]
-                                break
+                        # Extract valid agent IDs from the vote tool's enum if available
+                        agent_id_param = function_def.get("parameters", {}).get("properties", {}).get("agent_id", {})
+                        agent_id_enum = agent_id_param.get("enum")
 
                         if agent_id_enum:
                             agent_list = ", ".join(agent_id_enum)
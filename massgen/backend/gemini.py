@@ -26,6 +26,7 @@ import json
 import os
 import re
 import time
+from types import CoroutineType
 from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
 
 from ..logger_config import (
@@ -82,6 +83,14 @@ except ImportError:
     MCPConfigHelper = None  # type: ignore[assignment]
 
 
+async def _maybe_await(result: Any) -> Any:
+    """Await the result of a close/stop call if it returned an awaitable."""
+    # Coroutines are the common case and need only a C-level type check
+    if isinstance(result, CoroutineType) or hasattr(result, "__await__"):
+        return await result
+    return result
+
+
 class ActionType(enum.Enum):
     """Action types for structured output."""
 
@@ -467,6 +476,8 @@ class GeminiBackend(LLMBackend):
         self._mcp_tool_calls_count = 0
         self._mcp_tool_failures = 0
         self._mcp_tool_successes = 0
+        # Set once the current MCP stream has logged its tool success; checked per chunk
+        self._mcp_stream_started = False
 
         # MCP Response Extractor for capturing tool interactions
         self.mcp_extractor = MCPResponseExtractor()
@@ -805,7 +816,8 @@ class GeminiBackend(LLMBackend):
                 return
 
             # Record success ONLY for servers that actually connected
-            connected_server_configs = [server for server in filtered_servers if server.get("name") in connected_server_names]
+            connected_name_set = set(connected_server_names)
+            connected_server_configs = [server for server in filtered_servers if server.get("name") in connected_name_set]
             if connected_server_configs:
                 if self._circuit_breakers_enabled and self._mcp_tools_circuit_breaker:
                     await MCPCircuitBreakerManager.record_success(
@@ -901,15 +913,20 @@ class GeminiBackend(LLMBackend):
         if not tools:
             return False
 
-        tool_names = set()
+        found = set()
         for tool in tools:
-            if tool.get("type") == "function":
-                if "function" in tool:
-                    tool_names.add(tool["function"].get("name", ""))
-                elif "name" in tool:
-                    tool_names.add(tool.get("name", ""))
+            if tool.get("type") != "function":
+                continue
+            if "function" in tool:
+                name = tool["function"].get("name", "")
+            else:
+                name = tool.get("name", "")
+            if name in self._COORDINATION_TOOLS:
+                found.add(name)
+                if len(found) == len(self._COORDINATION_TOOLS):
+                    return True
 
-        return "vote" in tool_names and "new_answer" in tool_names
+        return False
 
     def build_structured_output_prompt(self, base_content: str, valid_agent_ids: Optional[List[str]] = None) -> str:
         """Build prompt that encourages structured output for coordination."""
@@ -1121,21 +1138,21 @@ Make your decision and include the JSON at the very end of your response."""
             content=f"\n⚠️  {user_message} ({error}); continuing without MCP tools\n",
         )
 
+    async def _mcp_stats_callback(self, action: str) -> int:
+        """Update MCP call/failure counters for execute_function_with_retry."""
+        if action == "increment_calls":
+            self._mcp_tool_calls_count += 1
+            return self._mcp_tool_calls_count
+        elif action == "increment_failures":
+            self._mcp_tool_failures += 1
+            return self._mcp_tool_failures
+        return 0
+
     async def _execute_mcp_function_with_retry(self, function_name: str, args: Dict[str, Any], agent_id: Optional[str] = None) -> Any:
         """Execute MCP function with exponential backoff retry logic."""
         if MCPExecutionManager is None:
             raise RuntimeError("MCPExecutionManager is not available - MCP backend utilities are missing")
 
-        # Stats callback for tracking
-        async def stats_callback(action: str) -> int:
-            if action == "increment_calls":
-                self._mcp_tool_calls_count += 1
-                return self._mcp_tool_calls_count
-            elif action == "increment_failures":
-                self._mcp_tool_failures += 1
-                return self._mcp_tool_failures
-            return 0
-
         # Circuit breaker callback
         async def circuit_breaker_callback(event: str, error_msg: str) -> None:
             if event == "failure":
@@ -1171,7 +1188,7 @@ Make your decision and include the JSON at the very end of your response."""
             args=args,
             functions=self.functions,
             max_retries=3,
-            stats_callback=stats_callback,
+            stats_callback=self._mcp_stats_callback,
             circuit_breaker_callback=circuit_breaker_callback,
             logger_instance=logger,
         )
@@ -1191,7 +1208,7 @@ Make your decision and include the JSON at the very end of your response."""
         )
 
         # Only trim when MCP tools will be used
-        if self.mcp_servers and MCPMessageManager is not None and hasattr(self, "_max_mcp_message_history") and self._max_mcp_message_history > 0:
+        if self.mcp_servers and MCPMessageManager is not None and self._max_mcp_message_history > 0:
             original_count = len(messages)
             messages = MCPMessageManager.trim_message_history(messages, self._max_mcp_message_history)
             if len(messages) < original_count:
@@ -1354,8 +1371,8 @@ Make your decision and include the JSON at the very end of your response."""
                                     content=f"Retrying MCP connection (attempt {retry_count}/{max_mcp_retries})",
                                     source="mcp_tools",
                                 )
-                                # Brief delay between retries
-                                await asyncio.sleep(0.5 * retry_count)  # Progressive backoff
+                                # Jittered exponential backoff so agents sharing a server don't retry in lockstep
+                                await asyncio.sleep(MCPErrorHandler.get_retry_delay(retry_count - 2, base_delay=0.25))
 
                             # Apply circuit breaker filtering before retry attempts
                             if self._circuit_breakers_enabled and self._mcp_tools_circuit_breaker:
@@ -1681,7 +1698,7 @@ Make your decision and include the JSON at the very end of your response."""
                                                     )
 
                             # Track successful MCP tool execution (only on first chunk with MCP history)
-                            if not hasattr(self, "_mcp_stream_started"):
+                            if not self._mcp_stream_started:
                                 self._mcp_tool_successes += 1
                                 self._mcp_stream_started = True
                                 log_backend_activity(
@@ -1727,8 +1744,7 @@ Make your decision and include the JSON at the very end of your response."""
                             yield StreamChunk(type="content", content=chunk_text)
 
                     # Reset stream tracking
-                    if hasattr(self, "_mcp_stream_started"):
-                        delattr(self, "_mcp_stream_started")
+                    self._mcp_stream_started = False
 
                     # Add MCP usage indicator with detailed summary using tracker
                     tools_summary = mcp_tracker.get_summary()
@@ -2132,9 +2148,7 @@ Make your decision and include the JSON at the very end of your response."""
             if stream is not None:
                 close_fn = getattr(stream, "aclose", None) or getattr(stream, "close", None)
                 if close_fn is not None:
-                    maybe = close_fn()
-                    if hasattr(maybe, "__await__"):
-                        await maybe
+                    await _maybe_await(close_fn())
         except Exception as e:
             log_backend_activity(
                 "gemini",
@@ -2174,9 +2188,7 @@ Make your decision and include the JSON at the very end of your response."""
                 for method_name in ("close", "stop"):
                     method = getattr(aio_obj, method_name, None)
                     if method:
-                        maybe = method()
-                        if hasattr(maybe, "__await__"):
-                            await maybe
+                        await _maybe_await(method())
                         break
         except Exception as e:
             log_backend_activity(
@@ -2192,9 +2204,7 @@ Make your decision and include the JSON at the very end of your response."""
                 for method_name in ("aclose", "close"):
                     method = getattr(client, method_name, None)
                     if method:
-                        maybe = method()
-                        if hasattr(maybe, "__await__"):
-                            await maybe
+                        await _maybe_await(method())
                         break
         except Exception as e:
             log_backend_activity(
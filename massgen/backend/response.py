@@ -118,16 +118,7 @@ class ResponseBackend(MCPBackend):
         api_params = await self.api_params_handler.build_api_params(processed_messages, tools, all_params)
 
         if "tools" in api_params:
-            non_mcp_tools = []
-            for tool in api_params.get("tools", []):
-                if tool.get("type") == "function":
-                    name = tool.get("function", {}).get("name") if "function" in tool else tool.get("name")
-                    if name and name in self._mcp_function_names:
-                        continue
-                elif tool.get("type") == "mcp":
-                    continue
-                non_mcp_tools.append(tool)
-            api_params["tools"] = non_mcp_tools
+            api_params["tools"] = self._strip_mcp_tools(api_params["tools"])
 
         stream = await client.responses.create(**api_params)
 
@@ -173,27 +164,30 @@ class ResponseBackend(MCPBackend):
 
         async for chunk in stream:
             if hasattr(chunk, "type"):
+                # Read the event type once per chunk
+                chunk_type = chunk.type
+
                 # Detect function call start
-                if chunk.type == "response.output_item.added" and hasattr(chunk, "item") and chunk.item and getattr(chunk.item, "type", None) == "function_call":
+                if chunk_type == "response.output_item.added" and getattr(chunk, "item", None) and getattr(chunk.item, "type", None) == "function_call":
                     current_function_call = {
                         "call_id": getattr(chunk.item, "call_id", ""),
                         "name": getattr(chunk.item, "name", ""),
                         "arguments": "",
                     }
-                    logger.info(f"Function call detected: {current_function_call['name']}")
+                    logger.info("Function call detected: {}", current_function_call["name"])
 
                 # Accumulate function arguments
-                elif chunk.type == "response.function_call_arguments.delta" and current_function_call is not None:
+                elif chunk_type == "response.function_call_arguments.delta" and current_function_call is not None:
                     delta = getattr(chunk, "delta", "")
                     current_function_call["arguments"] += delta
 
                 # Function call completed
-                elif chunk.type == "response.output_item.done" and current_function_call is not None:
+                elif chunk_type == "response.output_item.done" and current_function_call is not None:
                     captured_function_calls.append(current_function_call)
                     current_function_call = None
 
                 # Handle regular content and other events
-                elif chunk.type == "response.output_text.delta":
+                elif chunk_type == "response.output_text.delta":
                     delta = getattr(chunk, "delta", "")
                     yield TextStreamChunk(
                         type=ChunkType.CONTENT,
@@ -207,7 +201,7 @@ class ResponseBackend(MCPBackend):
                     yield result
 
                 # Response completed
-                if chunk.type == "response.completed":
+                if chunk_type == "response.completed":
                     response_completed = True
                     if captured_function_calls:
                         # Execute captured function calls and recurse
@@ -219,11 +213,11 @@ class ResponseBackend(MCPBackend):
 
         # Execute any captured function calls
         if captured_function_calls and response_completed:
-            # Check if any of the function calls are NOT MCP functions
-            non_mcp_functions = [call for call in captured_function_calls if call["name"] not in self._mcp_functions]
+            # Split MCP from non-MCP function calls once; both halves are reused below
+            mcp_calls, non_mcp_functions = self._partition_mcp_calls(captured_function_calls)
 
             if non_mcp_functions:
-                logger.info(f"Non-MCP function calls detected: {[call['name'] for call in non_mcp_functions]}. Ending MCP processing.")
+                logger.opt(lazy=True).info("Non-MCP function calls detected: {}. Ending MCP processing.", lambda: [call["name"] for call in non_mcp_functions])
                 yield TextStreamChunk(type=ChunkType.DONE, source="response_api")
                 return
 
@@ -241,57 +235,36 @@ class ResponseBackend(MCPBackend):
 
             # Execute only MCP function calls
             mcp_functions_executed = False
-            updated_messages = current_messages.copy()
+            # The MCP loop owns current_messages (copied once in stream_with_tools), so extend it in place
+            updated_messages = current_messages
             # Ensure every captured function call gets a result to prevent hanging
             processed_call_ids = set()
 
-            for call in captured_function_calls:
-                function_name = call["name"]
-                if function_name in self._mcp_functions:
-                    # Yield MCP tool call status
-                    yield TextStreamChunk(
-                        type=ChunkType.MCP_STATUS,
-                        status="mcp_tool_called",
-                        content=f"🔧 [MCP Tool] Calling {function_name}...",
-                        source=f"mcp_{function_name}",
-                    )
+            # Announce every MCP call, then execute them concurrently
+            for call in mcp_calls:
+                # Yield MCP tool call status
+                yield TextStreamChunk(
+                    type=ChunkType.MCP_STATUS,
+                    status="mcp_tool_called",
+                    content=f"🔧 [MCP Tool] Calling {call['name']}...",
+                    source=f"mcp_{call['name']}",
+                )
 
-                    try:
-                        # Execute MCP function with retry and exponential backoff
-                        result, result_obj = await super()._execute_mcp_function_with_retry(
-                            function_name,
-                            call["arguments"],
-                        )
+            # Execute MCP functions with retry and exponential backoff; outcomes come back in call order.
+            # Non-MCP calls ended the turn above, so mcp_calls covers every captured call.
+            mcp_outcomes = await self._execute_mcp_functions_concurrently([(call["name"], call["arguments"]) for call in mcp_calls])
 
-                        # Check if function failed after all retries
-                        if isinstance(result, str) and result.startswith("Error:"):
-                            # Log failure but still create tool response
-                            logger.warning(f"MCP function {function_name} failed after retries: {result}")
-
-                            # Add error result to messages
-                            function_call_msg = {
-                                "type": "function_call",
-                                "call_id": call["call_id"],
-                                "name": function_name,
-                                "arguments": call["arguments"],
-                            }
-                            updated_messages.append(function_call_msg)
-
-                            error_output_msg = {
-                                "type": "function_call_output",
-                                "call_id": call["call_id"],
-                                "output": result,
-                            }
-                            updated_messages.append(error_output_msg)
-
-                            processed_call_ids.add(call["call_id"])
-                            mcp_functions_executed = True
-                            continue
+            for call, outcome in zip(mcp_calls, mcp_outcomes):
+                function_name = call["name"]
+                try:
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    result, result_obj = outcome
 
-                    except Exception as e:
-                        # Only catch unexpected non-MCP system errors
-                        logger.error(f"Unexpected error in MCP function execution: {e}")
-                        error_msg = f"Error executing {function_name}: {str(e)}"
+                    # Check if function failed after all retries
+                    if isinstance(result, str) and result.startswith("Error:"):
+                        # Log failure but still create tool response
+                        logger.warning("MCP function {} failed after retries: {}", function_name, result)
 
                         # Add error result to messages
                         function_call_msg = {
@@ -305,7 +278,7 @@ class ResponseBackend(MCPBackend):
                         error_output_msg = {
                             "type": "function_call_output",
                             "call_id": call["call_id"],
-                            "output": error_msg,
+                            "output": result,
                         }
                         updated_messages.append(error_output_msg)
 
@@ -313,7 +286,12 @@ class ResponseBackend(MCPBackend):
                         mcp_functions_executed = True
                         continue
 
-                    # Add function call to messages and yield status chunk
+                except Exception as e:
+                    # Only catch unexpected non-MCP system errors
+                    logger.error("Unexpected error in MCP function execution: {}", e)
+                    error_msg = f"Error executing {function_name}: {str(e)}"
+
+                    # Add error result to messages
                     function_call_msg = {
                         "type": "function_call",
                         "call_id": call["call_id"],
@@ -321,44 +299,64 @@ class ResponseBackend(MCPBackend):
                         "arguments": call["arguments"],
                     }
                     updated_messages.append(function_call_msg)
-                    yield TextStreamChunk(
-                        type=ChunkType.MCP_STATUS,
-                        status="function_call",
-                        content=f"Arguments for Calling {function_name}: {call['arguments']}",
-                        source=f"mcp_{function_name}",
-                    )
 
-                    # Add function output to messages and yield status chunk
-                    function_output_msg = {
+                    error_output_msg = {
                         "type": "function_call_output",
                         "call_id": call["call_id"],
-                        "output": str(result),
+                        "output": error_msg,
                     }
-                    updated_messages.append(function_output_msg)
-                    yield TextStreamChunk(
-                        type=ChunkType.MCP_STATUS,
-                        status="function_call_output",
-                        content=f"Results for Calling {function_name}: {str(result_obj.content[0].text)}",
-                        source=f"mcp_{function_name}",
-                    )
+                    updated_messages.append(error_output_msg)
 
-                    logger.info(f"Executed MCP function {function_name} (stdio/streamable-http)")
                     processed_call_ids.add(call["call_id"])
+                    mcp_functions_executed = True
+                    continue
 
-                    # Yield MCP tool response status
-                    yield TextStreamChunk(
-                        type=ChunkType.MCP_STATUS,
-                        status="mcp_tool_response",
-                        content=f"✅ [MCP Tool] {function_name} completed",
-                        source=f"mcp_{function_name}",
-                    )
+                # Add function call to messages and yield status chunk
+                function_call_msg = {
+                    "type": "function_call",
+                    "call_id": call["call_id"],
+                    "name": function_name,
+                    "arguments": call["arguments"],
+                }
+                updated_messages.append(function_call_msg)
+                yield TextStreamChunk(
+                    type=ChunkType.MCP_STATUS,
+                    status="function_call",
+                    content=f"Arguments for Calling {function_name}: {call['arguments']}",
+                    source=f"mcp_{function_name}",
+                )
 
-                    mcp_functions_executed = True
+                # Add function output to messages and yield status chunk
+                function_output_msg = {
+                    "type": "function_call_output",
+                    "call_id": call["call_id"],
+                    "output": result,
+                }
+                updated_messages.append(function_output_msg)
+                yield TextStreamChunk(
+                    type=ChunkType.MCP_STATUS,
+                    status="function_call_output",
+                    content=f"Results for Calling {function_name}: {self._mcp_result_text(result_obj, result)}",
+                    source=f"mcp_{function_name}",
+                )
+
+                logger.info("Executed MCP function {} (stdio/streamable-http)", function_name)
+                processed_call_ids.add(call["call_id"])
+
+                # Yield MCP tool response status
+                yield TextStreamChunk(
+                    type=ChunkType.MCP_STATUS,
+                    status="mcp_tool_response",
+                    content=f"✅ [MCP Tool] {function_name} completed",
+                    source=f"mcp_{function_name}",
+                )
+
+                mcp_functions_executed = True
 
             # Ensure all captured function calls have results to prevent hanging
             for call in captured_function_calls:
                 if call["call_id"] not in processed_call_ids:
-                    logger.warning(f"Tool call {call['call_id']} for function {call['name']} was not processed - adding error result")
+                    logger.warning("Tool call {} for function {} was not processed - adding error result", call["call_id"], call["name"])
 
                     # Add missing function call and error result to messages
                     function_call_msg = {
@@ -713,7 +711,7 @@ class ResponseBackend(MCPBackend):
                 agent_id or "default",
                 "RECV",
                 {"content": chunk.delta},
-                backend_name=self.get_provider_name(),
+                backend_name=self.backend_name,
             )
             log_stream_chunk("backend.response", "content", chunk.delta, agent_id)
             return TextStreamChunk(
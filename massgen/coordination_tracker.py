@@ -12,15 +12,33 @@ us exactly what occurred and when.
 """
 
 import json
+import re
 import time
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, fields
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .logger_config import logger
 from .utils import ActionType, AgentStatus
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Streamed NDJSON event logs are flushed after this many buffered events
+EVENT_LOG_FLUSH_INTERVAL = 50
+# Write buffer for the NDJSON stream, sized so a full flush batch (events can
+# carry whole answers in their context) normally goes out in a single write()
+EVENT_LOG_BUFFER_SIZE = 1 << 20
+
+# Matches the agent number prefix of answer labels like "agent1.1" or "agent2.final"
+_AGENT_LABEL_RE = re.compile(r"agent(\d+)")
+
 
 class EventType(str, Enum):
     SESSION_START = "session_start"
@@ -48,48 +66,74 @@ ACTION_TO_EVENT = {
     ActionType.CANCELLED: EventType.AGENT_CANCELLED,
 }
 
+# Upper-cased action names used as the prefix of agent action event details
+ACTION_LABELS = {action: action.value.upper() for action in ActionType}
+
+# Status change details repeat for every transition; build each string once and share it
+STATUS_CHANGE_DETAILS = {status: f"Changed to status: {status.value}" for status in AgentStatus}
+
+
+# Records store monotonic timestamps; this anchor converts them to wall-clock
+# time only when they are read or serialized.
+_WALL_ANCHOR = time.time()
+_MONO_ANCHOR_NS = time.monotonic_ns()
 
-@dataclass
+
+def _wall_time(timestamp_ns: int) -> float:
+    """Convert a time.monotonic_ns() reading to a wall-clock timestamp."""
+    return _WALL_ANCHOR + (timestamp_ns - _MONO_ANCHOR_NS) / 1e9
+
+
+def _generated_to_dict(cls):
+    """Attach a to_dict() compiled once from the dataclass fields.
+
+    The generated function returns a dict literal, avoiding per-call field
+    iteration and getattr lookups when serializing large event lists. A
+    ``timestamp_ns`` field is emitted as a wall-clock ``timestamp`` and also
+    exposed through a read-only ``timestamp`` property.
+    """
+    items = []
+    for f in fields(cls):
+        if f.name == "timestamp_ns":
+            items.append('"timestamp": _wall_time(self.timestamp_ns)')
+        else:
+            items.append(f'"{f.name}": self.{f.name}')
+    namespace: Dict[str, Any] = {"_wall_time": _wall_time}
+    exec(f"def to_dict(self):\n    return {{{', '.join(items)}}}\n", namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = "Convert to dictionary for serialization."
+    cls.to_dict = to_dict
+    if any(f.name == "timestamp_ns" for f in fields(cls)):
+        cls.timestamp = property(lambda self: _wall_time(self.timestamp_ns), doc="Wall-clock time of the record.")
+    return cls
+
+
+@_generated_to_dict
+@dataclass(slots=True)
 class CoordinationEvent:
     """A single coordination event with timestamp."""
 
-    timestamp: float
+    timestamp_ns: int  # time.monotonic_ns() when the event was recorded
     event_type: EventType
     agent_id: Optional[str] = None
     details: str = ""
     context: Optional[Dict[str, Any]] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            "timestamp": self.timestamp,
-            "event_type": self.event_type,
-            "agent_id": self.agent_id,
-            "details": self.details,
-            "context": self.context,
-        }
-
 
-@dataclass
+@_generated_to_dict
+@dataclass(slots=True)
 class AgentAnswer:
     """Represents an answer from an agent."""
 
     agent_id: str
     content: str
-    timestamp: float
-
-    @property
-    def label(self) -> str:
-        """Auto-generate label based on answer properties."""
-        # This will be set by the tracker when it knows agent order
-        return getattr(self, "_label", "unknown")
-
-    @label.setter
-    def label(self, value: str):
-        self._label = value
+    timestamp_ns: int
+    label: str = "unknown"  # Set by the tracker once it knows agent order
 
 
-@dataclass
+@_generated_to_dict
+@dataclass(slots=True)
 class AgentVote:
     """Represents a vote from an agent."""
 
@@ -98,8 +142,8 @@ class AgentVote:
     voted_for_label: str  # Answer label like "agent1.1"
     voter_anon_id: str  # Anonymous voter ID like "agent1"
     reason: str
-    timestamp: float
-    available_answers: List[str]  # Available answer labels like ["agent1.1", "agent2.1"]
+    timestamp_ns: int
+    available_answers: Tuple[str, ...]  # Available answer labels like ("agent1.1", "agent2.1")
 
 
 class CoordinationTracker:
@@ -113,38 +157,47 @@ class CoordinationTracker:
     def __init__(self):
         # Event log - chronological record of everything that happens
         self.events: List[CoordinationEvent] = []
+        self._events_by_type: Dict[EventType, List[int]] = defaultdict(list)  # event_type -> indices into events
 
         # Answer tracking
         self.answers_by_agent: Dict[str, List[AgentAnswer]] = {}  # agent_id -> list of regular answers
         self.final_answers: Dict[str, AgentAnswer] = {}  # agent_id -> final answer
+        self.answer_count: int = 0  # Running total of regular answers across agents
 
         # Vote tracking
         self.votes: List[AgentVote] = []
+        self.votes_per_agent: Dict[str, int] = defaultdict(int)  # voter_id -> number of votes cast
 
         # Coordination iteration tracking
         self.current_iteration: int = 0
         self.agent_rounds: Dict[str, int] = {}  # Per-agent round tracking - increments when restart completed
+        self._max_round: int = 0  # Highest value in agent_rounds, maintained as rounds advance
         self.agent_round_context: Dict[str, Dict[int, List[str]]] = {}  # What context each agent had in each round
-        self.iteration_available_labels: List[str] = []  # Frozen snapshot of available answer labels for current iteration
+        self.iteration_available_labels: Tuple[str, ...] = ()  # Frozen snapshot of available answer labels for current iteration
 
         # Restart tracking - track pending restarts per agent
-        self.pending_agent_restarts: Dict[str, bool] = {}  # agent_id -> is restart pending
+        self.pending_agent_restarts: Set[str] = set()  # agent_ids with a restart pending
 
         # Session info
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
         self.agent_ids: List[str] = []
+        self.agent_id_to_num: Dict[str, int] = {}  # agent_id -> 1-based agent number
         self.final_winner: Optional[str] = None
         self.final_context: Optional[Dict[str, Any]] = None  # Context provided to final agent
         self.is_final_round: bool = False  # Track if we're in the final presentation round
         self.user_prompt: Optional[str] = None  # Store the initial user prompt
 
         # Agent mappings - coordination tracker is the single source of truth
-        self.agent_context_labels: Dict[str, List[str]] = {}  # Track what labels each agent can see
+        self.agent_context_labels: Dict[str, Tuple[str, ...]] = {}  # Track what labels each agent can see
 
         # Snapshot mapping - tracks filesystem snapshots for answers/votes
         self.snapshot_mappings: Dict[str, Dict[str, Any]] = {}  # label/vote_id -> snapshot info
 
+        # Optional NDJSON event stream - events are appended as they happen
+        self._event_log_file = None
+        self._event_log_unflushed: int = 0
+
     def _make_snapshot_path(self, kind: str, agent_id: str, timestamp: str) -> str:
         """Generate standardized snapshot paths.
 
@@ -164,20 +217,38 @@ class CoordinationTracker:
             return f"{agent_id}/{timestamp}/vote.json"
         return f"{agent_id}/{timestamp}/{kind}.txt"
 
-    def initialize_session(self, agent_ids: List[str], user_prompt: Optional[str] = None):
-        """Initialize a new coordination session."""
+    def initialize_session(
+        self,
+        agent_ids: List[str],
+        user_prompt: Optional[str] = None,
+        event_log_path: Optional[Path] = None,
+    ):
+        """Initialize a new coordination session.
+
+        Args:
+            agent_ids: IDs of the participating agents, in display order
+            user_prompt: The initial user prompt, if known
+            event_log_path: Optional NDJSON file that every event is appended to
+                as it is recorded, flushed in batches
+        """
+        if event_log_path is not None:
+            self._open_event_log(event_log_path)
+
         self.start_time = time.time()
         self.agent_ids = agent_ids.copy()
+        self.agent_id_to_num = {aid: i + 1 for i, aid in enumerate(agent_ids)}
         self.answers_by_agent = {aid: [] for aid in agent_ids}
+        self.answer_count = 0
         self.user_prompt = user_prompt
 
         # Initialize per-agent round tracking
         self.agent_rounds = {aid: 0 for aid in agent_ids}
+        self._max_round = 0
         self.agent_round_context = {aid: {0: []} for aid in agent_ids}  # Each agent starts in round 0 with empty context
-        self.pending_agent_restarts = {aid: False for aid in agent_ids}
+        self.pending_agent_restarts = set()
 
         # Initialize agent context tracking
-        self.agent_context_labels = {aid: [] for aid in agent_ids}
+        self.agent_context_labels = {aid: () for aid in agent_ids}
 
         self._add_event(EventType.SESSION_START, None, f"Started with agents: {agent_ids}")
 
@@ -189,13 +260,14 @@ class CoordinationTracker:
 
     def _get_agent_number(self, agent_id: str) -> Optional[int]:
         """Get the 1-based number for an agent (1, 2, 3, etc.)."""
-        if agent_id in self.agent_ids:
-            return self.agent_ids.index(agent_id) + 1
-        return None
+        return self.agent_id_to_num.get(agent_id)
 
-    def get_agent_context_labels(self, agent_id: str) -> List[str]:
-        """Get the answer labels this agent can currently see."""
-        return self.agent_context_labels.get(agent_id, []).copy()
+    def get_agent_context_labels(self, agent_id: str) -> Tuple[str, ...]:
+        """Get the answer labels this agent can currently see.
+
+        Labels are stored as an immutable tuple, so it is returned without copying.
+        """
+        return self.agent_context_labels.get(agent_id, ())
 
     def get_latest_answer_label(self, agent_id: str) -> Optional[str]:
         """Get the latest answer label for an agent."""
@@ -210,18 +282,15 @@ class CoordinationTracker:
     @property
     def max_round(self) -> int:
         """Get the highest round number across all agents."""
-        return max(self.agent_rounds.values()) if self.agent_rounds else 0
+        return self._max_round
 
     def start_new_iteration(self):
         """Start a new coordination iteration."""
         self.current_iteration += 1
 
-        # Capture available answer labels at start of this iteration (freeze snapshot)
-        self.iteration_available_labels = []
-        for agent_id, answers_list in self.answers_by_agent.items():
-            if answers_list:  # Agent has provided at least one answer
-                latest_answer = answers_list[-1]  # Get most recent answer
-                self.iteration_available_labels.append(latest_answer.label)  # e.g., "agent1.1"
+        # Capture each agent's most recent answer label (e.g. "agent1.1") at the start of this
+        # iteration. Frozen as a tuple so events and votes can share it without copying.
+        self.iteration_available_labels = tuple(answers[-1].label for answers in self.answers_by_agent.values() if answers)
 
         self._add_event(
             EventType.ITERATION_START,
@@ -229,7 +298,7 @@ class CoordinationTracker:
             f"Starting coordination iteration {self.current_iteration}",
             {
                 "iteration": self.current_iteration,
-                "available_answers": self.iteration_available_labels.copy(),
+                "available_answers": self.iteration_available_labels,
             },
         )
 
@@ -238,7 +307,7 @@ class CoordinationTracker:
         context = {
             "iteration": self.current_iteration,
             "end_reason": reason,
-            "available_answers": self.iteration_available_labels.copy(),
+            "available_answers": self.iteration_available_labels,
         }
         if details:
             context.update(details)
@@ -256,7 +325,7 @@ class CoordinationTracker:
 
     def change_status(self, agent_id: str, new_status: AgentStatus):
         """Record when an agent changes status."""
-        self._add_event(EventType.STATUS_CHANGE, agent_id, f"Changed to status: {new_status.value}")
+        self._add_event(EventType.STATUS_CHANGE, agent_id, STATUS_CHANGE_DETAILS[new_status])
 
     def track_agent_context(
         self,
@@ -275,23 +344,18 @@ class CoordinationTracker:
             agent_full_context: Optional full context string/dict to save
             snapshot_dir: Optional directory path to save context.txt
         """
-        # Convert full agent IDs to their corresponding answer labels using canonical mappings
-        answer_labels = []
-        for answering_agent_id in answers.keys():
-            if answering_agent_id in self.answers_by_agent and self.answers_by_agent[answering_agent_id]:
-                # Get the most recent answer's label
-                latest_answer = self.answers_by_agent[answering_agent_id][-1]
-                answer_labels.append(latest_answer.label)
+        # Convert full agent IDs to their most recent answer labels using canonical mappings.
+        # Frozen as a tuple so it can be shared with the event context.
+        answers_by_agent = self.answers_by_agent
+        answer_labels = tuple(answers_by_agent[aid][-1].label for aid in answers if answers_by_agent.get(aid))
+        anon_answering_agents = [self.get_anonymous_id(aid) for aid in answers]
 
         # Update this agent's context labels using canonical mapping
-        self.agent_context_labels[agent_id] = answer_labels.copy()
-
-        # Use anonymous agent IDs for the event context
-        anon_answering_agents = [self.get_anonymous_id(aid) for aid in answers.keys()]
+        self.agent_context_labels[agent_id] = answer_labels
 
         context = {
             "available_answers": anon_answering_agents,  # Anonymous IDs for backward compat
-            "available_answer_labels": answer_labels.copy(),  # Store actual labels in event
+            "available_answer_labels": answer_labels,  # Store actual labels in event
             "answer_count": len(answers),
             "has_conversation_history": bool(conversation_history),
         }
@@ -304,10 +368,8 @@ class CoordinationTracker:
 
     def track_restart_signal(self, triggering_agent: str, agents_restarted: List[str]):
         """Record when a restart is triggered - but don't increment rounds yet."""
-        # Mark affected agents as having pending restarts
-        for agent_id in agents_restarted:
-            if True:  # agent_id != triggering_agent:  # Triggering agent doesn't restart themselves
-                self.pending_agent_restarts[agent_id] = True
+        # Mark affected agents as having pending restarts (the triggering agent included)
+        self.pending_agent_restarts.update(agents_restarted)
 
         # Log restart event (no round increment yet)
         context = {
@@ -327,16 +389,18 @@ class CoordinationTracker:
         Args:
             agent_id: The agent that completed restart
         """
-        if not self.pending_agent_restarts.get(agent_id, False):
+        if agent_id not in self.pending_agent_restarts:
             # This agent wasn't pending a restart, nothing to do
             return
 
         # Mark restart as completed
-        self.pending_agent_restarts[agent_id] = False
+        self.pending_agent_restarts.discard(agent_id)
 
         # Increment this agent's round
         self.agent_rounds[agent_id] += 1
         new_round = self.agent_rounds[agent_id]
+        if new_round > self._max_round:
+            self._max_round = new_round
 
         # Store the context this agent will work with in their new round
         if agent_id not in self.agent_round_context:
@@ -362,7 +426,7 @@ class CoordinationTracker:
             snapshot_timestamp: Timestamp of the filesystem snapshot (if any)
         """
         # Create answer object
-        agent_answer = AgentAnswer(agent_id=agent_id, content=answer, timestamp=time.time())
+        agent_answer = AgentAnswer(agent_id=agent_id, content=answer, timestamp_ns=time.monotonic_ns())
 
         # Auto-generate label based on agent position and answer count
         agent_num = self._get_agent_number(agent_id)
@@ -372,6 +436,7 @@ class CoordinationTracker:
 
         # Store the answer
         self.answers_by_agent[agent_id].append(agent_answer)
+        self.answer_count += 1
 
         # Track snapshot mapping if provided
         if snapshot_timestamp:
@@ -411,10 +476,9 @@ class CoordinationTracker:
 
         # Find the voted-for answer label (agent1.1, agent2.1, etc.)
         voted_for_label = "unknown"
-        if voted_for not in self.agent_ids:
-            logger.warning(f"Vote from {agent_id} for unknown agent {voted_for}")
-
-        if voted_for in self.agent_ids:
+        if voted_for not in self.agent_id_to_num:
+            logger.warning("Vote from {} for unknown agent {}", agent_id, voted_for)
+        else:
             # Find the latest answer from the voted-for agent at vote time
             voted_agent_answers = self.answers_by_agent.get(voted_for, [])
             if voted_agent_answers:
@@ -427,16 +491,17 @@ class CoordinationTracker:
             voted_for_label=voted_for_label,
             voter_anon_id=voter_anon_id,
             reason=reason,
-            timestamp=time.time(),
-            available_answers=self.iteration_available_labels.copy(),
+            timestamp_ns=time.monotonic_ns(),
+            available_answers=self.iteration_available_labels,
         )
         self.votes.append(vote)
+        self.votes_per_agent[agent_id] += 1
 
         # Track snapshot mapping if provided
         if snapshot_timestamp:
             # Create a meaningful vote label similar to answer labels
             agent_num = self._get_agent_number(agent_id) or 0
-            vote_num = len([v for v in self.votes if v.voter_id == agent_id])
+            vote_num = self.votes_per_agent[agent_id]
             vote_label = f"agent{agent_num}.vote{vote_num}"
 
             self.snapshot_mappings[vote_label] = {
@@ -456,7 +521,7 @@ class CoordinationTracker:
             "voted_for": voted_for,  # Real agent ID for compatibility
             "voted_for_label": voted_for_label,  # Answer label for display
             "reason": reason,
-            "available_answers": self.iteration_available_labels.copy(),
+            "available_answers": self.iteration_available_labels,
         }
         self._add_event(EventType.VOTE_CAST, agent_id, f"Voted for {voted_for_label}", context)
 
@@ -464,16 +529,10 @@ class CoordinationTracker:
         """Record when final agent is selected."""
         self.final_winner = agent_id
 
-        # Convert agent IDs to their answer labels
-        answer_labels = []
-        answers_with_labels = {}
-        for aid, answer_content in all_answers.items():
-            if aid in self.answers_by_agent and self.answers_by_agent[aid]:
-                # Get the latest answer label for this agent from regular answers
-                if self.answers_by_agent[aid]:
-                    latest_answer = self.answers_by_agent[aid][-1]
-                    answer_labels.append(latest_answer.label)
-                    answers_with_labels[latest_answer.label] = answer_content
+        # Convert agent IDs to the latest answer label for each agent from regular answers
+        answers_by_agent = self.answers_by_agent
+        answers_with_labels = {answers_by_agent[aid][-1].label: answer_content for aid, answer_content in all_answers.items() if answers_by_agent.get(aid)}
+        answer_labels = list(answers_with_labels)
 
         self.final_context = {
             "vote_summary": vote_summary,
@@ -499,7 +558,7 @@ class CoordinationTracker:
         final_answer_obj = AgentAnswer(
             agent_id=agent_id,
             content=final_answer,
-            timestamp=time.time(),
+            timestamp_ns=time.monotonic_ns(),
         )
 
         # Auto-generate final label
@@ -532,6 +591,7 @@ class CoordinationTracker:
         # Set the final round to be max round across all agents + 1
         final_round = self.max_round + 1
         self.agent_rounds[selected_agent_id] = final_round
+        self._max_round = final_round
         self.final_winner = selected_agent_id
 
         # Mark winner as starting final presentation
@@ -557,7 +617,8 @@ class CoordinationTracker:
             event_type = ACTION_TO_EVENT.get(action_type)
             if event_type is None:
                 raise ValueError(f"Unsupported ActionType: {action_type}")
-            message = f"{action_type.value.upper()}: {details}" if details else action_type.value.upper()
+            label = ACTION_LABELS[action_type]
+            message = f"{label}: {details}" if details else label
             self._add_event(event_type, agent_id, message)
 
     def _add_event(
@@ -568,27 +629,60 @@ class CoordinationTracker:
         context: Optional[Dict[str, Any]] = None,
     ):
         """Internal method to add an event."""
-        # Automatically include current iteration and round in context
-        if context is None:
-            context = {}
-        context = context.copy()  # Don't modify the original
-        context["iteration"] = self.current_iteration
-
-        # Include agent-specific round if agent_id is provided, otherwise use max round
-        if agent_id:
-            context["round"] = self.get_agent_round(agent_id)
-        else:
-            context["round"] = self.max_round
+        # Automatically include current iteration and round in context. The merged dict is
+        # built in one step, so the caller's dict (e.g. final_context) is never modified.
+        # Use the agent-specific round if agent_id is provided, otherwise the max round.
+        context = {
+            **(context or {}),
+            "iteration": self.current_iteration,
+            "round": self.get_agent_round(agent_id) if agent_id else self.max_round,
+        }
 
         event = CoordinationEvent(
-            timestamp=time.time(),
+            timestamp_ns=time.monotonic_ns(),
             event_type=event_type,
             agent_id=agent_id,
             details=details,
             context=context,
         )
+        self._events_by_type[event_type].append(len(self.events))
         self.events.append(event)
 
+        if self._event_log_file is not None:
+            self._write_event_line(event)
+
+    def _open_event_log(self, path: Path):
+        """Start streaming events to an NDJSON file, backfilling events recorded so far."""
+        self._close_event_log()
+        path = Path(path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._event_log_file = open(path, "wb", buffering=EVENT_LOG_BUFFER_SIZE)
+        except OSError as e:
+            logger.warning("Could not open coordination event log {}: {}", path, e)
+            return
+        for event in self.events:
+            self._write_event_line(event)
+
+    def _write_event_line(self, event: CoordinationEvent):
+        """Append one event to the NDJSON stream, flushing every EVENT_LOG_FLUSH_INTERVAL events."""
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(event, option=orjson.OPT_PASSTHROUGH_DATACLASS, default=self._json_default)
+        else:
+            line = json.dumps(event, default=self._json_default).encode("utf-8")
+        self._event_log_file.write(line + b"\n")
+        self._event_log_unflushed += 1
+        if self._event_log_unflushed >= EVENT_LOG_FLUSH_INTERVAL:
+            self._event_log_file.flush()
+            self._event_log_unflushed = 0
+
+    def _close_event_log(self):
+        """Flush and close the NDJSON event stream, if one is open."""
+        if self._event_log_file is not None:
+            self._event_log_file.close()
+            self._event_log_file = None
+            self._event_log_unflushed = 0
+
     def _end_session(self):
         """Mark the end of the coordination session."""
         self.end_time = time.time()
@@ -608,54 +702,61 @@ class CoordinationTracker:
             result[answer.label] = answer.content
         return result
 
+    def get_events_by_type(self, event_type: EventType) -> List[CoordinationEvent]:
+        """Get all events of one type in chronological order, without scanning the full log."""
+        events = self.events
+        return [events[i] for i in self._events_by_type.get(event_type, ())]
+
     def get_summary(self) -> Dict[str, Any]:
         """Get session summary statistics."""
         duration = (self.end_time or time.time()) - (self.start_time or time.time())
-        restart_count = len([e for e in self.events if e.event_type == EventType.RESTART_TRIGGERED])
 
         return {
             "duration": duration,
             "total_events": len(self.events),
-            "total_restarts": restart_count,
-            "total_answers": sum(len(answers) for answers in self.answers_by_agent.values()),
+            "total_restarts": len(self._events_by_type[EventType.RESTART_TRIGGERED]),
+            "total_answers": self.answer_count,
             "final_winner": self.final_winner,
             "agent_count": len(self.agent_ids),
         }
 
-    def save_coordination_logs(self, log_dir):
+    def save_coordination_logs(self, log_dir, pretty: bool = False):
         """Save all coordination data and create timeline visualization.
 
+        JSON files are written in compact form for machine consumption.
+
         Args:
             log_dir: Directory to save logs
-            format_style: "old", "new", or "both" (default)
+            pretty: Also write indented ``*.pretty.json`` copies for manual inspection
         """
+        # Streamed events are complete once the session is saved
+        self._close_event_log()
+
         try:
             log_dir = Path(log_dir)
             log_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save raw events with session metadata
-            events_file = log_dir / "coordination_events.json"
-            with open(events_file, "w", encoding="utf-8") as f:
-                events_data = [event.to_dict() for event in self.events]
-
-                # Include session metadata at the beginning of the JSON
-                session_data = {
-                    "session_metadata": {
-                        "user_prompt": self.user_prompt,
-                        "agent_ids": self.agent_ids,
-                        "start_time": self.start_time,
-                        "end_time": self.end_time,
-                        "final_winner": self.final_winner,
-                    },
-                    "events": events_data,
-                }
-                json.dump(session_data, f, indent=2, default=str)
+            # Save raw events with session metadata. Events are passed as
+            # dataclasses and serialized through their to_dict in one pass.
+            session_data = {
+                "session_metadata": {
+                    "user_prompt": self.user_prompt,
+                    "agent_ids": self.agent_ids,
+                    "start_time": self.start_time,
+                    "end_time": self.end_time,
+                    "final_winner": self.final_winner,
+                },
+                "events": self.events,
+            }
+            self._write_json(log_dir / "coordination_events.json", session_data)
+            if pretty:
+                self._write_json(log_dir / "coordination_events.pretty.json", session_data, indent=True)
 
             # Save snapshot mappings to track filesystem snapshots
             if self.snapshot_mappings:
-                snapshot_mappings_file = log_dir / "snapshot_mappings.json"
-                with open(snapshot_mappings_file, "w", encoding="utf-8") as f:
-                    json.dump(self.snapshot_mappings, f, indent=2, default=str)
+                self._write_json(log_dir / "snapshot_mappings.json", self.snapshot_mappings)
+                if pretty:
+                    self._write_json(log_dir / "snapshot_mappings.pretty.json", self.snapshot_mappings, indent=True)
 
             # Generate coordination table using the new table generator
             try:
@@ -669,6 +770,26 @@ class CoordinationTracker:
         except Exception as e:
             logger.warning(f"Failed to save coordination logs: {e}", exc_info=True)
 
+    @staticmethod
+    def _json_default(obj):
+        """Fallback serializer for the stdlib json path."""
+        if hasattr(obj, "to_dict"):
+            return obj.to_dict()
+        return str(obj)
+
+    def _write_json(self, path: Path, data: Any, indent: bool = False) -> None:
+        """Write data as JSON (compact unless indent is set), using orjson when it is installed."""
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_PASSTHROUGH_DATACLASS | (orjson.OPT_INDENT_2 if indent else 0)
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(data, option=option, default=self._json_default))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                if indent:
+                    json.dump(data, f, indent=2, default=self._json_default)
+                else:
+                    json.dump(data, f, separators=(",", ":"), default=self._json_default)
+
     def _generate_coordination_table(self, log_dir, session_data):
         """Generate coordination table using the create_coordination_table.py module."""
         try:
@@ -677,6 +798,9 @@ class CoordinationTracker:
                 CoordinationTableBuilder,
             )
 
+            # The table builder works on plain event dicts
+            session_data = {**session_data, "events": [event.to_dict() for event in self.events]}
+
             # Create the event-driven table directly from session data (includes metadata)
             builder = CoordinationTableBuilder(session_data)
             table_content = builder.generate_event_table()
@@ -693,9 +817,7 @@ class CoordinationTracker:
 
     def _get_agent_id_from_label(self, label: str) -> str:
         """Extract agent_id from a label like 'agent1.1' or 'agent2.final'."""
-        import re
-
-        match = re.match(r"agent(\d+)", label)
+        match = _AGENT_LABEL_RE.match(label)
         if match:
             agent_num = int(match.group(1))
             if 0 < agent_num <= len(self.agent_ids):
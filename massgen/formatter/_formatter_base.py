@@ -9,6 +9,13 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class FormatterBase(ABC):
     """Abstract base class for API parameter handlers."""
@@ -100,7 +107,9 @@ class FormatterBase(ABC):
         # Parse JSON string if needed
         if isinstance(args, str):
             try:
-                return json.loads(args) if args.strip() else {}
+                if not args.strip():
+                    return {}
+                return orjson.loads(args) if ORJSON_AVAILABLE else json.loads(args)
             except (json.JSONDecodeError, ValueError):
                 return {}
         return args if isinstance(args, dict) else {}
@@ -139,7 +148,11 @@ class FormatterBase(ABC):
         if isinstance(arguments, str):
             # If already a string, validate it's valid JSON
             try:
-                json.loads(arguments)  # Validate JSON
+                # Validate JSON
+                if ORJSON_AVAILABLE:
+                    orjson.loads(arguments)
+                else:
+                    json.loads(arguments)
                 return arguments
             except (json.JSONDecodeError, ValueError):
                 # If not valid JSON, treat as plain string and wrap in quotes
@@ -149,6 +162,8 @@ class FormatterBase(ABC):
         else:
             # Convert to JSON string
             try:
+                if ORJSON_AVAILABLE:
+                    return orjson.dumps(arguments, option=orjson.OPT_NON_STR_KEYS).decode()
                 return json.dumps(arguments)
             except (TypeError, ValueError) as e:
                 # Logger not imported at module level, use print for warning
@@ -7,11 +7,15 @@ Parses coordination_events.json and generates a formatted table showing
 the progression of agent interactions across rounds.
 """
 
+import io
 import json
 import os
+import re
 import sys
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 try:
     from rich import box
@@ -22,6 +26,172 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+# Fixed-width rules, built once at import
+_RULE_50 = "=" * 50
+_RULE_80 = "=" * 80
+# Blank 10-character round/event label column
+_BLANK_LABEL = " " * 10
+# Rich table separator cells, one per column
+_RICH_RULE_DOUBLE = "[dim bright_blue]" + "═" * 88 + "[/dim bright_blue]"
+_RICH_RULE_SOLID = "[dim green]" + "─" * 88 + "[/dim green]"
+_RICH_RULE_WAVY = "[dim cyan]" + "~" * 88 + "[/dim cyan]"
+
+
+@lru_cache(maxsize=4096)
+def format_answer_preview(text: str, max_length: Optional[int] = None) -> str:
+    """Collapse newlines in answer text for single-line display.
+
+    Text longer than max_length is truncated with "...". Only the kept prefix is
+    rewritten, so long answers are never copied in full just to build a preview.
+    The same answers are previewed in every table and round, so results are cached.
+    """
+    text = text.strip()
+    if max_length is not None and len(text) > max_length:
+        return text[:max_length].replace("\n", " ") + "..."
+    return text.replace("\n", " ")
+
+
+def join_until(items: Sequence[Any], sep: str, limit: int) -> str:
+    """Join items with sep, stopping once the result is longer than limit.
+
+    For text that is about to be cut to limit characters anyway: the result
+    keeps the same first limit characters and stays longer than limit whenever
+    the full join would, but long item lists are never joined in full.
+    """
+    parts: List[str] = []
+    length = -len(sep)
+    for item in items:
+        if length > limit:
+            break
+        part = str(item)
+        parts.append(part)
+        length += len(sep) + len(part)
+    return sep.join(parts)
+
+
+# Answer labels such as "agent1.1" or "agent2.final"; group 1 is the agent number
+_ANSWER_LABEL_RE = re.compile(r"agent(\d+)\.")
+
+# Statuses meaning an agent is currently producing output
+_ACTIVE_STATUSES = ("streaming", "answering")
+
+# Starting per-agent state for the event tables; each agent gets a shallow copy
+_INITIAL_EVENT_AGENT_STATE: Dict[str, Any] = {
+    "status": "idle",
+    "context": (),
+    "answer": None,
+    "vote": None,
+    "preview": None,
+    "last_streaming_logged": False,
+}
+
+# Round-table cell text for an agent with nothing to show yet
+_WAITING_CELL_TEXT = "(waiting)"
+
+# Shared stand-in for events recorded without a context dict; never mutated
+_EMPTY_CONTEXT: Dict[str, Any] = {}
+
+# status_change details seen so far, mapped to the bare status they name
+_STATUS_BY_DETAILS: Dict[str, str] = {}
+
+
+def parse_status_change(details: str) -> str:
+    """Strip the "Changed to status: " prefix from status_change details.
+
+    Sessions only ever produce a handful of distinct details strings, so each
+    one is parsed once and then answered from a dict lookup.
+    """
+    status = _STATUS_BY_DETAILS.get(details)
+    if status is None:
+        status = _STATUS_BY_DETAILS[details] = details.replace("Changed to status: ", "")
+    return status
+
+
+# Cells shown for agents not involved in the current event, keyed by status.
+# "answered" is handled separately because it shows the agent's answer label.
+_STATUS_CELLS = {
+    "streaming": "🔄 (streaming)",
+    "answering": "🔄 (answering)",
+    # Just show voted status without the value to avoid confusion
+    "voted": "✅ (voted)",
+    "completed": "✅ (completed)",
+    "final": "🎯 (final answer given)",
+    "idle": "⏳ (waiting)",
+}
+_RICH_STATUS_CELLS = {
+    "streaming": "[cyan]🔄 (streaming)[/cyan]",
+    "answering": "[cyan]🔄 (answering)[/cyan]",
+    "voted": "[green]✅ (voted)[/green]",
+    "completed": "[green]✅ (completed)[/green]",
+    "final": "[bold green]🎯 (final answer given)[/bold green]",
+    "idle": "[dim]⏳ (waiting)[/dim]",
+}
+
+
+def status_cell(agent_state: Dict[str, Any]) -> str:
+    """Text table cell for an agent that is not performing the current event"""
+    status = agent_state["status"]
+    if status == "answered":
+        return f"✅ Answered: {agent_state['answer']}" if agent_state["answer"] else "✅ (answered)"
+    cell = _STATUS_CELLS.get(status)
+    return cell if cell is not None else f"({status})"
+
+
+def rich_status_cell(agent_state: Dict[str, Any]) -> str:
+    """Rich table cell for an agent that is not performing the current event"""
+    status = agent_state["status"]
+    if status == "answered":
+        return f"[green]✅ Answered: {agent_state['answer']}[/green]" if agent_state["answer"] else "[green]✅ (answered)[/green]"
+    cell = _RICH_STATUS_CELLS.get(status)
+    return cell if cell is not None else f"[dim]({status})[/dim]"
+
+
+def _rich_streaming_start_cell(agent_state: Dict[str, Any], args: Tuple[Any, ...]) -> str:
+    context = agent_state["context"]
+    context_str = f"[dim blue]📋 Context: \\[{', '.join(context)}][/dim blue]\n" if context else "[dim blue]📋 Context: \\[][/dim blue]\n"
+    return context_str + "[bold cyan]💭 Started streaming[/bold cyan]"
+
+
+def _rich_restart_completed_cell(agent_state: Dict[str, Any], args: Tuple[Any, ...]) -> str:
+    return f"[bold green]✅ RESTART COMPLETED (Restart {args[0]})[/bold green]"
+
+
+def _rich_new_answer_cell(agent_state: Dict[str, Any], args: Tuple[Any, ...]) -> str:
+    label, preview = args[0], args[1] if len(args) > 1 else ""
+    cell = f"[bold green]✨ NEW ANSWER: {label}[/bold green]"
+    if preview:
+        preview_truncated = format_answer_preview(preview, 80)
+        cell += f"\n[dim white]👁️  Preview: {preview_truncated}[/dim white]"
+    return cell
+
+
+def _rich_vote_cell(agent_state: Dict[str, Any], args: Tuple[Any, ...]) -> str:
+    vote, reason = args[0], args[1] if len(args) > 1 else ""
+    cell = f"[bold cyan]🗳️  VOTE: {vote}[/bold cyan]"
+    if reason:
+        reason_preview = format_answer_preview(reason, 50)
+        cell += f"\n[italic dim]💭 Reason: {reason_preview}[/italic dim]"
+    return cell
+
+
+def _rich_final_answer_cell(agent_state: Dict[str, Any], args: Tuple[Any, ...]) -> str:
+    label, preview = args[0], args[1] if len(args) > 1 else ""
+    cell = f"[bold green]🎯 FINAL ANSWER: {label}[/bold green]"
+    if preview:
+        preview_truncated = format_answer_preview(preview, 80)
+        cell += f"\n[dim white]👁️  Preview: {preview_truncated}[/dim white]"
+    return cell
+
+
+# Active-agent cell formatters for the rich event table, keyed by row type
+_RICH_EVENT_CELL_FORMATTERS = {
+    "streaming_start": _rich_streaming_start_cell,
+    "restart_completed": _rich_restart_completed_cell,
+    "new_answer": _rich_new_answer_cell,
+    "vote": _rich_vote_cell,
+    "final_answer": _rich_final_answer_cell,
+}
+
 
 def display_scrollable_content_macos(
     console: Console,
@@ -51,7 +221,7 @@ def display_scrollable_content_macos(
         console.print(item)
 
     # Show instructions and wait for input
-    console.print("\n" + "=" * 80)
+    console.print("\n" + _RULE_80)
     console.print(
         "[bright_cyan]Press Enter to return to agent selector...[/bright_cyan]",
     )
@@ -75,28 +245,32 @@ def display_with_native_pager(
     import tempfile
 
     try:
+        # Render all content into one buffer so the temporary file gets a single write
+        buf = io.StringIO()
+        if title:
+            buf.write(f"{title}\n")
+            buf.write("=" * len(title) + "\n\n")
+
+        # Convert Rich content to plain text
+        for item in content_items:
+            if hasattr(item, "__rich_console__"):
+                # For Rich objects, render to plain text
+                with console.capture() as capture:
+                    console.print(item)
+                buf.write(capture.get() + "\n")
+            else:
+                buf.write(str(item) + "\n")
+
+        buf.write("\n" + _RULE_80 + "\n")
+        buf.write("Press 'q' to quit, arrow keys or j/k to scroll\n")
+
         # Create temporary file with content
         with tempfile.NamedTemporaryFile(
             mode="w",
             suffix=".txt",
             delete=False,
         ) as tmp_file:
-            if title:
-                tmp_file.write(f"{title}\n")
-                tmp_file.write("=" * len(title) + "\n\n")
-
-            # Convert Rich content to plain text
-            for item in content_items:
-                if hasattr(item, "__rich_console__"):
-                    # For Rich objects, render to plain text
-                    with console.capture() as capture:
-                        console.print(item)
-                    tmp_file.write(capture.get() + "\n")
-                else:
-                    tmp_file.write(str(item) + "\n")
-
-            tmp_file.write("\n" + "=" * 80 + "\n")
-            tmp_file.write("Press 'q' to quit, arrow keys or j/k to scroll\n")
+            tmp_file.write(buf.getvalue())
             tmp_file_path = tmp_file.name
 
         # Use system pager
@@ -148,7 +322,7 @@ def get_optimal_display_method() -> Any:
         return "rich_pager"  # Use Rich's pager on Linux/Windows
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """Track state for a single agent"""
 
@@ -157,7 +331,7 @@ class AgentState:
     answer_preview: Optional[str] = None
     vote: Optional[str] = None
     vote_reason: Optional[str] = None
-    context: List[str] = field(default_factory=list)
+    context: Sequence[str] = ()  # Shared label snapshot from the event; never mutated
     round: int = 0
     is_final: bool = False
     has_final_answer: bool = False
@@ -165,7 +339,7 @@ class AgentState:
     has_voted: bool = False  # Track if agent has already voted
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundData:
     """Data for a single round"""
 
@@ -185,8 +359,15 @@ class CoordinationTableBuilder:
             self.events = data if isinstance(data, list) else []
             self.session_metadata = {}
 
+        # Every pass below walks events chronologically, so order them once here
+        self.events = self._order_events(self.events)
+        self._events_by_type, self._event_rounds = self._index_events()
         self.agents = self._extract_agents()
+        self._separator_cache: Dict[Tuple[str, int], str] = {}
+        self._header_row_cache: Dict[Tuple[str, int], str] = {}
+        self._cell_content_cache: Dict[Tuple[Any, ...], List[str]] = {}
         self.agent_mapping = self._create_agent_mapping()
+        self.agent_display_names = {agent_id: f"Agent {agent_num}" for agent_id, agent_num in self.agent_mapping.items()}
         self.agent_answers = self._extract_answer_previews()
         self.final_winner = self._find_final_winner()
         self.final_round_num = self._find_final_round_number()
@@ -194,6 +375,24 @@ class CoordinationTableBuilder:
         self.rounds = self._process_events()
         self.user_question = self._extract_user_question()
 
+    @staticmethod
+    def _order_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return events in timestamp order, sorting only if they are out of order"""
+        timestamps = [event.get("timestamp", 0) for event in events]
+        if all(a <= b for a, b in zip(timestamps, timestamps[1:])):
+            return events
+        return sorted(events, key=lambda event: event.get("timestamp", 0))
+
+    def _index_events(self) -> Tuple[Dict[str, List[Dict[str, Any]]], Set[int]]:
+        """Group events by type and collect their round numbers in one pass"""
+        events_by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        event_rounds: Set[int] = set()
+        for event in self.events:
+            events_by_type[event["event_type"]].append(event)
+            context = event.get("context") or _EMPTY_CONTEXT
+            event_rounds.add(context.get("round", 0))
+        return events_by_type, event_rounds
+
     def _extract_agents(self) -> List[str]:
         """Extract unique agent IDs from events using original orchestrator order"""
         # First try to get agent order from session metadata
@@ -216,6 +415,10 @@ class CoordinationTableBuilder:
             mapping[agent_id] = str(i)
         return mapping
 
+    def _get_agent_display_name(self, agent_id: Optional[str]) -> str:
+        """Return the "Agent N" name for an agent, built once per builder"""
+        return self.agent_display_names.get(agent_id, "Agent ?")
+
     def _extract_user_question(self) -> str:
         """Extract the user question from session metadata"""
         return str(
@@ -225,85 +428,67 @@ class CoordinationTableBuilder:
     def _extract_answer_previews(self) -> Dict[str, str]:
         """Extract the actual answer text for each agent using explicit mapping"""
         answers = {}
+        agents_by_number = {agent_num: agent_id for agent_id, agent_num in self.agent_mapping.items()}
 
         # Try to get from final_agent_selected event
-        for event in self.events:
-            if event["event_type"] == "final_agent_selected":
-                context = event.get("context", {})
-                answers_for_context = context.get("answers_for_context", {})
-
-                # Map answers to agents using explicit agent mapping
-                for label, answer in answers_for_context.items():
-                    # Direct match: label is an agent_id
-                    if label in self.agents:
-                        answers[label] = answer
-                    else:
-                        # Map answer label to agent using our explicit mapping
-                        # For labels like "agent1.1", extract the number and
-                        # find matching agent
-                        if label.startswith("agent") and "." in label:
-                            try:
-                                # Extract agent number from label (e.g.,
-                                # "agent1.1" -> "1")
-                                agent_num = label.split(".")[0][5:]  # Remove "agent" prefix
-                                # Find agent with this number in our mapping
-                                for (
-                                    agent_id,
-                                    mapped_num,
-                                ) in self.agent_mapping.items():
-                                    if mapped_num == agent_num:
-                                        answers[agent_id] = answer
-                                        break
-                            except (IndexError, ValueError):
-                                continue
+        for event in self._events_by_type.get("final_agent_selected", ()):
+            context = event.get("context") or _EMPTY_CONTEXT
+            answers_for_context = context.get("answers_for_context", {})
+
+            # Map answers to agents using explicit agent mapping
+            for label, answer in answers_for_context.items():
+                # Direct match: label is an agent_id
+                if label in self.agents:
+                    answers[label] = answer
+                else:
+                    # Map answer label to agent using our explicit mapping
+                    # For labels like "agent1.1", extract the number and
+                    # find matching agent
+                    match = _ANSWER_LABEL_RE.match(label)
+                    if match:
+                        agent_id = agents_by_number.get(match.group(1))
+                        if agent_id is not None:
+                            answers[agent_id] = answer
 
         return answers
 
     def _find_final_winner(self) -> Optional[str]:
         """Find which agent was selected as the final winner"""
-        for event in self.events:
-            if event["event_type"] == "final_agent_selected":
-                agent_id = event.get("agent_id")
-                return agent_id if agent_id is not None else None
-        return None
+        selected = self._events_by_type.get("final_agent_selected")
+        return selected[0].get("agent_id") if selected else None
 
     def _find_final_round_number(self) -> Optional[int]:
         """Find which round number is the final round"""
-        for event in self.events:
-            if event["event_type"] == "final_round_start":
-                context = event.get("context", {})
-                round_num = context.get("round", context.get("final_round"))
-                return int(round_num) if round_num is not None else None
+        final_round_starts = self._events_by_type.get("final_round_start")
+        if final_round_starts:
+            context = final_round_starts[0].get("context") or _EMPTY_CONTEXT
+            round_num = context.get("round", context.get("final_round"))
+            return int(round_num) if round_num is not None else None
 
         # If no explicit final round, check for final_answer events
-        for event in self.events:
-            if event["event_type"] == "final_answer":
-                context = event.get("context", {})
-                round_num = context.get("round")
-                return int(round_num) if round_num is not None else None
+        final_answers = self._events_by_type.get("final_answer")
+        if final_answers:
+            context = final_answers[0].get("context") or _EMPTY_CONTEXT
+            round_num = context.get("round")
+            return int(round_num) if round_num is not None else None
 
         return None
 
     def _track_vote_rounds(self) -> Dict[str, int]:
         """Track which round each agent cast their vote"""
         vote_rounds = {}
-        for event in self.events:
-            if event["event_type"] == "vote_cast":
-                agent_id = event.get("agent_id")
-                context = event.get("context", {})
-                round_num = context.get("round", 0)
-                if agent_id:
-                    vote_rounds[agent_id] = round_num
+        for event in self._events_by_type.get("vote_cast", ()):
+            agent_id = event.get("agent_id")
+            context = event.get("context") or _EMPTY_CONTEXT
+            round_num = context.get("round", 0)
+            if agent_id:
+                vote_rounds[agent_id] = round_num
         return vote_rounds
 
     def _process_events(self) -> List[RoundData]:
         """Process events into rounds with proper organization"""
-        # Find all unique rounds
-        all_rounds = set()
-        for event in self.events:
-            context = event.get("context", {})
-            round_num = context.get("round", 0)
-            all_rounds.add(round_num)
+        # All unique rounds were collected while indexing
+        all_rounds = self._event_rounds
 
         # Exclude final round from regular rounds if it exists
         regular_rounds = sorted(
@@ -323,30 +508,22 @@ class CoordinationTableBuilder:
         for event in self.events:
             event_type = event["event_type"]
             agent_id = event.get("agent_id")
-            context = event.get("context", {})
+            context = event.get("context") or _EMPTY_CONTEXT
 
             if agent_id and agent_id in self.agents:
-                # Determine the round for this event
+                # Determine the round for this event; votes and answers carry
+                # it in "round", restarts may override it with "agent_round"
                 round_num = context.get("round", 0)
-
-                # Special handling for votes and answers that specify rounds
-                if event_type == "vote_cast":
-                    round_num = context.get("round", 0)
-                elif event_type == "new_answer":
-                    round_num = context.get("round", 0)
-                elif event_type == "restart_completed":
-                    round_num = context.get(
-                        "agent_round",
-                        context.get("round", 0),
-                    )
-                elif event_type == "final_answer":
-                    round_num = self.final_round_num if self.final_round_num else context.get("round", 0)
+                if event_type == "restart_completed":
+                    round_num = context.get("agent_round", round_num)
+                elif event_type == "final_answer" and self.final_round_num:
+                    round_num = self.final_round_num
 
                 if round_num in rounds:
                     agent_state = rounds[round_num][agent_id]
 
                     if event_type == "context_received":
-                        labels = context.get("available_answer_labels", [])
+                        labels = context.get("available_answer_labels", ())
                         agent_state.context = labels
 
                     elif event_type == "new_answer":
@@ -376,10 +553,7 @@ class CoordinationTableBuilder:
                         agent_state.is_selected_winner = True
 
                     elif event_type == "status_change":
-                        status = event.get("details", "").replace(
-                            "Changed to status: ",
-                            "",
-                        )
+                        status = parse_status_change(event.get("details", ""))
                         agent_state.status = status
 
         # Mark non-winner as completed in FINAL round
@@ -395,14 +569,7 @@ class CoordinationTableBuilder:
         for r in regular_rounds:
             round_type = f"R{r}"
             round_list.append(
-                RoundData(
-                    r,
-                    round_type,
-                    rounds.get(
-                        r,
-                        {agent: AgentState() for agent in self.agents},
-                    ),
-                ),
+                RoundData(r, round_type, rounds[r]),
             )
 
         # Add FINAL round if exists
@@ -417,6 +584,28 @@ class CoordinationTableBuilder:
 
         return round_list
 
+    def _row_separator(self, style: str, cell_width: int) -> str:
+        """Get the full-width row separator for a line style, built once per cell width"""
+        key = (style, cell_width)
+        separator = self._separator_cache.get(key)
+        if separator is None:
+            separator = "|" + style * 10 + "+" + (style * cell_width + "+") * len(self.agents)
+            self._separator_cache[key] = separator
+        return separator
+
+    def _agent_header_row(self, row_label: str, agent_title: Callable[[str], str], cell_width: int) -> str:
+        """Get a header row of centered agent column titles, built once per row label and cell width"""
+        key = (row_label, cell_width)
+        header = self._header_row_cache.get(key)
+        if header is None:
+            parts = [row_label]
+            for agent in self.agents:
+                parts.append(self._format_cell(agent_title(agent), cell_width))
+                parts.append("|")
+            header = "".join(parts)
+            self._header_row_cache[key] = header
+        return header
+
     def _format_cell(self, content: str, width: int) -> str:
         """Format content to fit within cell width, centered"""
         if not content:
@@ -429,6 +618,36 @@ class CoordinationTableBuilder:
             truncated = content[: width - 3] + "..."
             return truncated.center(width)
 
+    def _cached_cell_content(
+        self,
+        build: Callable[[AgentState, str, str, int], List[str]],
+        agent_state: AgentState,
+        round_type: str,
+        agent_id: str,
+        round_num: int,
+    ) -> List[str]:
+        """Build an agent's round cell once per distinct cell state.
+
+        The cell builders only read these state fields and whether the round
+        is FINAL, and agents often keep the same state across many rounds.
+        Cached lists are shared between rounds and must not be modified.
+        """
+        key = (
+            build.__name__,
+            round_type == "FINAL",
+            agent_state.status,
+            tuple(agent_state.context),
+            agent_state.current_answer,
+            agent_state.vote,
+            agent_state.vote_reason,
+            agent_state.has_final_answer,
+            agent_state.answer_preview,
+        )
+        content = self._cell_content_cache.get(key)
+        if content is None:
+            content = self._cell_content_cache[key] = build(agent_state, round_type, agent_id, round_num)
+        return content
+
     def _build_agent_cell_content(
         self,
         agent_state: AgentState,
@@ -437,6 +656,11 @@ class CoordinationTableBuilder:
         round_num: int,
     ) -> List[str]:
         """Build the content for an agent's cell in a round"""
+        # Most cells belong to agents that did nothing this round; every branch
+        # below would end in "(waiting)" for them, so skip the checks
+        if agent_state.status == "idle" and not agent_state.current_answer and not agent_state.vote and not agent_state.has_final_answer:
+            return [_WAITING_CELL_TEXT]
+
         lines = []
 
         # Determine if we should show context (but not for voting agents)
@@ -445,7 +669,7 @@ class CoordinationTableBuilder:
         show_context = (
             (agent_state.current_answer and not agent_state.vote)
             or agent_state.has_final_answer  # Agent answered (but didn't vote)
-            or agent_state.status in ["streaming", "answering"]  # Agent has final answer  # Agent is actively working
+            or agent_state.status in _ACTIVE_STATUSES  # Agent has final answer  # Agent is actively working
         )
 
         # Don't show context for completed agents in FINAL round
@@ -476,10 +700,7 @@ class CoordinationTableBuilder:
             if agent_state.has_final_answer:
                 lines.append(f"FINAL ANSWER: {agent_state.current_answer}")
                 if agent_state.answer_preview:
-                    clean_preview = agent_state.answer_preview.replace(
-                        "\n",
-                        " ",
-                    ).strip()
+                    clean_preview = format_answer_preview(agent_state.answer_preview)
                     lines.append(f"Preview: {clean_preview}")
                 else:
                     lines.append("Preview: [Answer not available]")
@@ -492,15 +713,12 @@ class CoordinationTableBuilder:
             # Agent provided an answer in this round
             lines.append(f"NEW ANSWER: {agent_state.current_answer}")
             if agent_state.answer_preview:
-                clean_preview = agent_state.answer_preview.replace(
-                    "\n",
-                    " ",
-                ).strip()
+                clean_preview = format_answer_preview(agent_state.answer_preview)
                 lines.append(f"Preview: {clean_preview}")
             else:
                 lines.append("Preview: [Answer not available]")
 
-        elif agent_state.status in ["streaming", "answering"]:
+        elif agent_state.status in _ACTIVE_STATUSES:
             lines.append("(answering)")
 
         elif agent_state.status == "voted":
@@ -527,35 +745,33 @@ class CoordinationTableBuilder:
         else:  # 5+ agents
             cell_width = 25
         total_width = 10 + (cell_width + 1) * num_agents + 1
+        border = "+" + "-" * (total_width - 2) + "+"
 
         lines = []
 
         # Helper function to add separator
         def add_separator(style: str = "-") -> None:
-            lines.append(
-                "|" + style * 10 + "+" + (style * cell_width + "+") * num_agents,
-            )
+            lines.append(self._row_separator(style, cell_width))
 
         # Add legend/explanation section
         lines.extend(self._create_legend_section(cell_width))
 
         # Top border
-        lines.append("+" + "-" * (total_width - 2) + "+")
+        lines.append(border)
 
         # Header row
-        header = "|   Event  |"
-        for agent in self.agents:
-            # Use format "Agent 1 (full_agent_id)"
-            agent_num = self.agent_mapping.get(agent, "?")
-            agent_name = f"Agent {agent_num} ({agent})"
-            header += self._format_cell(agent_name, cell_width) + "|"
-        lines.append(header)
-
-        # Header separator
+        # Use format "Agent 1 (full_agent_id)"
         lines.append(
-            "|" + "-" * 10 + "+" + ("-" * cell_width + "+") * num_agents,
+            self._agent_header_row(
+                "|   Event  |",
+                lambda agent: f"Agent {self.agent_mapping.get(agent, '?')} ({agent})",
+                cell_width,
+            ),
         )
 
+        # Header separator
+        lines.append(self._row_separator("-", cell_width))
+
         # User question row
         question_row = "|   USER   |"
         question_width = cell_width * num_agents + (num_agents - 1)
@@ -564,28 +780,16 @@ class CoordinationTableBuilder:
         lines.append(question_row)
 
         # Double separator
-        lines.append(
-            "|" + "=" * 10 + "+" + ("=" * cell_width + "+") * num_agents,
-        )
+        lines.append(self._row_separator("=", cell_width))
 
         # Process events chronologically
-        agent_states: Dict[str, Dict[str, Any]] = {
-            agent: {
-                "status": "idle",
-                "context": [],
-                "answer": None,
-                "vote": None,
-                "preview": None,
-                "last_streaming_logged": False,
-            }
-            for agent in self.agents
-        }
+        agent_states: Dict[str, Dict[str, Any]] = {agent: dict(_INITIAL_EVENT_AGENT_STATE) for agent in self.agents}
         event_num = 1
 
         for event in self.events:
             event_type = event["event_type"]
             agent_id = event.get("agent_id")
-            context = event.get("context", {})
+            context = event.get("context") or _EMPTY_CONTEXT
 
             # Skip session-level events - just show the actual coordination
             # work
@@ -599,16 +803,13 @@ class CoordinationTableBuilder:
             # Update agent state and create table row
 
             if event_type == "status_change":
-                status = event.get("details", "").replace(
-                    "Changed to status: ",
-                    "",
-                )
+                status = parse_status_change(event.get("details", ""))
                 old_status = agent_states[agent_id]["status"]
                 agent_states[agent_id]["status"] = status
 
                 # Only log the FIRST streaming status for each agent, not
                 # repetitive ones
-                if status in ["streaming", "answering"]:
+                if status in _ACTIVE_STATUSES:
                     # Skip streaming that happens after voting - we'll show
                     # final_answer directly
                     if old_status == "voted":
@@ -617,15 +818,16 @@ class CoordinationTableBuilder:
                     else:
                         # Only show if this is a meaningful transition (not
                         # streaming -> streaming)
-                        if old_status not in ["streaming", "answering"] or not agent_states[agent_id]["last_streaming_logged"]:
+                        if old_status not in _ACTIVE_STATUSES or not agent_states[agent_id]["last_streaming_logged"]:
                             # Create multi-line event with context and
                             # streaming start
                             event_lines = []
                             # Show context when starting to stream
                             context = agent_states[agent_id]["context"]
                             if context:
-                                if isinstance(context, list):
-                                    context_str = ", ".join(str(c) for c in context)
+                                if isinstance(context, (list, tuple)):
+                                    # The cell keeps at most cell_width characters
+                                    context_str = join_until(context, ", ", cell_width)
                                 else:
                                     context_str = str(context)
                                 event_lines.append(
@@ -647,12 +849,12 @@ class CoordinationTableBuilder:
                             add_separator("-")  # Add separator after event
                             agent_states[agent_id]["last_streaming_logged"] = True
                             event_num += 1
-                elif status not in ["streaming", "answering"]:
+                else:
                     # Reset the flag when status changes to something else
                     agent_states[agent_id]["last_streaming_logged"] = False
 
             elif event_type == "context_received":
-                labels = context.get("available_answer_labels", [])
+                labels = context.get("available_answer_labels", ())
                 agent_states[agent_id]["context"] = labels
                 # Don't create a separate row for context, it will be shown
                 # with answers/votes
@@ -660,8 +862,7 @@ class CoordinationTableBuilder:
             elif event_type == "restart_triggered":
                 # Show restart trigger event spanning both columns (it's a
                 # coordination event)
-                agent_num = self.agent_mapping.get(agent_id, "?")
-                agent_name = f"Agent {agent_num}"
+                agent_name = self._get_agent_display_name(agent_id)
                 lines.extend(
                     self._create_system_row(
                         f"🔁 {agent_name} RESTART TRIGGERED",
@@ -707,7 +908,7 @@ class CoordinationTableBuilder:
                     # Context already shown when streaming started
                     event_lines.append(f"✨ NEW ANSWER: {label}")
                     if preview:
-                        clean_preview = preview.replace("\n", " ").strip()
+                        clean_preview = format_answer_preview(preview)
                         event_lines.append(f"👁️  Preview: {clean_preview}")
 
                     lines.extend(
@@ -735,8 +936,7 @@ class CoordinationTableBuilder:
                     # Context already shown when streaming started
                     event_lines.append(f"🗳️  VOTE: {vote}")
                     if reason:
-                        clean_reason = reason.replace("\n", " ").strip()
-                        reason_str = clean_reason[:50] + "..." if len(clean_reason) > 50 else clean_reason
+                        reason_str = format_answer_preview(reason, 50)
                         event_lines.append(f"💭 Reason: {reason_str}")
 
                     lines.extend(
@@ -753,8 +953,7 @@ class CoordinationTableBuilder:
 
             elif event_type == "final_agent_selected":
                 # Show winner selection using agent mapping
-                agent_num = self.agent_mapping.get(agent_id, "?")
-                winner_name = f"Agent {agent_num}"
+                winner_name = self._get_agent_display_name(agent_id)
                 lines.extend(
                     self._create_system_row(
                         f"🏆 {winner_name} selected as winner",
@@ -781,7 +980,7 @@ class CoordinationTableBuilder:
                     event_lines.append(f"🎯 FINAL ANSWER: {label}")
                     if agent_states[agent_id]["preview"]:
                         preview_text = str(agent_states[agent_id]["preview"])
-                        clean_preview = preview_text.replace("\n", " ").strip()
+                        clean_preview = format_answer_preview(preview_text)
                         event_lines.append(f"👁️  Preview: {clean_preview}")
 
                     lines.extend(
@@ -800,7 +999,7 @@ class CoordinationTableBuilder:
         lines.extend(self._create_summary_section(agent_states, cell_width))
 
         # Bottom border
-        lines.append("+" + "-" * (total_width - 2) + "+")
+        lines.append(border)
 
         return "\n".join(lines)
 
@@ -813,11 +1012,9 @@ class CoordinationTableBuilder:
         cell_width: int,
     ) -> list:
         """Create a table row for a single event"""
-        row = "|"
-
         # Event number
         event_label = f"    E{event_num}   "
-        row += event_label[-10:].rjust(10) + "|"
+        parts = ["|", event_label[-10:].rjust(10), "|"]
 
         # Agent cells
         for agent in self.agents:
@@ -827,30 +1024,12 @@ class CoordinationTableBuilder:
             else:
                 # Show current status for other agents - prioritize active
                 # states
-                status = agent_states[agent]["status"]
-                if status in ["streaming", "answering"]:
-                    cell_content = f"🔄 ({status})"
-                elif status == "voted":
-                    # Just show voted status without the value to avoid
-                    # confusion
-                    cell_content = "✅ (voted)"
-                elif status == "answered":
-                    if agent_states[agent]["answer"]:
-                        cell_content = f"✅ Answered: {agent_states[agent]['answer']}"
-                    else:
-                        cell_content = "✅ (answered)"
-                elif status == "completed":
-                    cell_content = "✅ (completed)"
-                elif status == "final":
-                    cell_content = "🎯 (final answer given)"
-                elif status == "idle":
-                    cell_content = "⏳ (waiting)"
-                else:
-                    cell_content = f"({status})"
+                cell_content = status_cell(agent_states[agent])
 
-            row += self._format_cell(cell_content, cell_width) + "|"
+            parts.append(self._format_cell(cell_content, cell_width))
+            parts.append("|")
 
-        return [row]
+        return ["".join(parts)]
 
     def _create_multi_line_event_row(
         self,
@@ -861,53 +1040,32 @@ class CoordinationTableBuilder:
         cell_width: int,
     ) -> list:
         """Create multiple table rows for a single event with multiple lines of content"""
-        rows = []
-
-        for line_idx, event_line in enumerate(event_lines):
-            row = "|"
+        if not event_lines:
+            return []
 
-            # Event number (only on first line)
-            if line_idx == 0:
-                event_label = f"    E{event_num}   "
-                row += event_label[-10:].rjust(10) + "|"
+        # First line: event number, with the current status for other agents
+        # - prioritize active states
+        event_label = f"    E{event_num}   "
+        parts = ["|", event_label[-10:].rjust(10), "|"]
+        for agent in self.agents:
+            # The active agent is performing the event
+            cell_content = event_lines[0] if agent == active_agent else status_cell(agent_states[agent])
+            parts.append(self._format_cell(cell_content, cell_width))
+            parts.append("|")
+        rows = ["".join(parts)]
+
+        # Continuation lines only fill the active agent's column, so the blank
+        # cells on either side of it are the same on every line
+        blank_cell = " " * cell_width + "|"
+        active_index = self.agents.index(active_agent) if active_agent in self.agents else len(self.agents)
+        left = "|" + _BLANK_LABEL + "|" + blank_cell * active_index
+        right = "|" + blank_cell * (len(self.agents) - active_index - 1)
+
+        for event_line in event_lines[1:]:
+            if active_index == len(self.agents):
+                rows.append(left)
             else:
-                row += " " * 10 + "|"
-
-            # Agent cells
-            for agent in self.agents:
-                if agent == active_agent:
-                    # This agent is performing the event
-                    cell_content = event_line
-                else:
-                    # Show current status for other agents (only on first line)
-                    # - prioritize active states
-                    if line_idx == 0:
-                        status = agent_states[agent]["status"]
-                        if status in ["streaming", "answering"]:
-                            cell_content = f"🔄 ({status})"
-                        elif status == "voted":
-                            # Just show voted status without the value to avoid
-                            # confusion
-                            cell_content = "✅ (voted)"
-                        elif status == "answered":
-                            if agent_states[agent]["answer"]:
-                                cell_content = f"✅ Answered: {agent_states[agent]['answer']}"
-                            else:
-                                cell_content = "✅ (answered)"
-                        elif status == "completed":
-                            cell_content = "✅ (completed)"
-                        elif status == "final":
-                            cell_content = "🎯 (final answer given)"
-                        elif status == "idle":
-                            cell_content = "⏳ (waiting)"
-                        else:
-                            cell_content = f"({status})"
-                    else:
-                        cell_content = ""
-
-                row += self._format_cell(cell_content, cell_width) + "|"
-
-            rows.append(row)
+                rows.append(left + self._format_cell(event_line, cell_width) + right)
 
         return rows
 
@@ -915,17 +1073,23 @@ class CoordinationTableBuilder:
         """Create a system announcement row that spans all columns"""
         total_width = 10 + (cell_width + 1) * len(self.agents) + 1
 
-        # Separator line
-        separator = "|" + "-" * 10 + "+" + ("-" * cell_width + "+") * len(self.agents)
+        # Separator line (shared above and below the message)
+        separator = self._row_separator("-", cell_width)
 
         # Message row
         message_width = total_width - 3  # Account for borders
         message_row = "|" + message.center(message_width) + "|"
 
-        # Another separator
-        separator2 = "|" + "-" * 10 + "+" + ("-" * cell_width + "+") * len(self.agents)
+        return [separator, message_row, separator]
 
-        return [separator, message_row, separator2]
+    def _count_restarts_by_agent(self) -> Dict[str, int]:
+        """Count restart_completed events per known agent in one pass"""
+        restart_counts: Dict[str, int] = defaultdict(int)
+        for event in self._events_by_type.get("restart_completed", ()):
+            agent_id = event.get("agent_id")
+            if agent_id in self.agents:
+                restart_counts[agent_id] += 1
+        return restart_counts
 
     def _create_summary_section(
         self,
@@ -938,15 +1102,12 @@ class CoordinationTableBuilder:
         # Calculate statistics
         total_answers = sum(1 for agent in self.agents if agent_states[agent]["answer"])
         total_votes = sum(1 for agent in self.agents if agent_states[agent]["vote"])
-        total_restarts = len(
-            [e for e in self.events if e["event_type"] == "restart_completed"],
-        )
+        total_restarts = len(self._events_by_type.get("restart_completed", ()))
 
         # Count per-agent stats
         agent_stats = {}
         for agent in self.agents:
-            agent_num = self.agent_mapping.get(agent, "?")
-            agent_name = f"Agent {agent_num}"
+            agent_name = self._get_agent_display_name(agent)
             agent_stats[agent_name] = {
                 "answers": 1 if agent_states[agent]["answer"] else 0,
                 "votes": 1 if agent_states[agent]["vote"] else 0,
@@ -954,84 +1115,65 @@ class CoordinationTableBuilder:
             }
 
         # Count restarts per agent
-        for event in self.events:
-            if event["event_type"] == "restart_completed" and event.get("agent_id") in self.agents:
-                agent_id = event["agent_id"]
-                agent_num = self.agent_mapping.get(agent_id, "?")
-                agent_name = f"Agent {agent_num}"
-                if agent_name not in agent_stats:
-                    agent_stats[agent_name] = {"restarts": 0}
-                if "restarts" not in agent_stats[agent_name]:
-                    agent_stats[agent_name]["restarts"] = 0
-                agent_stats[agent_name]["restarts"] += 1
+        for agent_id, count in self._count_restarts_by_agent().items():
+            agent_stats[self._get_agent_display_name(agent_id)]["restarts"] = count
 
         # Create separator
-        separator = "|" + "=" * 10 + "+" + ("=" * cell_width + "+") * len(self.agents)
+        separator = self._row_separator("=", cell_width)
         lines.append(separator)
 
         # Summary header
-        summary_header = "|  SUMMARY |"
-        for agent in self.agents:
-            agent_num = self.agent_mapping.get(agent, "?")
-            agent_name = f"Agent {agent_num}"
-            summary_header += self._format_cell(agent_name, cell_width) + "|"
-        lines.append(summary_header)
+        lines.append(self._agent_header_row("|  SUMMARY |", self._get_agent_display_name, cell_width))
 
         # Separator
-        lines.append(
-            "|" + "-" * 10 + "+" + ("-" * cell_width + "+") * len(self.agents),
-        )
+        lines.append(self._row_separator("-", cell_width))
 
         # Answers row
-        answers_row = "| Answers  |"
+        answers_parts = ["| Answers  |"]
         for agent in self.agents:
-            agent_num = self.agent_mapping.get(agent, "?")
-            agent_name = f"Agent {agent_num}"
+            agent_name = self._get_agent_display_name(agent)
             count = agent_stats.get(agent_name, {}).get("answers", 0)
-            answers_row += (
+            answers_parts.append(
                 self._format_cell(
                     f"{count} answer{'s' if count != 1 else ''}",
                     cell_width,
-                )
-                + "|"
+                ),
             )
-        lines.append(answers_row)
+            answers_parts.append("|")
+        lines.append("".join(answers_parts))
 
         # Votes row
-        votes_row = "| Votes    |"
+        votes_parts = ["| Votes    |"]
         for agent in self.agents:
-            agent_num = self.agent_mapping.get(agent, "?")
-            agent_name = f"Agent {agent_num}"
+            agent_name = self._get_agent_display_name(agent)
             count = agent_stats.get(agent_name, {}).get("votes", 0)
-            votes_row += (
+            votes_parts.append(
                 self._format_cell(
                     f"{count} vote{'s' if count != 1 else ''}",
                     cell_width,
-                )
-                + "|"
+                ),
             )
-        lines.append(votes_row)
+            votes_parts.append("|")
+        lines.append("".join(votes_parts))
 
         # Restarts row
-        restarts_row = "| Restarts |"
+        restarts_parts = ["| Restarts |"]
         for agent in self.agents:
-            agent_num = self.agent_mapping.get(agent, "?")
-            agent_name = f"Agent {agent_num}"
+            agent_name = self._get_agent_display_name(agent)
             count = agent_stats.get(agent_name, {}).get("restarts", 0)
-            restarts_row += (
+            restarts_parts.append(
                 self._format_cell(
                     f"{count} restart{'s' if count != 1 else ''}",
                     cell_width,
-                )
-                + "|"
+                ),
             )
-        lines.append(restarts_row)
+            restarts_parts.append("|")
+        lines.append("".join(restarts_parts))
 
         # Final status row
-        status_row = "| Status   |"
+        status_parts = ["| Status   |"]
         for agent in self.agents:
-            agent_num = self.agent_mapping.get(agent, "?")
-            agent_name = f"Agent {agent_num}"
+            agent_name = self._get_agent_display_name(agent)
             status = agent_states[agent]["status"]
             if status == "final":
                 display = "🏆 Winner"
@@ -1041,13 +1183,12 @@ class CoordinationTableBuilder:
                 display = "✅ Voted"
             else:
                 display = f"({status})"
-            status_row += self._format_cell(display, cell_width) + "|"
-        lines.append(status_row)
+            status_parts.append(self._format_cell(display, cell_width))
+            status_parts.append("|")
+        lines.append("".join(status_parts))
 
         # Overall totals row
-        lines.append(
-            "|" + "-" * 10 + "+" + ("-" * cell_width + "+") * len(self.agents),
-        )
+        lines.append(self._row_separator("-", cell_width))
         totals_row = "| TOTALS   |"
         total_width = cell_width * len(self.agents) + (len(self.agents) - 1)
         totals_content = f"{total_answers} answers, {total_votes} votes, {total_restarts} restarts"
@@ -1110,7 +1251,7 @@ class CoordinationTableBuilder:
         # Title
         lines.append("")
         lines.append("Multi-Agent Coordination Events Log")
-        lines.append("=" * 50)
+        lines.append(_RULE_50)
         lines.append("")
 
         # Event symbols
@@ -1156,25 +1297,19 @@ class CoordinationTableBuilder:
         else:  # 5+ agents
             cell_width = 25
         total_width = 10 + (cell_width + 1) * num_agents + 1
+        border = "+" + "-" * (total_width - 2) + "+"
 
         lines = []
 
         # Top border
-        lines.append("+" + "-" * (total_width - 2) + "+")
+        lines.append(border)
 
         # Header row
-        header = "|  Round   |"
-        for agent in self.agents:
-            # Try to create readable agent names
-            # Use the full agent name as provided by user configuration
-            agent_name = agent
-            header += self._format_cell(agent_name, cell_width) + "|"
-        lines.append(header)
+        # Use the full agent name as provided by user configuration
+        lines.append(self._agent_header_row("|  Round   |", str, cell_width))
 
         # Header separator
-        lines.append(
-            "|" + "-" * 10 + "+" + ("-" * cell_width + "+") * num_agents,
-        )
+        lines.append(self._row_separator("-", cell_width))
 
         # User question row
         question_row = "|   USER   |"
@@ -1184,62 +1319,60 @@ class CoordinationTableBuilder:
         lines.append(question_row)
 
         # Double separator
-        lines.append(
-            "|" + "=" * 10 + "+" + ("=" * cell_width + "+") * num_agents,
-        )
+        lines.append(self._row_separator("=", cell_width))
+
+        # Cells that repeat across rounds, formatted once for this width
+        blank_cell = " " * cell_width
+        waiting_cell = self._format_cell(_WAITING_CELL_TEXT, cell_width)
 
         # Process each round
         for i, round_data in enumerate(self.rounds):
             # Get content for each agent
-            agent_contents = {}
-            max_lines = 0
-
-            for agent in self.agents:
-                content = self._build_agent_cell_content(
+            agent_contents = {
+                agent: self._cached_cell_content(
+                    self._build_agent_cell_content,
                     round_data.agent_states[agent],
                     round_data.round_type,
                     agent,
                     round_data.round_num,
                 )
-                agent_contents[agent] = content
-                max_lines = max(max_lines, len(content))
+                for agent in self.agents
+            }
+            max_lines = max(map(len, agent_contents.values()), default=0)
+
+            # Fit every cell line to the column once, padding short cells with
+            # blanks, so the row loop below only has to stitch columns together
+            agent_columns = []
+            for agent in self.agents:
+                column = [waiting_cell if text == _WAITING_CELL_TEXT else self._format_cell(text, cell_width) for text in agent_contents[agent]]
+                column.extend([blank_cell] * (max_lines - len(column)))
+                agent_columns.append(column)
 
             # Build round rows
             for line_idx in range(max_lines):
-                row = "|"
-
                 # Round label (only on first line)
                 if line_idx == 0:
                     if round_data.round_type == "FINAL":
                         round_label = "  FINAL   "
                     else:
                         round_label = f"   {round_data.round_type}   "
-                    row += round_label[-10:].rjust(10) + "|"
+                    parts = ["|", round_label[-10:].rjust(10), "|"]
                 else:
-                    row += " " * 10 + "|"
+                    parts = ["|", _BLANK_LABEL, "|"]
 
                 # Agent cells
-                for agent in self.agents:
-                    content_lines = agent_contents[agent]
-                    if line_idx < len(content_lines):
-                        row += self._format_cell(
-                            content_lines[line_idx],
-                            cell_width,
-                        )
-                    else:
-                        row += " " * cell_width
-                    row += "|"
+                for column in agent_columns:
+                    parts.append(column[line_idx])
+                    parts.append("|")
 
-                lines.append(row)
+                lines.append("".join(parts))
 
             # Round separator
             if i < len(self.rounds) - 1:
                 next_round = self.rounds[i + 1]
                 if next_round.round_type == "FINAL":
                     # Add winner announcement before FINAL round
-                    lines.append(
-                        "|" + "-" * 10 + "+" + ("-" * cell_width + "+") * num_agents,
-                    )
+                    lines.append(self._row_separator("-", cell_width))
 
                     # Winner announcement row
                     if self.final_winner:
@@ -1258,22 +1391,16 @@ class CoordinationTableBuilder:
                         lines.append(winner_row)
 
                     # Solid line before FINAL
-                    lines.append(
-                        "|" + "-" * 10 + "+" + ("-" * cell_width + "+") * num_agents,
-                    )
+                    lines.append(self._row_separator("-", cell_width))
                 else:
                     # Wavy line between regular rounds
-                    lines.append(
-                        "|" + "~" * 10 + "+" + ("~" * cell_width + "+") * num_agents,
-                    )
+                    lines.append(self._row_separator("~", cell_width))
 
         # Bottom separator
-        lines.append(
-            "|" + "-" * 10 + "+" + ("-" * cell_width + "+") * num_agents,
-        )
+        lines.append(self._row_separator("-", cell_width))
 
         # Bottom border
-        lines.append("+" + "-" * (total_width - 2) + "+")
+        lines.append(border)
 
         return "\n".join(lines)
 
@@ -1379,28 +1506,17 @@ class CoordinationTableBuilder:
         table.add_row(*question_row)
 
         # Process events chronologically
-        agent_states: Dict[str, Dict[str, Any]] = {
-            agent: {
-                "status": "idle",
-                "context": [],
-                "answer": None,
-                "vote": None,
-                "preview": None,
-                "last_streaming_logged": False,
-            }
-            for agent in self.agents
-        }
+        agent_states: Dict[str, Dict[str, Any]] = {agent: dict(_INITIAL_EVENT_AGENT_STATE) for agent in self.agents}
         event_num = 1
 
         for event in self.events:
             event_type = event["event_type"]
             agent_id = event.get("agent_id")
-            context = event.get("context", {})
+            context = event.get("context") or _EMPTY_CONTEXT
 
             # Handle system events that span both columns
             if event_type == "final_agent_selected":
-                agent_num = self.agent_mapping.get(agent_id, "?")
-                winner_name = f"Agent {agent_num}"
+                winner_name = self._get_agent_display_name(agent_id)
                 winner_row = ["[bold green]🏆[/bold green]"]
                 winner_text = Text(
                     f"🏆 {winner_name} selected as winner 🏆",
@@ -1412,8 +1528,7 @@ class CoordinationTableBuilder:
                 table.add_row(*winner_row)
                 continue
             elif event_type == "restart_triggered" and agent_id and agent_id in self.agents:
-                agent_num = self.agent_mapping.get(agent_id, "?")
-                agent_name = f"Agent {agent_num}"
+                agent_name = self._get_agent_display_name(agent_id)
                 restart_row = ["[bold yellow]🔁[/bold yellow]"]
                 restart_text = Text(
                     f"🔁 {agent_name} RESTART TRIGGERED",
@@ -1431,18 +1546,15 @@ class CoordinationTableBuilder:
 
             # Handle agent events
             if event_type == "status_change":
-                status = event.get("details", "").replace(
-                    "Changed to status: ",
-                    "",
-                )
+                status = parse_status_change(event.get("details", ""))
                 old_status = agent_states[agent_id]["status"]
                 agent_states[agent_id]["status"] = status
 
                 # Only log first streaming
-                if status in ["streaming", "answering"]:
+                if status in _ACTIVE_STATUSES:
                     if old_status == "voted":
                         pass  # Skip post-vote streaming
-                    elif old_status not in ["streaming", "answering"] or not agent_states[agent_id]["last_streaming_logged"]:
+                    elif old_status not in _ACTIVE_STATUSES or not agent_states[agent_id]["last_streaming_logged"]:
                         row = self._create_rich_event_row(
                             event_num,
                             agent_id,
@@ -1455,7 +1567,7 @@ class CoordinationTableBuilder:
                         agent_states[agent_id]["last_streaming_logged"] = True
 
             elif event_type == "context_received":
-                labels = context.get("available_answer_labels", [])
+                labels = context.get("available_answer_labels", ())
                 agent_states[agent_id]["context"] = labels
 
             elif event_type == "restart_completed":
@@ -1548,60 +1660,17 @@ class CoordinationTableBuilder:
         """Create a rich table row for an event"""
         row = [f"[bold yellow]E{event_num}[/bold yellow]"]
 
+        # Only the active agent's cell depends on the event, so format it once
+        formatter = _RICH_EVENT_CELL_FORMATTERS.get(event_type)
+        active_cell = formatter(agent_states[active_agent], args) if formatter else ""
+
         for agent in self.agents:
             if agent == active_agent:
                 # Active agent performing the event
-                if event_type == "streaming_start":
-                    context = agent_states[agent]["context"]
-                    context_str = f"[dim blue]📋 Context: \\[{', '.join(context)}][/dim blue]\n" if context else "[dim blue]📋 Context: \\[][/dim blue]\n"
-                    cell = context_str + "[bold cyan]💭 Started streaming[/bold cyan]"
-                elif event_type == "restart_completed":
-                    cell = f"[bold green]✅ RESTART COMPLETED (Restart {args[0]})[/bold green]"
-                elif event_type == "new_answer":
-                    label, preview = args[0], args[1] if len(args) > 1 else ""
-                    cell = f"[bold green]✨ NEW ANSWER: {label}[/bold green]"
-                    if preview:
-                        clean_preview = preview.replace("\n", " ").strip()
-                        preview_truncated = clean_preview[:80] + "..." if len(clean_preview) > 80 else clean_preview
-                        cell += f"\n[dim white]👁️  Preview: {preview_truncated}[/dim white]"
-                elif event_type == "vote":
-                    vote, reason = args[0], args[1] if len(args) > 1 else ""
-                    cell = f"[bold cyan]🗳️  VOTE: {vote}[/bold cyan]"
-                    if reason:
-                        clean_reason = reason.replace("\n", " ").strip()
-                        reason_preview = clean_reason[:50] + "..." if len(clean_reason) > 50 else clean_reason
-                        cell += f"\n[italic dim]💭 Reason: {reason_preview}[/italic dim]"
-                elif event_type == "final_answer":
-                    label, preview = args[0], args[1] if len(args) > 1 else ""
-                    cell = f"[bold green]🎯 FINAL ANSWER: {label}[/bold green]"
-                    if preview:
-                        clean_preview = preview.replace("\n", " ").strip()
-                        preview_truncated = clean_preview[:80] + "..." if len(clean_preview) > 80 else clean_preview
-                        cell += f"\n[dim white]👁️  Preview: {preview_truncated}[/dim white]"
-                else:
-                    cell = ""
-                row.append(cell)
+                row.append(active_cell)
             else:
                 # Other agents showing status - prioritize active states
-                status = agent_states[agent]["status"]
-                if status in ["streaming", "answering"]:
-                    cell = f"[cyan]🔄 ({status})[/cyan]"
-                elif status == "voted":
-                    cell = "[green]✅ (voted)[/green]"
-                elif status == "answered":
-                    if agent_states[agent]["answer"]:
-                        cell = f"[green]✅ Answered: {agent_states[agent]['answer']}[/green]"
-                    else:
-                        cell = "[green]✅ (answered)[/green]"
-                elif status == "completed":
-                    cell = "[green]✅ (completed)[/green]"
-                elif status == "final":
-                    cell = "[bold green]🎯 (final answer given)[/bold green]"
-                elif status == "idle":
-                    cell = "[dim]⏳ (waiting)[/dim]"
-                else:
-                    cell = f"[dim]({status})[/dim]"
-                row.append(cell)
+                row.append(rich_status_cell(agent_states[agent]))
 
         return row
 
@@ -1610,15 +1679,13 @@ class CoordinationTableBuilder:
         # Calculate statistics
         total_answers = sum(1 for agent in self.agents if agent_states[agent]["answer"])
         total_votes = sum(1 for agent in self.agents if agent_states[agent]["vote"])
-        total_restarts = len(
-            [e for e in self.events if e["event_type"] == "restart_completed"],
-        )
+        total_restarts = len(self._events_by_type.get("restart_completed", ()))
+        restart_counts = self._count_restarts_by_agent()
 
         # Summary header
         summary_row = ["[bold magenta]SUMMARY[/bold magenta]"]
         for agent in self.agents:
-            agent_num = self.agent_mapping.get(agent, "?")
-            agent_name = f"Agent {agent_num}"
+            agent_name = self._get_agent_display_name(agent)
             summary_row.append(f"[bold magenta]{agent_name}[/bold magenta]")
         table.add_row(*summary_row)
 
@@ -1627,9 +1694,7 @@ class CoordinationTableBuilder:
         for agent in self.agents:
             answer_count = 1 if agent_states[agent]["answer"] else 0
             vote_count = 1 if agent_states[agent]["vote"] else 0
-            restart_count = len(
-                [e for e in self.events if e["event_type"] == "restart_completed" and e.get("agent_id") == agent],
-            )
+            restart_count = restart_counts.get(agent, 0)
 
             status = agent_states[agent]["status"]
             if status == "final":
@@ -1710,26 +1775,27 @@ class CoordinationTableBuilder:
         table.add_row(*question_cells)
 
         # Add separator row
-        separator_cells = [
-            "[dim bright_blue]════════════[/dim bright_blue]",
-        ] + ["[dim bright_blue]" + "═" * 88 + "[/dim bright_blue]" for _ in self.agents]
+        separator_cells = ["[dim bright_blue]════════════[/dim bright_blue]"] + [_RICH_RULE_DOUBLE] * len(self.agents)
         table.add_row(*separator_cells)
 
+        # Round separator rows, built once for the whole table
+        solid_separator_cells = ["[dim green]────────────[/dim green]"] + [_RICH_RULE_SOLID] * len(self.agents)
+        wavy_separator_cells = ["[dim cyan]~~~~~~~~~~~~[/dim cyan]"] + [_RICH_RULE_WAVY] * len(self.agents)
+
         # Process each round
         for i, round_data in enumerate(self.rounds):
             # Get content for each agent
-            agent_contents = {}
-            max_lines = 0
-
-            for agent in self.agents:
-                content = self._build_rich_agent_cell_content(
+            agent_contents = {
+                agent: self._cached_cell_content(
+                    self._build_rich_agent_cell_content,
                     round_data.agent_states[agent],
                     round_data.round_type,
                     agent,
                     round_data.round_num,
                 )
-                agent_contents[agent] = content
-                max_lines = max(max_lines, len(content))
+                for agent in self.agents
+            }
+            max_lines = max(map(len, agent_contents.values()), default=0)
 
             # Build round rows
             for line_idx in range(max_lines):
@@ -1795,14 +1861,10 @@ class CoordinationTableBuilder:
                         table.add_row(*winner_cells)
 
                     # Solid line before FINAL
-                    separator_cells = [
-                        "[dim green]────────────[/dim green]",
-                    ] + ["[dim green]" + "─" * 88 + "[/dim green]" for _ in self.agents]
-                    table.add_row(*separator_cells)
+                    table.add_row(*solid_separator_cells)
                 else:
                     # Wavy line between regular rounds
-                    separator_cells = ["[dim cyan]~~~~~~~~~~~~[/dim cyan]"] + ["[dim cyan]" + "~" * 88 + "[/dim cyan]" for _ in self.agents]
-                    table.add_row(*separator_cells)
+                    table.add_row(*wavy_separator_cells)
 
         return table
 
@@ -1817,7 +1879,7 @@ class CoordinationTableBuilder:
         lines = []
 
         # Determine if we should show context (for non-voting scenarios)
-        show_context = (agent_state.current_answer and not agent_state.vote) or agent_state.has_final_answer or agent_state.status in ["streaming", "answering"]
+        show_context = (agent_state.current_answer and not agent_state.vote) or agent_state.has_final_answer or agent_state.status in _ACTIVE_STATUSES
 
         # Don't show context for completed agents in FINAL round
         if round_type == "FINAL" and agent_state.status == "completed":
@@ -1846,10 +1908,7 @@ class CoordinationTableBuilder:
             lines.append(f"[bold cyan]{vote_str}[/bold cyan]")
             if agent_state.vote_reason:
                 # Clean up newlines and truncate
-                clean_reason = agent_state.vote_reason.replace(
-                    "\n",
-                    " ",
-                ).strip()
+                clean_reason = format_answer_preview(agent_state.vote_reason)
                 reason = clean_reason[:65] + "..." if len(clean_reason) > 68 else clean_reason
                 reason_str = f"💭 Reason: {reason}"
                 lines.append(f"[italic dim]{reason_str}[/italic dim]")
@@ -1860,12 +1919,8 @@ class CoordinationTableBuilder:
                 final_str = f"🎯 FINAL ANSWER: {agent_state.current_answer}"
                 lines.append(f"[bold green]{final_str}[/bold green]")
                 if agent_state.answer_preview:
-                    # Clean up newlines in preview
-                    clean_preview = agent_state.answer_preview.replace(
-                        "\n",
-                        " ",
-                    ).strip()
-                    preview_truncated = clean_preview[:80] + "..." if len(clean_preview) > 80 else clean_preview
+                    # Clean up newlines and truncate preview
+                    preview_truncated = format_answer_preview(agent_state.answer_preview, 80)
                     preview_str = f"👁️  Preview: {preview_truncated}"
                     lines.append(f"[dim white]{preview_str}[/dim white]")
                 else:
@@ -1882,12 +1937,8 @@ class CoordinationTableBuilder:
             answer_str = f"✨ NEW ANSWER: {agent_state.current_answer}"
             lines.append(f"[bold green]{answer_str}[/bold green]")
             if agent_state.answer_preview:
-                # Clean up newlines in preview
-                clean_preview = agent_state.answer_preview.replace(
-                    "\n",
-                    " ",
-                ).strip()
-                preview_truncated = clean_preview[:80] + "..." if len(clean_preview) > 80 else clean_preview
+                # Clean up newlines and truncate preview
+                preview_truncated = format_answer_preview(agent_state.answer_preview, 80)
                 preview_str = f"👁️  Preview: {preview_truncated}"
                 lines.append(f"[dim white]{preview_str}[/dim white]")
             else:
@@ -1895,7 +1946,7 @@ class CoordinationTableBuilder:
                     "[dim red]👁️  Preview: [Answer not available][/dim red]",
                 )
 
-        elif agent_state.status in ["streaming", "answering"]:
+        elif agent_state.status in _ACTIVE_STATUSES:
             lines.append("[bold yellow]🔄 (answering)[/bold yellow]")
 
         elif agent_state.status == "voted":
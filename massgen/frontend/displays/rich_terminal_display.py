@@ -7,6 +7,7 @@ Enhanced terminal interface using Rich library with live updates,
 beautiful formatting, code highlighting, and responsive layout.
 """
 
+import io
 import os
 import re
 import signal
@@ -27,8 +28,39 @@ from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ...logger_config import logger
 from .terminal_display import TerminalDisplay
 
+# Content types that count as status changes for web search truncation
+_STATUS_CHANGE_CONTENT_TYPES = frozenset({"status", "presentation", "tool"})
+# Content types that are shown immediately and refreshed as critical updates
+_CRITICAL_CONTENT_TYPES = frozenset({"tool", "status", "presentation", "error"})
+# Layered refresh categories used by _categorize_update
+_PRIORITY_CONTENT_TYPES = frozenset({"status", "error", "tool"})
+_PRIORITY_KEYWORDS = ("error", "failed", "completed", "voted")
+_NORMAL_CONTENT_TYPES = frozenset({"thinking", "presentation"})
+
+# Rule and closing block used in final presentation files
+_RULE_60 = "=" * 60
+_FINAL_PRESENTATION_FOOTER = f"\n\n{_RULE_60}\nEnd of Final Presentation\n"
+
+# Lines that are pure metadata or formatting: just a parenthetical citation,
+# just bracketed metadata, just a URL, or just an ellipsis
+_FILTER_LINE_RE = re.compile(r"^\s*(?:\([^)]+\)|\[[^\]]+\]|https?://\S+|\.\.\.)\s*$")
+
+# Markers of web search output; the emoji-prefixed forms the backends emit
+# ("🔍 [Search Query]", "✅ [Provider Tool: Web Search]", ...) contain these
+_WEB_SEARCH_INDICATORS = ("[Provider Tool: Web Search]", "[Search Query]")
+
+# Provider web search progress lines: the phase text after the tool marker
+# decides the icon, its color key and the short label shown in the panel
+_WEB_SEARCH_TOOL_MARKER = "[Provider Tool: Web Search] "
+_WEB_SEARCH_PHASES = (
+    ("Starting search", "🔍 ", "info", "Web search starting..."),
+    ("Searching", "🔍 ", "warning", "Searching..."),
+    ("Search completed", "✅ ", "success", "Search completed"),
+)
+
 try:
     from rich.align import Align
     from rich.box import DOUBLE, ROUNDED
@@ -216,6 +248,11 @@ class RichTerminalDisplay(TerminalDisplay):
             r"import\s+\w+",  # Python imports
             r"from\s+\w+\s+import",  # Python from imports
         ]
+        # All code patterns as one compiled alternation, so each line is scanned once
+        self._code_pattern_re = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.code_patterns),
+            re.DOTALL | re.IGNORECASE,
+        )
 
         # Progress tracking
         self.agent_progress = {agent_id: 0 for agent_id in agent_ids}
@@ -265,6 +302,9 @@ class RichTerminalDisplay(TerminalDisplay):
             "vote recorded",
         }
 
+        # (whole second, "HH:MM:SS") for the last rendered clock timestamp
+        self._clock_cache = (-1, "")
+
         # Status jump mechanism for web search interruption
         self._status_jump_enabled = kwargs.get(
             "enable_status_jump",
@@ -864,7 +904,7 @@ class RichTerminalDisplay(TerminalDisplay):
                 self._last_simple_update = 0
 
             if current_time - self._last_simple_update > 2.0:  # Update every 2 seconds
-                status_line = f"[{time.strftime('%H:%M:%S')}] Agents: "
+                status_line = f"[{self._clock_timestamp()}] Agents: "
                 for agent_id in self.agent_ids:
                     status = self.agent_status.get(agent_id, "waiting")
                     status_line += f"{agent_id}:{status} "
@@ -1146,6 +1186,8 @@ class RichTerminalDisplay(TerminalDisplay):
             for i, agent_id in enumerate(self.agent_ids):
                 key = str(i + 1)
                 self._agent_keys[key] = agent_id
+            # Reverse index so panel titles can find their key without a scan
+            self._agent_key_by_id = {agent_id: key for key, agent_id in self._agent_keys.items()}
 
             # Start background input thread for Live mode
             if self._keyboard_interactive_mode:
@@ -1877,11 +1919,8 @@ class RichTerminalDisplay(TerminalDisplay):
             title += f" ({backend_name})"
 
         # Add interactive indicator if enabled
-        if self._keyboard_interactive_mode and hasattr(self, "_agent_keys"):
-            agent_key = next(
-                (k for k, v in self._agent_keys.items() if v == agent_id),
-                None,
-            )
+        if self._keyboard_interactive_mode and hasattr(self, "_agent_key_by_id"):
+            agent_key = self._agent_key_by_id.get(agent_id)
             if agent_key:
                 title += f" [Press {agent_key}]"
 
@@ -2064,31 +2103,30 @@ class RichTerminalDisplay(TerminalDisplay):
 
     def _is_web_search_content(self, line: str) -> bool:
         """Check if content is from web search and needs special formatting."""
-        web_search_indicators = [
-            "[Provider Tool: Web Search]",
-            "🔍 [Search Query]",
-            "✅ [Provider Tool: Web Search]",
-            "🔍 [Provider Tool: Web Search]",
-        ]
-        return any(indicator in line for indicator in web_search_indicators)
+        # Every indicator contains "Search", so most lines are rejected after one scan
+        if "Search" not in line:
+            return False
+        return any(indicator in line for indicator in _WEB_SEARCH_INDICATORS)
 
     def _format_web_search_line(self, line: str) -> Text:
         """Format web search content with better truncation and styling."""
         formatted = Text()
 
+        # Find the tool marker once and dispatch on the phase that follows it
+        phase = None
+        marker_index = line.find(_WEB_SEARCH_TOOL_MARKER)
+        if marker_index != -1:
+            tail = line[marker_index + len(_WEB_SEARCH_TOOL_MARKER) :]
+            for prefix, icon, color, label in _WEB_SEARCH_PHASES:
+                if tail.startswith(prefix):
+                    phase = (icon, color, label)
+                    break
+
         # Handle different types of web search lines
-        if "[Provider Tool: Web Search] Starting search" in line:
-            formatted.append("🔍 ", style=self.colors["info"])
-            formatted.append(
-                "Web search starting...",
-                style=self.colors["text"],
-            )
-        elif "[Provider Tool: Web Search] Searching" in line:
-            formatted.append("🔍 ", style=self.colors["warning"])
-            formatted.append("Searching...", style=self.colors["text"])
-        elif "[Provider Tool: Web Search] Search completed" in line:
-            formatted.append("✅ ", style=self.colors["success"])
-            formatted.append("Search completed", style=self.colors["text"])
+        if phase is not None:
+            icon, color, label = phase
+            formatted.append(icon, style=self.colors[color])
+            formatted.append(label, style=self.colors["text"])
         elif any(
             pattern in line
             for pattern in [
@@ -2166,18 +2204,7 @@ class RichTerminalDisplay(TerminalDisplay):
     def _should_filter_line(self, line: str) -> bool:
         """Determine if a specific line should be filtered out."""
         # Filter lines that are pure metadata or formatting
-        filter_patterns = [
-            r"^\s*\([^)]+\)\s*$",  # Lines with just parenthetical citations
-            r"^\s*\[[^\]]+\]\s*$",  # Lines with just bracketed metadata
-            r"^\s*https?://\S+\s*$",  # Lines with just URLs
-            r"^\s*\.\.\.\s*$",  # Lines with just ellipsis
-        ]
-
-        for pattern in filter_patterns:
-            if re.match(pattern, line):
-                return True
-
-        return False
+        return _FILTER_LINE_RE.match(line) is not None
 
     def _truncate_web_search_content(self, agent_id: str) -> None:
         """Truncate web search content when important status updates occur."""
@@ -2220,10 +2247,7 @@ class RichTerminalDisplay(TerminalDisplay):
 
     def _is_code_content(self, content: str) -> bool:
         """Check if content appears to be code."""
-        for pattern in self.code_patterns:
-            if re.search(pattern, content, re.DOTALL | re.IGNORECASE):
-                return True
-        return False
+        return self._code_pattern_re.search(content) is not None
 
     def _apply_syntax_highlighting(self, content: str) -> Text:
         """Apply syntax highlighting to content."""
@@ -2254,6 +2278,15 @@ class RichTerminalDisplay(TerminalDisplay):
 
         return None
 
+    def _clock_timestamp(self) -> str:
+        """Return the local time as HH:MM:SS, formatting it at most once per second."""
+        now = int(time.time())
+        second, text = self._clock_cache
+        if now != second:
+            text = time.strftime("%H:%M:%S", time.localtime(now))
+            self._clock_cache = (now, text)
+        return text
+
     def _get_status_emoji(self, status: str, activity: str) -> str:
         """Get emoji for agent status."""
         if status == "working":
@@ -2400,11 +2433,9 @@ class RichTerminalDisplay(TerminalDisplay):
             self._write_to_agent_file(agent_id, content, content_type)
 
             # Check if this is a status-changing content that should trigger web search truncation
-            is_status_change = content_type in [
-                "status",
-                "presentation",
-                "tool",
-            ] or any(keyword in content.lower() for keyword in self._status_change_keywords)
+            content_lower = content.lower()
+            has_status_keyword = any(keyword in content_lower for keyword in self._status_change_keywords)
+            is_status_change = content_type in _STATUS_CHANGE_CONTENT_TYPES or has_status_keyword
 
             # If status jump is enabled and this is a status change, truncate web search content
             if self._status_jump_enabled and is_status_change and self._web_search_truncate_on_status_change and self.agent_outputs[agent_id]:
@@ -2425,12 +2456,7 @@ class RichTerminalDisplay(TerminalDisplay):
             self._categorize_update(agent_id, content_type, content)
 
             # Schedule update based on priority
-            is_critical = content_type in [
-                "tool",
-                "status",
-                "presentation",
-                "error",
-            ] or any(keyword in content.lower() for keyword in self._status_change_keywords)
+            is_critical = content_type in _CRITICAL_CONTENT_TYPES or has_status_keyword
             self._schedule_layered_update(agent_id, is_critical)
 
     def _process_content_with_buffering(
@@ -2446,7 +2472,7 @@ class RichTerminalDisplay(TerminalDisplay):
             self._buffer_timers[agent_id] = None
 
         # Special handling for content that should be displayed immediately
-        if content_type in ["tool", "status", "presentation", "error"] or "\n" in content:
+        if content_type in _CRITICAL_CONTENT_TYPES or "\n" in content:
             # Flush any existing buffer first
             self._flush_buffer(agent_id)
 
@@ -2525,7 +2551,6 @@ class RichTerminalDisplay(TerminalDisplay):
 
         try:
             file_path = self.agent_files[agent_id]
-            timestamp = time.strftime("%H:%M:%S")
 
             # Check if content contains emojis
             has_emoji = any(
@@ -2540,7 +2565,7 @@ class RichTerminalDisplay(TerminalDisplay):
 
             if has_emoji:
                 # Format with newline and timestamp when emojis are present
-                formatted_content = f"\n[{timestamp}] {content}\n"
+                formatted_content = f"\n[{self._clock_timestamp()}] {content}\n"
             else:
                 # Regular format without extra newline
                 formatted_content = f"{content}"
@@ -2559,37 +2584,38 @@ class RichTerminalDisplay(TerminalDisplay):
             return
 
         try:
-            # Clear file and write all orchestrator events chronologically
-            with open(self.system_status_file, "w", encoding="utf-8") as f:
-                f.write("=== SYSTEM STATUS LOG ===\n\n")
-
-                # Agent Status Summary
-                f.write("📊 Agent Status:\n")
-                status_counts = {}
-                for status in self.agent_status.values():
-                    status_counts[status] = status_counts.get(status, 0) + 1
-
-                for status, count in status_counts.items():
-                    emoji = self._get_status_emoji(status, status)
-                    f.write(f"  {emoji} {status.title()}: {count}\n")
-
-                # Final Presentation Status
-                if self._final_presentation_active:
-                    f.write("  🎤 Final Presentation: Active\n")
-                elif hasattr(self, "_stored_final_presentation") and self._stored_final_presentation:
-                    f.write("  🎤 Final Presentation: Complete\n")
-
-                f.write("\n")
-
-                # Show all orchestrator events in chronological order by time
-                f.write("📋 Orchestrator Events:\n")
-                if self.orchestrator_events:
-                    for event in self.orchestrator_events:
-                        f.write(f"  • {event}\n")
-                else:
-                    f.write("  • No orchestrator events yet\n")
+            # Build the whole report in memory, then replace the file contents with one write
+            buf = io.StringIO()
+            w = buf.write
+            w("=== SYSTEM STATUS LOG ===\n\n")
+
+            # Agent Status Summary
+            w("📊 Agent Status:\n")
+            status_counts = {}
+            for status in self.agent_status.values():
+                status_counts[status] = status_counts.get(status, 0) + 1
+
+            w("".join(f"  {self._get_status_emoji(status, status)} {status.title()}: {count}\n" for status, count in status_counts.items()))
+
+            # Final Presentation Status
+            if self._final_presentation_active:
+                w("  🎤 Final Presentation: Active\n")
+            elif hasattr(self, "_stored_final_presentation") and self._stored_final_presentation:
+                w("  🎤 Final Presentation: Complete\n")
+
+            w("\n")
+
+            # Show all orchestrator events in chronological order by time
+            w("📋 Orchestrator Events:\n")
+            if self.orchestrator_events:
+                w("".join(f"  • {event}\n" for event in self.orchestrator_events))
+            else:
+                w("  • No orchestrator events yet\n")
+
+            w("\n")
 
-                f.write("\n")
+            with open(self.system_status_file, "w", encoding="utf-8") as f:
+                f.write(buf.getvalue())
 
         except Exception:
             # Handle file write errors gracefully
@@ -2639,8 +2665,7 @@ class RichTerminalDisplay(TerminalDisplay):
         """Add an orchestrator coordination event with timestamp."""
         with self._lock:
             if self.show_timestamps:
-                timestamp = time.strftime("%H:%M:%S")
-                formatted_event = f"[{timestamp}] {event}"
+                formatted_event = f"[{self._clock_timestamp()}] {event}"
             else:
                 formatted_event = event
 
@@ -3321,14 +3346,15 @@ class RichTerminalDisplay(TerminalDisplay):
         # First, try to get the answer from orchestrator's stored state
         try:
             if hasattr(self, "orchestrator") and self.orchestrator:
-                status = self.orchestrator.get_status()
                 if hasattr(self.orchestrator, "agent_states") and selected_agent in self.orchestrator.agent_states:
                     stored_answer = self.orchestrator.agent_states[selected_agent].answer
                     if stored_answer:
                         # Clean up the stored answer
                         return stored_answer.replace("\\", "\n").replace("**", "").strip()
 
-                # Alternative: try getting from status
+                # Alternative: try getting from status. get_status() tallies votes
+                # and polls every agent, so only build it when the stored state missed
+                status = self.orchestrator.get_status()
                 if "agent_states" in status and selected_agent in status["agent_states"]:
                     agent_state = status["agent_states"][selected_agent]
                     if hasattr(agent_state, "answer") and agent_state.answer:
@@ -3512,6 +3538,11 @@ class RichTerminalDisplay(TerminalDisplay):
             presentation_content,
         )
 
+    @staticmethod
+    def _final_presentation_header(selected_agent: str) -> str:
+        """Header block that opens a final presentation file."""
+        return f"=== FINAL PRESENTATION FROM {selected_agent.upper()} ===\nGenerated at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n{_RULE_60}\n\n"
+
     def _save_final_presentation_to_file(
         self,
         selected_agent: str,
@@ -3523,18 +3554,13 @@ class RichTerminalDisplay(TerminalDisplay):
             filename = f"final_presentation_{selected_agent}.txt"
             file_path = Path(self.output_dir) / filename
 
-            # Write the final presentation content
+            # Assemble header, content and footer in memory and write them once
+            buf = io.StringIO()
+            buf.write(self._final_presentation_header(selected_agent))
+            buf.write(presentation_content)
+            buf.write(_FINAL_PRESENTATION_FOOTER)
             with open(file_path, "w", encoding="utf-8") as f:
-                f.write(
-                    f"=== FINAL PRESENTATION FROM {selected_agent.upper()} ===\n",
-                )
-                f.write(
-                    f"Generated at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
-                )
-                f.write("=" * 60 + "\n\n")
-                f.write(presentation_content)
-                f.write("\n\n" + "=" * 60 + "\n")
-                f.write("End of Final Presentation\n")
+                f.write(buf.getvalue())
 
             # Also create a symlink to the latest presentation
             latest_link = Path(self.output_dir) / f"final_presentation_{selected_agent}_latest.txt"
@@ -3555,13 +3581,7 @@ class RichTerminalDisplay(TerminalDisplay):
 
             # Write the initial header
             with open(file_path, "w", encoding="utf-8") as f:
-                f.write(
-                    f"=== FINAL PRESENTATION FROM {selected_agent.upper()} ===\n",
-                )
-                f.write(
-                    f"Generated at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
-                )
-                f.write("=" * 60 + "\n\n")
+                f.write(self._final_presentation_header(selected_agent))
 
             # Also create a symlink to the latest presentation
             latest_link = Path(self.output_dir) / f"final_presentation_{selected_agent}_latest.txt"
@@ -3597,8 +3617,7 @@ class RichTerminalDisplay(TerminalDisplay):
         try:
             if file_path and file_path.exists():
                 with open(file_path, "a", encoding="utf-8") as f:
-                    f.write("\n\n" + "=" * 60 + "\n")
-                    f.write("End of Final Presentation\n")
+                    f.write(_FINAL_PRESENTATION_FOOTER)
         except Exception:
             # Handle file write errors gracefully
             pass
@@ -3679,11 +3698,9 @@ class RichTerminalDisplay(TerminalDisplay):
                             stored_answer,
                         )
                     else:
-                        print("DEBUG: No stored answer found")
+                        logger.debug("No stored answer found for {}", selected_agent)
                 else:
-                    print(
-                        f"DEBUG: Agent {selected_agent} not found in agent_states",
-                    )
+                    logger.debug("Agent {} not found in agent_states", selected_agent)
         except Exception as e:
             # Handle errors gracefully
             error_text = Text(
@@ -3830,12 +3847,13 @@ class RichTerminalDisplay(TerminalDisplay):
         content: str,
     ) -> None:
         """Categorize update by priority for layered refresh strategy."""
-        if content_type in ["status", "error", "tool"] or any(keyword in content.lower() for keyword in ["error", "failed", "completed", "voted"]):
+        content_lower = content.lower()
+        if content_type in _PRIORITY_CONTENT_TYPES or any(keyword in content_lower for keyword in _PRIORITY_KEYWORDS):
             self._critical_updates.add(agent_id)
             # Remove from other categories to avoid duplicate processing
             self._normal_updates.discard(agent_id)
             self._decorative_updates.discard(agent_id)
-        elif content_type in ["thinking", "presentation"]:
+        elif content_type in _NORMAL_CONTENT_TYPES:
             if agent_id not in self._critical_updates:
                 self._normal_updates.add(agent_id)
                 self._decorative_updates.discard(agent_id)
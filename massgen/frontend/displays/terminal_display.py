@@ -41,6 +41,13 @@ class TerminalDisplay(BaseDisplay):
             self.col_width = (self.terminal_width - (self.num_agents - 1) * 3) // self.num_agents
             self.separators = " │ "
 
+        # Column formatters with the width baked in, so refreshes don't re-parse the spec per cell
+        self._left_cell = f"{{:<{self.col_width}}}".format
+        self._center_cell = f"{{:^{self.col_width}}}".format
+        # Full-width rule and column underline row, printed on every header and refresh
+        self._rule = "=" * self.terminal_width
+        self._column_rule = self.separators.join(["─" * self.col_width] * self.num_agents)
+
     def _get_terminal_width(self) -> int:
         """Get terminal width with fallback."""
         try:
@@ -66,7 +73,7 @@ class TerminalDisplay(BaseDisplay):
         if log_filename:
             print(f"📁 Log: {log_filename}")
 
-        print("=" * self.terminal_width)
+        print(self._rule)
 
         # Show column headers with backend info if available
         headers = []
@@ -83,16 +90,15 @@ class TerminalDisplay(BaseDisplay):
 
             # Generic header format for any agent
             header_text = f"{agent_id.upper()} ({backend_name})"
-            headers.append(f"{header_text:^{self.col_width}}")
+            headers.append(self._center_cell(header_text))
 
         if self.num_agents == 1:
             print(headers[0])
-            print("─" * self.col_width)
         else:
             print(self.separators.join(headers))
-            print(self.separators.join(["─" * self.col_width] * self.num_agents))
+        print(self._column_rule)
 
-        print("=" * self.terminal_width)
+        print(self._rule)
         print()
 
     def update_agent_content(self, agent_id: str, content: str, content_type: str = "thinking"):
@@ -262,7 +268,7 @@ class TerminalDisplay(BaseDisplay):
         print("\033[7;1H\033[0J", end="")  # Move to line 7 and clear down
 
         # Show agent outputs in columns with word wrapping
-        max_lines = max(len(self.agent_outputs[agent_id]) for agent_id in self.agent_ids) if self.agent_outputs else 0
+        max_lines = max(map(len, self.agent_outputs.values()), default=0)
 
         # For single agent, don't wrap - show full content
         if self.num_agents == 1:
@@ -276,37 +282,46 @@ class TerminalDisplay(BaseDisplay):
                 wrapped_outputs[agent_id] = []
                 for line in self.agent_outputs[agent_id]:
                     if len(line) > self.col_width - 2:
-                        # Smart word wrap - preserve formatting and avoid breaking mid-sentence
+                        # Smart word wrap - preserve formatting and avoid breaking mid-sentence.
+                        # Collect the words of the current line and track its length, joining
+                        # each line once instead of re-concatenating it for every word
                         words = line.split(" ")
-                        current_line = ""
+                        current_words = []
+                        current_length = 0
                         for word in words:
-                            test_line = current_line + (" " if current_line else "") + word
-                            if len(test_line) > self.col_width - 2:
-                                if current_line:
-                                    wrapped_outputs[agent_id].append(current_line)
-                                    current_line = word
+                            test_length = current_length + 1 + len(word) if current_length else len(word)
+                            if test_length > self.col_width - 2:
+                                if current_length:
+                                    wrapped_outputs[agent_id].append(" ".join(current_words))
+                                    current_words = [word]
+                                    current_length = len(word)
                                 else:
                                     # Single word longer than column width - truncate gracefully
                                     wrapped_outputs[agent_id].append(word[: self.col_width - 2] + "…")
-                                    current_line = ""
+                                    current_words = []
+                                    current_length = 0
                             else:
-                                current_line = test_line
-                        if current_line:
-                            wrapped_outputs[agent_id].append(current_line)
+                                if current_length:
+                                    current_words.append(word)
+                                else:
+                                    current_words = [word]
+                                current_length = test_length
+                        if current_length:
+                            wrapped_outputs[agent_id].append(" ".join(current_words))
                     else:
                         wrapped_outputs[agent_id].append(line)
 
             # Display wrapped content
-            max_wrapped_lines = max(len(wrapped_outputs[agent_id]) for agent_id in self.agent_ids) if wrapped_outputs else 0
+            max_wrapped_lines = max(map(len, wrapped_outputs.values()), default=0)
             for i in range(max_wrapped_lines):
                 output_lines = []
                 for agent_id in self.agent_ids:
                     line = wrapped_outputs[agent_id][i] if i < len(wrapped_outputs[agent_id]) else ""
-                    output_lines.append(f"{line:<{self.col_width}}")
+                    output_lines.append(self._left_cell(line))
                 print(self.separators.join(output_lines))
 
         # Show status footer with proper column alignment
-        print("\n" + "=" * self.terminal_width)
+        print("\n" + self._rule)
 
         # Simple status line aligned with columns, matching header format
         status_lines = []
@@ -322,14 +337,14 @@ class TerminalDisplay(BaseDisplay):
                         backend_name = "Unknown"
 
             status_text = f"{agent_id.upper()} ({backend_name}): {self.agent_status[agent_id]}"
-            status_lines.append(f"{status_text:^{self.col_width}}")
+            status_lines.append(self._center_cell(status_text))
 
         if self.num_agents == 1:
             print(status_lines[0])
         else:
             print(self.separators.join(status_lines))
 
-        print("=" * self.terminal_width)
+        print(self._rule)
 
         # Show recent coordination events
         if self.orchestrator_events:
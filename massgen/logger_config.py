@@ -34,6 +34,9 @@ _LOG_SESSION_DIR = None
 _LOG_BASE_SESSION_DIR = None  # Base session dir (without turn subdirectory)
 _CURRENT_TURN = None
 
+# Shared stand-in for omitted log details; only ever formatted, never mutated
+_NO_DETAILS: dict = {}
+
 
 def get_log_session_dir(turn: Optional[int] = None) -> Path:
     """Get the current log session directory.
@@ -423,7 +426,7 @@ def log_mcp_activity(backend_name: str, message: str, details: dict = None, agen
         log_name = backend_name
         log = logger.bind(name=f"backend.{backend_name}:{func_name}:{line_num}")
 
-    log.info("MCP: {} - {}", message, details or {})
+    log.info("MCP: {} - {}", message, details or _NO_DETAILS)
 
 
 def log_tool_call(
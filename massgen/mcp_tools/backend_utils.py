@@ -14,6 +14,7 @@ from typing import (
     AsyncGenerator,
     Awaitable,
     Callable,
+    ClassVar,
     Dict,
     List,
     Literal,
@@ -23,6 +24,13 @@ from typing import (
 
 from ..logger_config import log_mcp_activity, logger
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import MCP exceptions
 try:
     from .circuit_breaker import CircuitBreakerConfig
@@ -394,6 +402,10 @@ class MCPMessageManager:
 class MCPConfigHelper:
     """MCP configuration management utilities."""
 
+    # Circuit breaker configs by transport type; breakers never mutate them, so one
+    # instance is shared by every backend
+    _circuit_breaker_configs: ClassVar[Dict[str, Any]] = {}
+
     @staticmethod
     def validate_backend_config(
         config: Dict[str, Any],
@@ -466,9 +478,13 @@ class MCPConfigHelper:
     ) -> Optional[Any]:
         """Build circuit breaker configuration for transport type."""
         if CircuitBreakerConfig is None:
-            log_mcp_activity(backend_name, "CircuitBreakerConfig unavailable", {}, agent_id=agent_id)
+            log_mcp_activity(backend_name, "CircuitBreakerConfig unavailable", agent_id=agent_id)
             return None
 
+        cached_config = MCPConfigHelper._circuit_breaker_configs.get(transport_type)
+        if cached_config is not None:
+            return cached_config
+
         try:
             # Standard configuration for MCP tools (stdio/streamable-http)
             config = CircuitBreakerConfig(
@@ -484,6 +500,7 @@ class MCPConfigHelper:
                 {"transport_type": transport_type},
                 agent_id=agent_id,
             )
+            MCPConfigHelper._circuit_breaker_configs[transport_type] = config
             return config
         except Exception as e:
             log_mcp_activity(
@@ -516,7 +533,8 @@ class MCPCircuitBreakerManager:
         Returns:
             List of servers that pass circuit breaker filtering
         """
-        if not circuit_breaker:
+        # Without recorded failures no server can be skipped, so avoid the per-server checks
+        if not circuit_breaker or not circuit_breaker.has_failures():
             return servers
 
         filtered_servers = []
@@ -542,7 +560,7 @@ class MCPCircuitBreakerManager:
         agent_id: Optional[str] = None,
     ) -> None:
         """Record successful operation for circuit breaker."""
-        if not circuit_breaker:
+        if not circuit_breaker or not servers:
             return
 
         for server in servers:
@@ -593,7 +611,8 @@ class MCPCircuitBreakerManager:
             backend_name: Optional backend name for logging context
             agent_id: Optional agent ID for logging context
         """
-        if not circuit_breaker:
+        # Per-call callbacks pass no server configurations; nothing to record
+        if not circuit_breaker or not servers:
             return
 
         count = 0
@@ -801,7 +820,7 @@ class MCPResourceManager:
                 def create_tool_entrypoint(captured_tool_name: str = tool_name):
                     async def tool_entrypoint(input_str: str) -> Any:
                         try:
-                            arguments = json.loads(input_str)
+                            arguments = orjson.loads(input_str) if ORJSON_AVAILABLE else json.loads(input_str)
                         except (json.JSONDecodeError, ValueError) as e:
                             log_mcp_activity(
                                 backend_name,
@@ -887,7 +906,7 @@ class MCPResourceManager:
         if client:
             try:
                 await client.disconnect()
-                log_mcp_activity(backend_name, "client cleanup completed", {}, agent_id=agent_id)
+                log_mcp_activity(backend_name, "client cleanup completed", agent_id=agent_id)
             except Exception as e:
                 log_mcp_activity(
                     backend_name,
@@ -903,17 +922,11 @@ class MCPResourceManager:
         agent_id: Optional[str] = None,
     ):
         """Setup MCP tools if configured during context manager entry."""
-        if hasattr(backend_instance, "_mcp_tools_servers") and backend_instance._mcp_tools_servers and not backend_instance._mcp_initialized:
-            try:
-                await backend_instance._setup_mcp_tools()
-            except Exception as e:
-                log_mcp_activity(
-                    backend_name,
-                    "setup failed during context entry",
-                    {"error": str(e)},
-                    agent_id=agent_id,
-                )
-        elif hasattr(backend_instance, "mcp_servers") and backend_instance.mcp_servers and not backend_instance._mcp_initialized:
+        # Already-initialized backends skip the server probes entirely
+        if getattr(backend_instance, "_mcp_initialized", False):
+            return backend_instance
+
+        if getattr(backend_instance, "_mcp_tools_servers", None) or getattr(backend_instance, "mcp_servers", None):
             try:
                 await backend_instance._setup_mcp_tools()
             except Exception as e:
@@ -937,14 +950,16 @@ class MCPResourceManager:
         log = logger_instance or logger
 
         try:
-            if hasattr(backend_instance, "cleanup_mcp"):
-                await backend_instance.cleanup_mcp()
+            cleanup_mcp = getattr(backend_instance, "cleanup_mcp", None)
+            if cleanup_mcp is not None:
+                await cleanup_mcp()
             elif hasattr(backend_instance, "_mcp_client"):
                 await MCPResourceManager.cleanup_mcp_client(backend_instance._mcp_client, backend_name, agent_id=agent_id)
                 backend_instance._mcp_client = None
                 backend_instance._mcp_initialized = False
-                if hasattr(backend_instance, "functions"):
-                    backend_instance.functions.clear()
+                functions = getattr(backend_instance, "functions", None)
+                if functions is not None:
+                    functions.clear()
         except Exception as e:
             log.error(f"Error during MCP cleanup for backend '{backend_name}': {e}")
             log_mcp_activity(
@@ -1128,13 +1143,21 @@ class MCPExecutionManager:
         else:
             call_index = 1
 
+        # Arguments and target are the same on every attempt; resolved on the first one
+        # inside the try so serialization or lookup errors are reported like call errors
+        arguments_json: Optional[str] = None
+        function = None
+
         for attempt in range(max_retries + 1):
             try:
-                # Convert args to JSON string for the function call
-                arguments_json = json.dumps(args)
+                if arguments_json is None:
+                    # Convert args to JSON string for the function call
+                    arguments_json = orjson.dumps(args, option=orjson.OPT_NON_STR_KEYS).decode() if ORJSON_AVAILABLE else json.dumps(args)
+                if function is None:
+                    function = functions[function_name]
 
                 # Execute the MCP function
-                result = await functions[function_name].call(arguments_json)
+                result = await function.call(arguments_json)
 
                 # Successful execution
                 if attempt > 0:
@@ -61,6 +61,12 @@ class MCPCircuitBreaker:
         self.backend_name = backend_name
         self.agent_id = agent_id
         self._server_status: Dict[str, ServerStatus] = {}
+        # Incremented whenever any server's status changes, so callers can reuse filter results
+        self.state_version = 0
+
+    def has_failures(self) -> bool:
+        """Return True if any server has a recorded failure (and so might be skipped)."""
+        return bool(self._server_status)
 
     def should_skip_server(self, server_name: str, agent_id: Optional[str] = None) -> bool:
         """
@@ -115,6 +121,7 @@ class MCPCircuitBreaker:
         status = self._server_status[server_name]
         status.failure_count += 1
         status.last_failure_time = current_time
+        self.state_version += 1
 
         if status.failure_count >= self.config.max_failures:
             backoff_time = self._calculate_backoff_time(status.failure_count)
@@ -216,11 +223,13 @@ class MCPCircuitBreaker:
                 agent_id=self.agent_id or agent_id,
             )
         self._server_status.clear()
+        self.state_version += 1
 
     def _reset_server(self, server_name: str) -> None:
         """Reset circuit breaker state for a specific server."""
         if server_name in self._server_status:
             del self._server_status[server_name]
+            self.state_version += 1
 
     def _calculate_backoff_time(self, failure_count: int) -> float:
         """
@@ -135,6 +135,38 @@ class MCPConfigValidator:
                     )
             validated_config["exclude_tools"] = exclude_tools
 
+        # Validate mcp_cacheable_tools parameter
+        cacheable_tools = backend_config.get("mcp_cacheable_tools")
+        if cacheable_tools is not None:
+            if not isinstance(cacheable_tools, list):
+                raise MCPConfigurationError(
+                    "mcp_cacheable_tools must be a list of strings",
+                    context={
+                        "type": type(cacheable_tools).__name__,
+                        "value": cacheable_tools,
+                    },
+                )
+            for i, tool_name in enumerate(cacheable_tools):
+                if not isinstance(tool_name, str):
+                    raise MCPConfigurationError(
+                        f"mcp_cacheable_tools[{i}] must be a string, got {type(tool_name).__name__}",
+                        context={"index": i, "value": tool_name},
+                    )
+            validated_config["mcp_cacheable_tools"] = cacheable_tools
+
+        # Validate mcp_max_concurrency parameter
+        max_concurrency = backend_config.get("mcp_max_concurrency")
+        if max_concurrency is not None:
+            if isinstance(max_concurrency, bool) or not isinstance(max_concurrency, int) or max_concurrency < 1:
+                raise MCPConfigurationError(
+                    "mcp_max_concurrency must be a positive integer",
+                    context={
+                        "type": type(max_concurrency).__name__,
+                        "value": max_concurrency,
+                    },
+                )
+            validated_config["mcp_max_concurrency"] = max_concurrency
+
         return validated_config
 
     @classmethod
@@ -22,7 +22,7 @@ import os
 import shutil
 import time
 import traceback
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, List, Optional
@@ -249,7 +249,11 @@ class Orchestrator(ChatAgent):
             # New task - start MassGen coordination with full context
             self.current_task = user_message
             # Reinitialize session with user prompt now that we have it
-            self.coordination_tracker.initialize_session(list(self.agents.keys()), self.current_task)
+            self.coordination_tracker.initialize_session(
+                list(self.agents.keys()),
+                self.current_task,
+                event_log_path=get_log_session_dir() / "coordination_events.ndjson",
+            )
             self.workflow_phase = "coordinating"
 
             # Clear agent workspaces for new turn (if this is a multi-turn conversation with history)
@@ -319,10 +323,12 @@ class Orchestrator(ChatAgent):
         # End the coordination session
         self.coordination_tracker._end_session()
 
-        # Save coordination logs using the coordination tracker
+        # Save coordination logs using the coordination tracker (with readable copies in debug mode)
+        from .logger_config import _DEBUG_MODE
+
         log_session_dir = get_log_session_dir()
         if log_session_dir:
-            self.coordination_tracker.save_coordination_logs(log_session_dir)
+            self.coordination_tracker.save_coordination_logs(log_session_dir, pretty=_DEBUG_MODE)
 
     async def _coordinate_agents_with_timeout(self, conversation_context: Optional[Dict[str, Any]] = None) -> AsyncGenerator[StreamChunk, None]:
         """Execute coordination with orchestrator-level timeout protection."""
@@ -689,16 +695,15 @@ class Orchestrator(ChatAgent):
 
             # Apply all state changes atomically after processing all results
             if reset_signal:
-                # Reset all agents' has_voted to False (any new answer invalidates all votes)
+                # Every agent is affected: any new answer invalidates all votes and
+                # restarts everyone, so reset both flags in a single pass
                 for state in self.agent_states.values():
                     state.has_voted = False
+                    state.restart_pending = True
                 votes.clear()
 
-                for agent_id in self.agent_states.keys():
-                    self.agent_states[agent_id].restart_pending = True
-
                 # Track restart signals
-                self.coordination_tracker.track_restart_signal(restart_triggered_id, list(self.agent_states.keys()))
+                self.coordination_tracker.track_restart_signal(restart_triggered_id, list(self.agent_states))
                 # Note that the agent that sent the restart signal had its stream end so we should mark as completed. NOTE the below breaks it.
                 self.coordination_tracker.complete_agent_restart(restart_triggered_id)
             # Set has_voted = True for agents that voted (only if no reset signal)
@@ -2009,7 +2014,7 @@ class Orchestrator(ChatAgent):
                             type=chunk_type,
                             content=getattr(chunk, "content", ""),
                             source=selected_agent_id,
-                            **{k: v for k, v in chunk.__dict__.items() if k not in ["type", "content", "source"]},
+                            **{f.name: getattr(chunk, f.name) for f in fields(chunk) if f.name not in ["type", "content", "source"]},
                         )
                     else:
                         log_stream_chunk(
@@ -2022,7 +2027,7 @@ class Orchestrator(ChatAgent):
                             type=chunk_type,
                             content=getattr(chunk, "content", ""),
                             source=selected_agent_id,
-                            **{k: v for k, v in chunk.__dict__.items() if k not in ["type", "content", "source"]},
+                            **{f.name: getattr(chunk, f.name) for f in fields(chunk) if f.name not in ["type", "content", "source"]},
                         )
 
         finally:
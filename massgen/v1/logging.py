@@ -233,42 +233,47 @@ class MassLogManager:
         try:
             answers_file = self.answers_dir / f"agent_{agent_id}.txt"
 
-            with open(answers_file, "w", encoding="utf-8") as f:
-                # Clean header with useful information
-                f.write("=" * 80 + "\n")
-                f.write(f"📝 MASSGEN AGENT {agent_id} - ANSWER HISTORY\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"🆔 Session: {self.session_id}\n")
-                f.write(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-
-                if answer_records:
-                    # Calculate some summary statistics
-                    total_chars = sum(len(record.answer) for record in answer_records)
-                    avg_chars = total_chars / len(answer_records) if answer_records else 0
-                    first_update = answer_records[0].timestamp if answer_records else 0
-                    last_update = answer_records[-1].timestamp if answer_records else 0
-                    duration = last_update - first_update if len(answer_records) > 1 else 0
-
-                    f.write(f"📊 Total Updates: {len(answer_records)}\n")
-                    f.write(f"📏 Total Characters: {total_chars:,}\n")
-                    f.write(f"📈 Average Length: {avg_chars:.0f} chars\n")
-                    if duration > 0:
-                        duration_str = f"{duration/60:.1f} minutes" if duration > 60 else f"{duration:.1f} seconds"
-                        f.write(f"⏱️ Time Span: {duration_str}\n")
-                else:
-                    f.write("❌ No answer records found for this agent.\n")
-
-                f.write("=" * 80 + "\n\n")
+            # Build the report in memory and write it in one call
+            parts = []
+
+            # Clean header with useful information
+            parts.append("=" * 80 + "\n")
+            parts.append(f"📝 MASSGEN AGENT {agent_id} - ANSWER HISTORY\n")
+            parts.append("=" * 80 + "\n")
+            parts.append(f"🆔 Session: {self.session_id}\n")
+            parts.append(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+            if answer_records:
+                # Calculate some summary statistics
+                total_chars = sum(len(record.answer) for record in answer_records)
+                avg_chars = total_chars / len(answer_records) if answer_records else 0
+                first_update = answer_records[0].timestamp if answer_records else 0
+                last_update = answer_records[-1].timestamp if answer_records else 0
+                duration = last_update - first_update if len(answer_records) > 1 else 0
+
+                parts.append(f"📊 Total Updates: {len(answer_records)}\n")
+                parts.append(f"📏 Total Characters: {total_chars:,}\n")
+                parts.append(f"📈 Average Length: {avg_chars:.0f} chars\n")
+                if duration > 0:
+                    duration_str = f"{duration/60:.1f} minutes" if duration > 60 else f"{duration:.1f} seconds"
+                    parts.append(f"⏱️ Time Span: {duration_str}\n")
+            else:
+                parts.append("❌ No answer records found for this agent.\n")
+
+            parts.append("=" * 80 + "\n\n")
+
+            if answer_records:
+                for i, record in enumerate(answer_records, 1):
+                    # Calculate time elapsed since session start
+                    elapsed = record.timestamp - (answer_records[0].timestamp if answer_records else record.timestamp)
+                    elapsed_str = f"[+{elapsed/60:.1f}m]" if elapsed > 60 else f"[+{elapsed:.1f}s]"
+
+                    parts.append(f"🔢 UPDATE #{i} {elapsed_str}\n")
+                    parts.append(self._format_answer_record(record, agent_id))
+                    parts.append("\n")
 
-                if answer_records:
-                    for i, record in enumerate(answer_records, 1):
-                        # Calculate time elapsed since session start
-                        elapsed = record.timestamp - (answer_records[0].timestamp if answer_records else record.timestamp)
-                        elapsed_str = f"[+{elapsed/60:.1f}m]" if elapsed > 60 else f"[+{elapsed:.1f}s]"
-
-                        f.write(f"🔢 UPDATE #{i} {elapsed_str}\n")
-                        f.write(self._format_answer_record(record, agent_id))
-                        f.write("\n")
+            with open(answers_file, "w", encoding="utf-8") as f:
+                f.write("".join(parts))
 
         except Exception as e:
             print(f"Warning: Failed to write answers for agent {agent_id}: {e}")
@@ -281,51 +286,56 @@ class MassLogManager:
         try:
             votes_file = self.votes_dir / f"agent_{agent_id}.txt"
 
-            with open(votes_file, "w", encoding="utf-8") as f:
-                # Clean header with useful information
-                f.write("=" * 80 + "\n")
-                f.write(f"🗳️ MASSGEN AGENT {agent_id} - VOTE HISTORY\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"🆔 Session: {self.session_id}\n")
-                f.write(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-
-                if vote_records:
-                    # Calculate voting statistics
-                    vote_targets = {}
-                    total_reason_chars = 0
-                    for vote in vote_records:
-                        vote_targets[vote.target_id] = vote_targets.get(vote.target_id, 0) + 1
-                        total_reason_chars += len(vote.reason) if vote.reason else 0
-
-                    most_voted_target = max(vote_targets.items(), key=lambda x: x[1]) if vote_targets else None
-                    avg_reason_length = total_reason_chars / len(vote_records) if vote_records else 0
-
-                    first_vote = vote_records[0].timestamp if vote_records else 0
-                    last_vote = vote_records[-1].timestamp if vote_records else 0
-                    voting_duration = last_vote - first_vote if len(vote_records) > 1 else 0
-
-                    f.write(f"📊 Total Votes Cast: {len(vote_records)}\n")
-                    f.write(f"🎯 Unique Targets: {len(vote_targets)}\n")
-                    if most_voted_target:
-                        f.write(f"👑 Most Voted For: Agent {most_voted_target[0]} ({most_voted_target[1]} votes)\n")
-                    f.write(f"📝 Avg Reason Length: {avg_reason_length:.0f} chars\n")
-                    if voting_duration > 0:
-                        duration_str = f"{voting_duration/60:.1f} minutes" if voting_duration > 60 else f"{voting_duration:.1f} seconds"
-                        f.write(f"⏱️ Voting Duration: {duration_str}\n")
-                else:
-                    f.write("❌ No vote records found for this agent.\n")
-
-                f.write("=" * 80 + "\n\n")
+            # Build the report in memory and write it in one call
+            parts = []
+
+            # Clean header with useful information
+            parts.append("=" * 80 + "\n")
+            parts.append(f"🗳️ MASSGEN AGENT {agent_id} - VOTE HISTORY\n")
+            parts.append("=" * 80 + "\n")
+            parts.append(f"🆔 Session: {self.session_id}\n")
+            parts.append(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+            if vote_records:
+                # Calculate voting statistics
+                vote_targets = {}
+                total_reason_chars = 0
+                for vote in vote_records:
+                    vote_targets[vote.target_id] = vote_targets.get(vote.target_id, 0) + 1
+                    total_reason_chars += len(vote.reason) if vote.reason else 0
+
+                most_voted_target = max(vote_targets.items(), key=lambda x: x[1]) if vote_targets else None
+                avg_reason_length = total_reason_chars / len(vote_records) if vote_records else 0
+
+                first_vote = vote_records[0].timestamp if vote_records else 0
+                last_vote = vote_records[-1].timestamp if vote_records else 0
+                voting_duration = last_vote - first_vote if len(vote_records) > 1 else 0
+
+                parts.append(f"📊 Total Votes Cast: {len(vote_records)}\n")
+                parts.append(f"🎯 Unique Targets: {len(vote_targets)}\n")
+                if most_voted_target:
+                    parts.append(f"👑 Most Voted For: Agent {most_voted_target[0]} ({most_voted_target[1]} votes)\n")
+                parts.append(f"📝 Avg Reason Length: {avg_reason_length:.0f} chars\n")
+                if voting_duration > 0:
+                    duration_str = f"{voting_duration/60:.1f} minutes" if voting_duration > 60 else f"{voting_duration:.1f} seconds"
+                    parts.append(f"⏱️ Voting Duration: {duration_str}\n")
+            else:
+                parts.append("❌ No vote records found for this agent.\n")
+
+            parts.append("=" * 80 + "\n\n")
+
+            if vote_records:
+                for i, record in enumerate(vote_records, 1):
+                    # Calculate time elapsed since first vote
+                    elapsed = record.timestamp - (vote_records[0].timestamp if vote_records else record.timestamp)
+                    elapsed_str = f"[+{elapsed/60:.1f}m]" if elapsed > 60 else f"[+{elapsed:.1f}s]"
+
+                    parts.append(f"🗳️ VOTE #{i} {elapsed_str}\n")
+                    parts.append(self._format_vote_record(record, agent_id))
+                    parts.append("\n")
 
-                if vote_records:
-                    for i, record in enumerate(vote_records, 1):
-                        # Calculate time elapsed since first vote
-                        elapsed = record.timestamp - (vote_records[0].timestamp if vote_records else record.timestamp)
-                        elapsed_str = f"[+{elapsed/60:.1f}m]" if elapsed > 60 else f"[+{elapsed:.1f}s]"
-
-                        f.write(f"🗳️ VOTE #{i} {elapsed_str}\n")
-                        f.write(self._format_vote_record(record, agent_id))
-                        f.write("\n")
+            with open(votes_file, "w", encoding="utf-8") as f:
+                f.write("".join(parts))
 
         except Exception as e:
             print(f"Warning: Failed to write votes for agent {agent_id}: {e}")